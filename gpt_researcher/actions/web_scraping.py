@@ -3,6 +3,9 @@ from colorama import Fore, Style
 
 from gpt_researcher.utils.workers import WorkerPool
 from ..scraper import Scraper
+from ..scraper.browser.browser import default_browser_pool
+from ..scraper.cache import ScrapeCache
+from ..scraper.fetcher import AsyncFetcher
 from ..config.config import Config
 from ..utils.logger import get_formatted_logger
 
@@ -10,13 +13,14 @@ logger = get_formatted_logger()
 
 
 async def scrape_urls(
-    urls, cfg: Config, worker_pool: WorkerPool
+    urls, cfg: Config, worker_pool: WorkerPool, cache: ScrapeCache | None = None
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Scrapes the urls
     Args:
         urls: List of urls
         cfg: Config (optional)
+        cache: Persistent scrape cache shared across runs (optional)
 
     Returns:
         tuple[list[dict[str, Any]], list[dict[str, Any]]]: tuple containing scraped content and images
@@ -30,9 +34,35 @@ async def scrape_urls(
         else "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
     )
 
+    browser_pool = None
+    if cfg.scraper == "browser":
+        # Warm browsers are shared process-wide and outlive this run
+        browser_pool = default_browser_pool(
+            user_agent=user_agent,
+            size=cfg.scraper_browser_pool_size,
+            max_pages_per_browser=cfg.scraper_browser_max_pages,
+            max_queue=cfg.scraper_browser_queue_size,
+        )
+
     try:
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool)
-        scraped_data = await scraper.run()
+        async with AsyncFetcher.from_config(cfg, user_agent) as fetcher:
+            scraper = Scraper(
+                urls,
+                user_agent,
+                cfg.scraper,
+                worker_pool=worker_pool,
+                fetcher=fetcher,
+                cache=cache,
+                pdf_max_pages=cfg.scraper_pdf_max_pages,
+                pdf_max_bytes=cfg.scraper_pdf_max_bytes,
+                pdf_deadline=cfg.scraper_pdf_deadline,
+                html_engine=cfg.scraper_html_engine,
+                browser_pool=browser_pool,
+                process_parse_min_bytes=cfg.scraper_process_parse_min_bytes,
+                url_deadline=cfg.scraper_url_deadline,
+                deadline=cfg.scraper_deadline,
+            )
+            scraped_data = await scraper.run()
         for item in scraped_data:
             if 'image_urls' in item:
                 images.extend(item['image_urls'])
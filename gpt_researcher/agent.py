@@ -1,4 +1,5 @@
 from typing import Any, Optional
+import copy
 import json
 import os
 
@@ -59,6 +60,9 @@ class GPTResearcher:
         mcp_configs: list[dict] | None = None,
         mcp_max_iterations: int | None = None,
         mcp_strategy: str | None = None,
+        config: Config | None = None,
+        memory: Memory | None = None,
+        max_sources: int | None = None,
         **kwargs
     ):
         """
@@ -113,11 +117,22 @@ class GPTResearcher:
                 - "fast" (default): Run MCP once with original query for best performance
                 - "deep": Run MCP for all sub-queries for maximum thoroughness  
                 - "disabled": Skip MCP entirely, use only web retrievers
+            config (Config, optional): Pre-parsed configuration to reuse instead of
+                loading one from config_path. A shallow copy is taken, so per-instance
+                changes do not leak back into the shared object.
+            memory (Memory, optional): Pre-built embeddings wrapper to reuse instead
+                of constructing a new embeddings client.
+            max_sources (int, optional): Maximum number of URLs scraped and embedded
+                across the whole research run. None means no limit.
         """
         self.kwargs = kwargs
         self.query = query
         self.report_type = report_type
-        self.cfg = Config(config_path)
+        if config is not None:
+            self.cfg = copy.copy(config)
+            self.cfg.llm_kwargs = dict(config.llm_kwargs)
+        else:
+            self.cfg = Config(config_path)
         self.cfg.set_verbose(verbose)
         self.report_source = report_source if report_source else getattr(self.cfg, 'report_source', None)
         self.report_format = report_format
@@ -138,6 +153,7 @@ class GPTResearcher:
         self.parent_query = parent_query
         self.subtopics = subtopics or []
         self.visited_urls = visited_urls or set()
+        self.max_sources = max_sources
         self.verbose = verbose
         self.context = context or []
         self.headers = headers or {}
@@ -151,9 +167,7 @@ class GPTResearcher:
             self._process_mcp_configs(mcp_configs)
         
         self.retrievers = get_retrievers(self.headers, self.cfg)
-        self.memory = Memory(
-            self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
-        )
+        self.memory = memory or Memory.from_config(self.cfg)
         
         # Set default encoding to utf-8
         self.encoding = kwargs.get('encoding', 'utf-8')
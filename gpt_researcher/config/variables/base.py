@@ -26,6 +26,37 @@ class BaseConfig(TypedDict):
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
     MAX_SCRAPER_WORKERS: int
+    SCRAPER_MAX_CONNECTIONS: int
+    SCRAPER_MAX_CONNECTIONS_PER_HOST: int
+    SCRAPER_MAX_CONTENT_BYTES: int
+    SCRAPER_TIMEOUT: float
+    SCRAPER_HTTP2: bool
+    SCRAPER_PDF_MAX_PAGES: int
+    SCRAPER_PDF_MAX_BYTES: int
+    SCRAPER_PDF_DEADLINE: float
+    SCRAPER_HTML_ENGINE: str
+    SCRAPER_BROWSER_POOL_SIZE: int
+    SCRAPER_BROWSER_MAX_PAGES: int
+    SCRAPER_BROWSER_QUEUE_SIZE: int
+    SCRAPER_PROCESS_PARSE_MIN_BYTES: Union[int, None]
+    SCRAPER_FIRST_BYTE_TIMEOUT: float
+    SCRAPER_URL_DEADLINE: float
+    SCRAPER_DEADLINE: Union[float, None]
+    SCRAPER_DEDUP_THRESHOLD: Union[float, None]
+    SCRAPER_HOST_RATE: float
+    SCRAPER_HOST_BURST: int
+    SCRAPER_HOST_MAX_CONCURRENCY: int
+    SCRAPER_CACHE_ENABLED: bool
+    SCRAPER_CACHE_PATH: str
+    SCRAPER_CACHE_TTL: float
+    SCRAPER_CACHE_MAX_MB: int
+    EMBEDDING_CACHE_ENABLED: bool
+    EMBEDDING_CACHE_PATH: str
+    EMBEDDING_BATCH_TOKENS: int
+    EMBEDDING_BATCH_SIZE: int
+    EMBEDDING_CONCURRENCY: int
+    EMBEDDING_TPM: Union[int, None]
+    EMBEDDING_RPM: Union[int, None]
     MAX_SUBTOPICS: int
     REPORT_SOURCE: Union[str, None]
     DOC_PATH: str
@@ -23,6 +23,37 @@ DEFAULT_CONFIG: BaseConfig = {
     "AGENT_ROLE": None,
     "SCRAPER": "bs",
     "MAX_SCRAPER_WORKERS": 15,
+    "SCRAPER_MAX_CONNECTIONS": 100,
+    "SCRAPER_MAX_CONNECTIONS_PER_HOST": 6,
+    "SCRAPER_MAX_CONTENT_BYTES": 10485760,  # 10 MiB
+    "SCRAPER_TIMEOUT": 4.0,
+    "SCRAPER_HTTP2": True,
+    "SCRAPER_PDF_MAX_PAGES": 200,
+    "SCRAPER_PDF_MAX_BYTES": 104857600,  # 100 MiB; PDFs are downloaded whole before parsing
+    "SCRAPER_PDF_DEADLINE": 60.0,  # Seconds per PDF download
+    "SCRAPER_HTML_ENGINE": "bs",  # "bs" (full-page text) or "lxml" (main-content extraction)
+    "SCRAPER_BROWSER_POOL_SIZE": 2,  # Warm Selenium browsers for SCRAPER=browser
+    "SCRAPER_BROWSER_MAX_PAGES": 50,  # Pages served before a browser is restarted
+    "SCRAPER_BROWSER_QUEUE_SIZE": 16,  # Scrapes allowed to wait for a browser
+    "SCRAPER_PROCESS_PARSE_MIN_BYTES": 131072,  # Parse larger HTML pages on the process pool; None disables
+    "SCRAPER_FIRST_BYTE_TIMEOUT": 10.0,  # Seconds to wait for response headers
+    "SCRAPER_URL_DEADLINE": 20.0,  # Seconds per URL; slower downloads are truncated
+    "SCRAPER_DEADLINE": 90.0,  # Seconds for a whole scrape phase; None waits for every URL
+    "SCRAPER_DEDUP_THRESHOLD": 0.8,  # Shingle similarity at which pages are merged; None disables
+    "SCRAPER_HOST_RATE": 4.0,  # Requests per second per host
+    "SCRAPER_HOST_BURST": 4,
+    "SCRAPER_HOST_MAX_CONCURRENCY": 6,
+    "SCRAPER_CACHE_ENABLED": True,
+    "SCRAPER_CACHE_PATH": "~/.cache/gpt-researcher/scrape_cache.sqlite3",
+    "SCRAPER_CACHE_TTL": 86400,  # Seconds before a cached page is revalidated
+    "SCRAPER_CACHE_MAX_MB": 512,
+    "EMBEDDING_CACHE_ENABLED": True,
+    "EMBEDDING_CACHE_PATH": "~/.cache/gpt-researcher/embeddings.sqlite3",
+    "EMBEDDING_BATCH_TOKENS": 8000,  # Tokens packed into one embedding request
+    "EMBEDDING_BATCH_SIZE": 256,  # Texts per embedding request
+    "EMBEDDING_CONCURRENCY": 4,  # Embedding requests in flight per provider
+    "EMBEDDING_TPM": None,  # Provider tokens-per-minute budget; None is unlimited
+    "EMBEDDING_RPM": None,  # Provider requests-per-minute budget; None is unlimited
     "MAX_SUBTOPICS": 3,
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
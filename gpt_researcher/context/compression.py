@@ -2,14 +2,7 @@ import os
 import asyncio
 from typing import Optional
 from .retriever import SearchAPIRetriever, SectionRetriever
-from langchain.retrievers import (
-    ContextualCompressionRetriever,
-)
-from langchain.retrievers.document_compressors import (
-    DocumentCompressorPipeline,
-    EmbeddingsFilter,
-)
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from .similarity import SimilarityFilter
 from ..vector_store import VectorStoreWrapper
 from ..utils.costs import estimate_embedding_cost
 from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
@@ -54,26 +47,13 @@ class ContextCompressor:
         self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.35)
         self.prompt_family = prompt_family
 
-    def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SearchAPIRetriever(
-            pages=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
-
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
         if cost_callback:
             cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
+        documents = SearchAPIRetriever(pages=self.documents).invoke(query)
+        relevant_docs = await SimilarityFilter(
+            self.embeddings, float(self.similarity_threshold)
+        ).afilter(documents, query, k=max_results)
         return self.prompt_family.pretty_print_docs(relevant_docs, max_results)
 
 
@@ -84,27 +64,14 @@ class WrittenContentCompressor:
         self.embeddings = embeddings
         self.similarity_threshold = similarity_threshold
 
-    def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SectionRetriever(
-            sections=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
-
     def __pretty_docs_list(self, docs, top_n):
         return [f"Title: {d.metadata.get('section_title')}\nContent: {d.page_content}\n" for i, d in enumerate(docs) if i < top_n]
 
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
         if cost_callback:
             cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
+        sections = SectionRetriever(sections=self.documents).invoke(query)
+        relevant_docs = await SimilarityFilter(
+            self.embeddings, float(self.similarity_threshold)
+        ).afilter(sections, query, k=max_results)
         return self.__pretty_docs_list(relevant_docs, max_results)
@@ -0,0 +1,126 @@
+import asyncio
+
+import numpy as np
+from langchain_core.documents import Document
+
+from ..utils.text_splitter import TextSplitter
+from .similarity import normalize, top_k
+
+
+class ChunkIndex:
+    """
+    Run-scoped index of page chunks and their embeddings.
+
+    Every page is split and embedded once per research run, however many
+    sub-queries it is scraped for; each query is then answered by a cosine
+    top-k over one normalized NumPy matrix, restricted to the query's own
+    pages. Concurrent callers adding the same chunk share one embedding
+    request.
+    """
+
+    def __init__(self, embeddings, chunk_size: int = 1000, chunk_overlap: int = 100):
+        self.embeddings = embeddings
+        self.splitter = TextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        self.documents: list[Document] = []
+        self._rows: dict[tuple[str, str], int] = {}
+        self._pending: dict[tuple[str, str], asyncio.Future] = {}
+        self._blocks: list[np.ndarray] = []
+        self._matrix: np.ndarray | None = None
+        self._source_ids: dict[str, int] = {}
+        self._row_sources: list[int] = []
+        self.embedded_chunks = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def _split(self, pages: list[dict]) -> list[Document]:
+        chunks = []
+        for page in pages:
+            metadata = {"title": page.get("title", ""), "source": page.get("url", "")}
+            for text in self.splitter.split_text(page.get("raw_content") or ""):
+                chunks.append(Document(page_content=text, metadata=dict(metadata)))
+        return chunks
+
+    async def add_pages(self, pages: list[dict]) -> list[Document]:
+        """
+        Split and embed the pages' chunks that are not indexed yet.
+
+        Returns the chunks this call embedded (for cost accounting).
+        """
+        return await self._add_chunks(await asyncio.to_thread(self._split, pages))
+
+    async def _add_chunks(self, chunks: list[Document]) -> list[Document]:
+        new, waiting, seen = [], {}, set()
+        for chunk in chunks:
+            key = (chunk.metadata["source"], chunk.page_content)
+            if key in self._rows or key in seen:
+                continue
+            seen.add(key)
+            if key in self._pending:
+                waiting[key] = (chunk, self._pending[key])
+            else:
+                new.append(chunk)
+
+        if new:
+            loop = asyncio.get_running_loop()
+            futures = {}
+            for chunk in new:
+                key = (chunk.metadata["source"], chunk.page_content)
+                futures[key] = self._pending[key] = loop.create_future()
+            try:
+                vectors = await self.embeddings.aembed_documents([chunk.page_content for chunk in new])
+                self._append(new, normalize(vectors))
+                for future in futures.values():
+                    future.set_result(None)
+            finally:
+                # On failure the futures are cancelled rather than given our
+                # exception, so waiters retry instead of failing with it
+                for key, future in futures.items():
+                    if not future.done():
+                        future.cancel()
+                    self._pending.pop(key, None)
+            self.embedded_chunks += len(new)
+
+        if waiting:
+            await asyncio.wait([future for _, future in waiting.values()])
+            # The call embedding these chunks failed or was cancelled: embed them ourselves
+            retry = [chunk for chunk, future in waiting.values() if future.cancelled()]
+            if retry:
+                new += await self._add_chunks(retry)
+        return new
+
+    def _append(self, chunks: list[Document], vectors: np.ndarray) -> None:
+        for chunk in chunks:
+            source = chunk.metadata["source"]
+            self._rows[(source, chunk.page_content)] = len(self.documents)
+            self._row_sources.append(self._source_ids.setdefault(source, len(self._source_ids)))
+            self.documents.append(chunk)
+        self._blocks.append(vectors)
+        self._matrix = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """All chunk embeddings as one (chunks x dimensions) unit-norm matrix."""
+        if self._matrix is None:
+            self._matrix = np.concatenate(self._blocks) if self._blocks else np.empty((0, 0), np.float32)
+            self._blocks = [self._matrix] if len(self._matrix) else []
+        return self._matrix
+
+    async def search(
+        self,
+        query: str,
+        k: int = 10,
+        threshold: float = 0.0,
+        sources: set[str] | None = None,
+    ) -> list[Document]:
+        """
+        The `k` chunks most similar to `query` with cosine similarity above
+        `threshold`, best first, optionally restricted to `sources` (URLs).
+        """
+        if not self.documents:
+            return []
+        scores = self.matrix @ normalize(await self.embeddings.aembed_query(query))
+        if sources is not None:
+            allowed = [self._source_ids[s] for s in sources if s in self._source_ids]
+            scores = np.where(np.isin(self._row_sources, allowed), scores, -np.inf)
+        return [self.documents[i] for i in top_k(scores, k, threshold)]
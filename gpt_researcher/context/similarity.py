@@ -0,0 +1,56 @@
+import asyncio
+
+import numpy as np
+from langchain_core.documents import Document
+
+from ..utils.text_splitter import TextSplitter
+
+
+def normalize(vectors) -> np.ndarray:
+    """float32 copy of `vectors` with unit-norm rows (zero rows stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def top_k(scores: np.ndarray, k: int | None = None, threshold: float | None = None) -> np.ndarray:
+    """
+    Indices of the `k` highest scores above `threshold`, best first.
+
+    Uses argpartition so only the selected scores are sorted.
+    """
+    candidates = np.flatnonzero(scores > threshold) if threshold is not None else np.arange(len(scores))
+    if k is not None and len(candidates) > k:
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class SimilarityFilter:
+    """
+    Split documents and keep the chunks most similar to a query.
+
+    Replaces LangChain's splitter + EmbeddingsFilter pipeline: all chunks
+    are embedded in one batch and scored with a single matrix-vector
+    product over unit-norm float32 vectors.
+    """
+
+    def __init__(self, embeddings, similarity_threshold: float, chunk_size: int = 1000, chunk_overlap: int = 100):
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.splitter = TextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+    async def afilter(self, documents: list[Document], query: str, k: int | None = None) -> list[Document]:
+        """Split `documents` and return the `k` chunks most similar to `query`, best first."""
+        chunks = await asyncio.to_thread(self.splitter.split_documents, documents)
+        return await self.arank(chunks, query, k)
+
+    async def arank(self, chunks: list[Document], query: str, k: int | None = None) -> list[Document]:
+        """The `k` chunks most similar to `query` above the threshold, best first."""
+        if not chunks:
+            return []
+        vectors, query_vector = await asyncio.gather(
+            self.embeddings.aembed_documents([chunk.page_content for chunk in chunks]),
+            self.embeddings.aembed_query(query),
+        )
+        scores = normalize(vectors) @ normalize(query_vector)
+        return [chunks[i] for i in top_k(scores, k, self.similarity_threshold)]
@@ -0,0 +1,227 @@
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    namespace TEXT NOT NULL,
+    hash BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (namespace, hash)
+) WITHOUT ROWID;
+"""
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_BATCH = 500
+
+
+# Client settings that change the vectors a model returns (size, endpoint, options)
+_OUTPUT_SETTINGS = (
+    "dimensions", "output_dimensionality", "openai_api_base", "base_url", "endpoint_url",
+    "azure_endpoint", "azure_deployment", "model_kwargs", "encode_kwargs", "task_type",
+)
+
+
+def content_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def embedding_namespace(provider: str, model: str, embeddings: Embeddings) -> str:
+    """
+    Cache namespace for a configured embeddings client.
+
+    Clients of the same model that differ in output-affecting settings
+    (e.g. `dimensions` or the endpoint/deployment) get separate namespaces.
+    """
+    settings = {name: getattr(embeddings, name, None) for name in _OUTPUT_SETTINGS}
+    if settings["azure_endpoint"]:
+        # Azure routes by deployment; OpenAI clients ignore the field's default
+        settings["deployment"] = getattr(embeddings, "deployment", None)
+    settings = {name: value for name, value in settings.items() if value not in (None, "", {}, [])}
+    if not settings:
+        return f"{provider}:{model}"
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return f"{provider}:{model}:{digest}"
+
+
+class EmbeddingCache:
+    """
+    Persistent store of embedding vectors, shared across research runs.
+
+    Vectors are stored as float32 under (namespace, sha256(text)), where the
+    namespace names the provider, model and whether the text was embedded
+    as a document or a query. Lookups are batched; inserts are buffered in
+    memory (and served from there) and written to SQLite in the background
+    once `flush_size` vectors are pending, or on `flush`/`close`.
+    """
+
+    def __init__(self, path: str | Path, flush_size: int = 256):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_size = flush_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending: dict[tuple[str, bytes], bytes] = {}
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding-cache")
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, cfg) -> "EmbeddingCache | None":
+        """The shared cache configured on the researcher Config, if enabled."""
+        if not cfg.embedding_cache_enabled:
+            return None
+        return get_embedding_cache(cfg.embedding_cache_path)
+
+    def get_many(self, namespace: str, hashes: set[bytes]) -> dict[bytes, bytes]:
+        """Return the stored vector bytes for every hash that is cached."""
+        found = {}
+        with self._lock:
+            for digest in hashes:
+                vector = self._pending.get((namespace, digest))
+                if vector is not None:
+                    found[digest] = vector
+            remaining = [digest for digest in hashes if digest not in found]
+            for start in range(0, len(remaining), _LOOKUP_BATCH):
+                batch = remaining[start:start + _LOOKUP_BATCH]
+                rows = self._conn.execute(
+                    f"SELECT hash, vector FROM embeddings WHERE namespace = ? "
+                    f"AND hash IN ({','.join('?' * len(batch))})",
+                    (namespace, *batch),
+                ).fetchall()
+                found.update(rows)
+            self.hits += len(found)
+            self.misses += len(hashes) - len(found)
+        return found
+
+    def put_many(self, namespace: str, vectors: dict[bytes, bytes]) -> None:
+        """Buffer vectors for insertion; a background flush starts when enough are pending."""
+        with self._lock:
+            for digest, vector in vectors.items():
+                self._pending[(namespace, digest)] = vector
+            full = len(self._pending) >= self.flush_size
+        if full:
+            self._writer.submit(self.flush)
+
+    def flush(self) -> None:
+        """Write all buffered vectors to disk."""
+        with self._lock:
+            if not self._pending:
+                return
+            rows = [(namespace, digest, vector) for (namespace, digest), vector in self._pending.items()]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (namespace, hash, vector) VALUES (?, ?, ?)", rows
+            )
+            self._conn.commit()
+            self._pending.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            pending = len(self._pending)
+        return {"vectors": count + pending, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        self._writer.shutdown(wait=True)
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+_caches: dict[Path, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(path: str | Path) -> EmbeddingCache:
+    """Return the process-wide cache for `path`, opening it on first use."""
+    key = Path(path).expanduser().resolve()
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = EmbeddingCache(key)
+        return _caches[key]
+
+
+@atexit.register
+def close_embedding_caches() -> None:
+    with _caches_lock:
+        caches = list(_caches.values())
+        _caches.clear()
+    for cache in caches:
+        try:
+            cache.close()
+        except Exception as e:
+            logger.warning(f"Failed to flush embedding cache {cache.path}: {e}")
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that only sends texts missing from the cache to the
+    provider. Repeated texts within one call are embedded once.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, namespace: str):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.namespace = namespace
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped client's attributes (model, dimensions, ...)
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _lookup(self, texts: list[str], kind: str) -> tuple[list[bytes], dict[bytes, list[float]], list[str]]:
+        hashes = [content_hash(text) for text in texts]
+        found = {
+            digest: np.frombuffer(vector, dtype=np.float32).tolist()
+            for digest, vector in self.cache.get_many(f"{self.namespace}:{kind}", set(hashes)).items()
+        }
+        missing = list({digest: text for digest, text in zip(hashes, texts) if digest not in found}.values())
+        return hashes, found, missing
+
+    def _store(self, kind: str, texts: list[str], vectors: list[list[float]], found: dict) -> None:
+        new = {content_hash(text): vector for text, vector in zip(texts, vectors)}
+        self.cache.put_many(
+            f"{self.namespace}:{kind}",
+            {digest: np.asarray(vector, dtype=np.float32).tobytes() for digest, vector in new.items()},
+        )
+        found.update(new)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        hashes, found, missing = self._lookup(texts, "document")
+        if missing:
+            self._store("document", missing, self.embeddings.embed_documents(missing), found)
+        return [found[digest] for digest in hashes]
+
+    def embed_query(self, text: str) -> list[float]:
+        hashes, found, missing = self._lookup([text], "query")
+        if missing:
+            self._store("query", missing, [self.embeddings.embed_query(text)], found)
+        return found[hashes[0]]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        hashes, found, missing = await asyncio.to_thread(self._lookup, texts, "document")
+        if missing:
+            self._store("document", missing, await self.embeddings.aembed_documents(missing), found)
+        return [found[digest] for digest in hashes]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        hashes, found, missing = await asyncio.to_thread(self._lookup, [text], "query")
+        if missing:
+            self._store("query", missing, [await self.embeddings.aembed_query(text)], found)
+        return found[hashes[0]]
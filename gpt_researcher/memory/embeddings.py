@@ -1,6 +1,12 @@
+import logging
 import os
 from typing import Any
 
+from .cache import CachedEmbeddings, EmbeddingCache, embedding_namespace
+from .scheduler import EmbeddingScheduler, ScheduledEmbeddings
+
+logger = logging.getLogger(__name__)
+
 OPENAI_EMBEDDING_MODEL = os.environ.get(
     "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
 )
@@ -28,7 +34,16 @@ _SUPPORTED_PROVIDERS = {
 
 
 class Memory:
-    def __init__(self, embedding_provider: str, model: str, **embedding_kwargs: Any):
+    def __init__(
+        self,
+        embedding_provider: str,
+        model: str,
+        cache: EmbeddingCache | None = None,
+        scheduler: EmbeddingScheduler | None = None,
+        **embedding_kwargs: Any,
+    ):
+        self.embedding_provider = embedding_provider
+        self.model = model
         _embeddings = None
         match embedding_provider:
             case "custom":
@@ -139,7 +154,30 @@ class Memory:
             case _:
                 raise Exception("Embedding not found.")
 
+        namespace = embedding_namespace(embedding_provider, model, _embeddings)
+        if scheduler is not None:
+            # Batching and rate limits are shared by every client of the provider
+            _embeddings = ScheduledEmbeddings(_embeddings, scheduler, namespace)
+        if cache is not None:
+            # Vectors are reused across sub-queries, subtopics and runs
+            _embeddings = CachedEmbeddings(_embeddings, cache, namespace)
         self._embeddings = _embeddings
 
+    @classmethod
+    def from_config(cls, cfg) -> "Memory":
+        """Build the embeddings client configured on the researcher Config."""
+        try:
+            cache = EmbeddingCache.from_config(cfg)
+        except Exception as e:
+            logger.warning(f"Embedding cache disabled: {e}")
+            cache = None
+        return cls(
+            cfg.embedding_provider,
+            cfg.embedding_model,
+            cache=cache,
+            scheduler=EmbeddingScheduler.from_config(cfg),
+            **cfg.embedding_kwargs,
+        )
+
     def get_embeddings(self):
         return self._embeddings
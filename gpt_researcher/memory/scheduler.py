@@ -0,0 +1,264 @@
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable
+
+import tiktoken
+from langchain_core.embeddings import Embeddings
+
+from ..utils.costs import ENCODING_MODEL
+
+logger = logging.getLogger(__name__)
+
+_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """Token count of `text`, estimated from its length if the encoding is unavailable."""
+    global _encoding
+    if _encoding is None:
+        try:
+            _encoding = tiktoken.get_encoding(ENCODING_MODEL)
+        except Exception as e:  # the encoding is downloaded on first use
+            logger.debug(f"Estimating tokens from characters: {e}")
+            _encoding = False
+    if not _encoding:
+        return max(1, len(text) // 4)
+    return max(1, len(_encoding.encode(text, disallowed_special=())))
+
+
+class RateBudget:
+    """
+    A per-minute budget (requests or tokens) as a token bucket holding one
+    minute of capacity. Reservations may overdraw it; the caller then waits
+    until the debt is paid back, so requests start in reservation order.
+    """
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` from the budget; return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.tokens -= amount
+            return max(0.0, -self.tokens / self.rate)
+
+
+class _LoopState:
+    """Event-loop-bound part of a scheduler: request slots and in-flight texts."""
+
+    def __init__(self, max_concurrency: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight: dict[tuple[str, str], asyncio.Future] = {}
+
+
+class EmbeddingScheduler:
+    """
+    Shared request scheduler for one embedding provider.
+
+    Texts are packed into batches of at most `max_batch_tokens` tokens and
+    `max_batch_size` texts; at most `max_concurrency` batches are in flight
+    per event loop, and every request is charged against the optional
+    tokens- and requests-per-minute budgets, which are shared by all loops
+    and threads. Identical texts requested while one is already being
+    embedded wait for that request instead of sending their own.
+    """
+
+    def __init__(
+        self,
+        max_batch_tokens: int = 8000,
+        max_batch_size: int = 256,
+        max_concurrency: int = 4,
+        tokens_per_minute: int | None = None,
+        requests_per_minute: int | None = None,
+    ):
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.token_budget = RateBudget(tokens_per_minute) if tokens_per_minute else None
+        self.request_budget = RateBudget(requests_per_minute) if requests_per_minute else None
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+        self._sync_slots = threading.BoundedSemaphore(max_concurrency)
+        self.requests = 0
+        self.coalesced = 0
+
+    @classmethod
+    def from_config(cls, cfg) -> "EmbeddingScheduler":
+        """The shared scheduler for the researcher Config's embedding provider."""
+        return get_embedding_scheduler(
+            cfg.embedding_provider,
+            max_batch_tokens=cfg.embedding_batch_tokens,
+            max_batch_size=cfg.embedding_batch_size,
+            max_concurrency=cfg.embedding_concurrency,
+            tokens_per_minute=cfg.embedding_tpm,
+            requests_per_minute=cfg.embedding_rpm,
+        )
+
+    def batches(self, texts: list[str]) -> list[tuple[list[str], int]]:
+        """Pack `texts`, in order, into (batch, token count) pairs; an oversized text is sent alone."""
+        batches, batch, tokens = [], [], 0
+        for text in texts:
+            size = count_tokens(text)
+            if batch and (tokens + size > self.max_batch_tokens or len(batch) >= self.max_batch_size):
+                batches.append((batch, tokens))
+                batch, tokens = [], 0
+            batch.append(text)
+            tokens += size
+        if batch:
+            batches.append((batch, tokens))
+        return batches
+
+    def _reserve(self, tokens: int) -> float:
+        self.requests += 1
+        delay = self.request_budget.reserve(1) if self.request_budget else 0.0
+        if self.token_budget:
+            delay = max(delay, self.token_budget.reserve(tokens))
+        return delay
+
+    def _loop_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = _LoopState(self.max_concurrency)
+        return state
+
+    async def _run_batch(self, state: _LoopState, batch: list[str], tokens: int, embed_batch, futures: dict) -> None:
+        try:
+            async with state.semaphore:
+                delay = self._reserve(tokens)
+                if delay:
+                    logger.debug(f"Embedding budget exhausted, waiting {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                vectors = await embed_batch(batch)
+        except BaseException as e:
+            for text in batch:
+                future = futures[text]
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # waiters re-raise; don't warn if there are none
+            raise
+        for text, vector in zip(batch, vectors):
+            if not futures[text].done():
+                futures[text].set_result(vector)
+
+    async def embed(
+        self,
+        key: str,
+        texts: list[str],
+        embed_batch: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        """
+        Embed `texts` with `embed_batch`, one call per packed batch.
+
+        `key` names the model and input kind; texts are only coalesced with
+        in-flight requests under the same key.
+        """
+        state = self._loop_state()
+        loop = asyncio.get_running_loop()
+        owned, waiting = {}, {}
+        for text in dict.fromkeys(texts):
+            future = state.in_flight.get((key, text))
+            if future is None:
+                owned[text] = state.in_flight[(key, text)] = loop.create_future()
+            else:
+                waiting[text] = future
+                self.coalesced += 1
+
+        tasks = [
+            loop.create_task(self._run_batch(state, batch, tokens, embed_batch, owned))
+            for batch, tokens in self.batches(list(owned))
+        ]
+        try:
+            if tasks:
+                await asyncio.gather(*tasks)
+            if waiting:
+                await asyncio.wait(waiting.values())
+        finally:
+            for task in tasks:
+                task.cancel()
+            for text, future in owned.items():
+                if not future.done():
+                    future.cancel()
+                if state.in_flight.get((key, text)) is future:
+                    del state.in_flight[(key, text)]
+
+        vectors = {text: future.result() for text, future in owned.items()}
+        # The caller that owned a request we joined was cancelled: send our own
+        retry = [text for text, future in waiting.items() if future.cancelled()]
+        if retry:
+            vectors.update(zip(retry, await self.embed(key, retry, embed_batch)))
+        vectors.update((text, future.result()) for text, future in waiting.items() if not future.cancelled())
+        return [vectors[text] for text in texts]
+
+    def embed_sync(self, texts: list[str], embed_batch: Callable[[list[str]], list[list[float]]]) -> list[list[float]]:
+        """Blocking counterpart of `embed` for thread callers (no coalescing)."""
+        unique = list(dict.fromkeys(texts))
+        vectors = {}
+        for batch, tokens in self.batches(unique):
+            with self._sync_slots:
+                delay = self._reserve(tokens)
+                if delay:
+                    time.sleep(delay)
+                vectors.update(zip(batch, embed_batch(batch)))
+        return [vectors[text] for text in texts]
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "coalesced": self.coalesced}
+
+
+_schedulers: dict[str, EmbeddingScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_embedding_scheduler(provider: str, **kwargs) -> EmbeddingScheduler:
+    """
+    Return the process-wide scheduler for `provider`, creating it on first
+    use, so concurrent researchers share one set of limits per provider.
+    """
+    with _schedulers_lock:
+        if provider not in _schedulers:
+            _schedulers[provider] = EmbeddingScheduler(**kwargs)
+        return _schedulers[provider]
+
+
+class ScheduledEmbeddings(Embeddings):
+    """Embeddings wrapper that sends every request through an EmbeddingScheduler."""
+
+    def __init__(self, embeddings: Embeddings, scheduler: EmbeddingScheduler, namespace: str):
+        self.embeddings = embeddings
+        self.scheduler = scheduler
+        self.namespace = namespace
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped client's attributes (model, dimensions, ...)
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.scheduler.embed_sync(texts, self.embeddings.embed_documents)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.scheduler.embed_sync([text], lambda batch: [self.embeddings.embed_query(batch[0])])[0]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.scheduler.embed(f"{self.namespace}:document", texts, self.embeddings.aembed_documents)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        async def embed_query(batch):
+            return [await self.embeddings.aembed_query(batch[0])]
+
+        return (await self.scheduler.embed(f"{self.namespace}:query", [text], embed_query))[0]
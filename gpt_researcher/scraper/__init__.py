@@ -2,6 +2,8 @@ from .beautiful_soup.beautiful_soup import BeautifulSoupScraper
 from .web_base_loader.web_base_loader import WebBaseLoaderScraper
 from .arxiv.arxiv import ArxivScraper
 from .pymupdf.pymupdf import PyMuPDFScraper
+from .docx.docx import DocxScraper
+from .plain_text.plain_text import PlainTextScraper
 from .browser.browser import BrowserScraper
 from .browser.nodriver_scraper import NoDriverScraper
 from .tavily_extract.tavily_extract import TavilyExtract
@@ -13,6 +15,8 @@ __all__ = [
     "WebBaseLoaderScraper",
     "ArxivScraper",
     "PyMuPDFScraper",
+    "DocxScraper",
+    "PlainTextScraper",
     "BrowserScraper",
     "NoDriverScraper",
     "TavilyExtract",
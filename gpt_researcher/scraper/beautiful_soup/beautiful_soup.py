@@ -1,19 +1,35 @@
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import asyncio
 
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..extraction import get_html_engine
 
 class BeautifulSoupScraper:
 
-    def __init__(self, link, session=None):
+    def __init__(
+        self,
+        link,
+        session=None,
+        fetcher=None,
+        parse_executor=None,
+        validators=None,
+        html_engine="bs",
+        process_executor=None,
+        process_min_bytes=None,
+    ):
         self.link = link
         self.session = session
+        self.fetcher = fetcher
+        self.parse_executor = parse_executor
+        self.validators = validators
+        self.html_engine = html_engine
+        self.process_executor = process_executor
+        self.process_min_bytes = process_min_bytes
+        self.response = None
 
     def scrape(self):
         """
         This function scrapes content from a webpage by making a GET request, parsing the HTML using
         BeautifulSoup, and extracting script and style elements before returning the cleaned content.
-        
+
         Returns:
           The `scrape` method is returning the cleaned and extracted content from the webpage specified
         by the `self.link` attribute. The method fetches the webpage content, removes script and style
@@ -22,21 +38,54 @@ class BeautifulSoupScraper:
         """
         try:
             response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
-
-            soup = clean_soup(soup)
+            return self.parse(response.content, response.encoding)
 
-            content = get_text_from_soup(soup)
-
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
 
-            return content, image_urls, title
+    async def scrape_async(self):
+        """
+        Fetch the page with the shared async fetcher and parse it on the parse executor.
 
+        Falls back to the synchronous `scrape` in a thread when no fetcher is set.
+        When `validators` are given the request is conditional; on 304 Not
+        Modified nothing is parsed and `self.response.status_code` is 304.
+        Pages of at least `process_min_bytes` are parsed on the process pool
+        so concurrent large pages are not serialized by the GIL.
+        """
+        loop = asyncio.get_running_loop()
+        if self.fetcher is None:
+            return await loop.run_in_executor(None, self.scrape)
+        try:
+            response = await self.fetcher.fetch(self.link, headers=self.validators)
+            self.response = response
+            if response.status_code == 304:
+                return "", [], ""
+            if self.use_process_pool(response.content):
+                # Engines are module-level functions, so they pickle by reference
+                return await loop.run_in_executor(
+                    self.process_executor,
+                    get_html_engine(self.html_engine),
+                    response.content,
+                    response.encoding,
+                    self.link,
+                )
+            return await loop.run_in_executor(
+                self.parse_executor, self.parse, response.content, response.encoding
+            )
         except Exception as e:
             print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+            return "", [], ""
+
+    def use_process_pool(self, content: bytes) -> bool:
+        """Whether `content` is large enough to be worth the inter-process copy."""
+        return (
+            self.process_executor is not None
+            and self.process_min_bytes is not None
+            and len(content) >= self.process_min_bytes
+        )
+
+    def parse(self, content: bytes, encoding: str | None = None):
+        """Extract (content, image_urls, title) from raw HTML with the configured engine."""
+        return get_html_engine(self.html_engine)(content, encoding, self.link)
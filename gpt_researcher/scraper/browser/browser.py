@@ -1,168 +1,183 @@
 from __future__ import annotations
 
 import traceback
-import pickle
+from functools import partial
 from pathlib import Path
 from sys import platform
 import time
-import random
-import string
-import os
-
-from bs4 import BeautifulSoup
-from typing import Iterable, cast
 
+from .pool import BrowserPool, BrowserPoolFull, get_browser_pool
 from .processing.scrape_skills import (scrape_pdf_with_pymupdf,
                                        scrape_pdf_with_arxiv)
 
-from urllib.parse import urljoin
-
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..extraction import get_html_engine
 
 FILE_DIR = Path(__file__).parent.parent
 
+DEFAULT_USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                      "AppleWebKit/537.36 (KHTML, like Gecko) "
+                      "Chrome/128.0.0.0 Safari/537.36")
+
+
+def _import_selenium():
+    try:
+        global webdriver, By, EC, WebDriverWait, TimeoutException, WebDriverException
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.wait import WebDriverWait
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        global ChromeOptions, FirefoxOptions, SafariOptions
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        from selenium.webdriver.safari.options import Options as SafariOptions
+    except ImportError as e:
+        print(f"Failed to import Selenium: {str(e)}")
+        print("Please install Selenium and its dependencies to use BrowserScraper.")
+        print("You can install Selenium using pip:")
+        print("    pip install selenium")
+        print("If you're using a virtual environment, make sure it's activated.")
+        raise ImportError(
+            "Selenium is required but not installed. See error message above for installation instructions.") from e
+
+
+def start_driver(
+    selenium_web_browser: str = "chrome",
+    headless: bool = True,
+    user_agent: str = DEFAULT_USER_AGENT,
+    use_browser_cookies: bool = False,
+):
+    """
+    Start a WebDriver and warm it up for pooled use.
+
+    The browser visits Google once so its consent/session cookies are set
+    for every page it later serves, instead of once per scraped URL.
+    """
+    _import_selenium()
+    options_available = {
+        "chrome": ChromeOptions,
+        "firefox": FirefoxOptions,
+        "safari": SafariOptions,
+    }
+
+    options = options_available[selenium_web_browser]()
+    options.add_argument(f"user-agent={user_agent}")
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--enable-javascript")
+
+    try:
+        if selenium_web_browser == "firefox":
+            driver = webdriver.Firefox(options=options)
+        elif selenium_web_browser == "safari":
+            driver = webdriver.Safari(options=options)
+        else:  # chrome
+            if platform == "linux" or platform == "linux2":
+                options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--no-sandbox")
+            options.add_experimental_option("prefs", {"download_restrictions": 3})
+            driver = webdriver.Chrome(options=options)
+    except Exception as e:
+        print(f"Failed to set up {selenium_web_browser} driver: {str(e)}")
+        print("Full stack trace:")
+        print(traceback.format_exc())
+        raise
+
+    try:
+        driver.get("https://www.google.com")
+        time.sleep(2)  # Wait for cookies to be set
+        if use_browser_cookies:
+            _load_browser_cookies(driver, selenium_web_browser)
+        driver.get("about:blank")
+    except Exception as e:
+        print(f"Failed to visit Google and save cookies: {str(e)}")
+    return driver
+
+
+def _load_browser_cookies(driver, selenium_web_browser: str):
+    """Load cookies directly from the local browser profile"""
+    try:
+        import browser_cookie3
+    except ImportError:
+        print(
+            "browser_cookie3 is not installed. Please install it using: pip install browser_cookie3"
+        )
+        return
+
+    if selenium_web_browser == "chrome":
+        cookies = browser_cookie3.chrome()
+    elif selenium_web_browser == "firefox":
+        cookies = browser_cookie3.firefox()
+    else:
+        print(f"Cookie loading not supported for {selenium_web_browser}")
+        return
+
+    for cookie in cookies:
+        driver.add_cookie({'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain})
+
+
+def default_browser_pool(
+    selenium_web_browser: str = "chrome",
+    headless: bool = True,
+    user_agent: str = DEFAULT_USER_AGENT,
+    use_browser_cookies: bool = False,
+    **pool_options,
+) -> BrowserPool:
+    """The shared pool of warm browsers for these driver options."""
+    key = (selenium_web_browser, headless, user_agent, use_browser_cookies)
+    factory = partial(start_driver, selenium_web_browser, headless, user_agent, use_browser_cookies)
+    return get_browser_pool(key, factory, **pool_options)
+
+
 class BrowserScraper:
-    def __init__(self, url: str, session=None):
+    def __init__(
+        self,
+        url: str,
+        session=None,
+        browser_pool: BrowserPool | None = None,
+        html_engine: str = "bs",
+        deadline: float | None = None,
+    ):
         self.url = url
         self.session = session
         self.selenium_web_browser = "chrome"
-        self.headless = False
-        self.user_agent = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/128.0.0.0 Safari/537.36")
+        self.headless = True
+        self.user_agent = DEFAULT_USER_AGENT
         self.driver = None
         self.use_browser_cookies = False
-        self._import_selenium()  # Import only if used to avoid unnecessary dependencies
-        self.cookie_filename = f"{self._generate_random_string(8)}.pkl"
+        self.html_engine = html_engine
+        # Seconds for the whole scrape; page load, waits and scrolling stop
+        # early so the pooled browser is released on time
+        self.deadline = deadline
+        self._deadline_at: float | None = None
+        _import_selenium()  # Import only if used to avoid unnecessary dependencies
+        self.browser_pool = browser_pool or default_browser_pool(
+            self.selenium_web_browser, self.headless, self.user_agent, self.use_browser_cookies
+        )
 
     def scrape(self) -> tuple:
         if not self.url:
             print("URL not specified")
             return "A URL was not specified, cancelling request to browse website.", [], ""
 
+        self._deadline_at = time.monotonic() + self.deadline if self.deadline else None
         try:
-            self.setup_driver()
-            self._visit_google_and_save_cookies()
-            self._load_saved_cookies()
-            self._add_header()
-
-            text, image_urls, title = self.scrape_text_with_selenium()
-            return text, image_urls, title
+            # Borrow a warm browser; its tab is recycled when the page is done
+            with self.browser_pool.page() as driver:
+                self.driver = driver
+                text, image_urls, title = self.scrape_text_with_selenium()
+                return text, image_urls, title
+        except (BrowserPoolFull, TimeoutError) as e:
+            print(f"Browser pool busy, skipping {self.url}: {str(e)}")
+            return "", [], ""
         except Exception as e:
             print(f"An error occurred during scraping: {str(e)}")
             print("Full stack trace:")
             print(traceback.format_exc())
             return f"An error occurred: {str(e)}\n\nStack trace:\n{traceback.format_exc()}", [], ""
         finally:
-            if self.driver:
-                self.driver.quit()
-            self._cleanup_cookie_file()
-
-    def _import_selenium(self):
-        try:
-            global webdriver, By, EC, WebDriverWait, TimeoutException, WebDriverException
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.wait import WebDriverWait
-            from selenium.common.exceptions import TimeoutException, WebDriverException
-
-            global ChromeOptions, FirefoxOptions, SafariOptions
-            from selenium.webdriver.chrome.options import Options as ChromeOptions
-            from selenium.webdriver.firefox.options import Options as FirefoxOptions
-            from selenium.webdriver.safari.options import Options as SafariOptions
-        except ImportError as e:
-            print(f"Failed to import Selenium: {str(e)}")
-            print("Please install Selenium and its dependencies to use BrowserScraper.")
-            print("You can install Selenium using pip:")
-            print("    pip install selenium")
-            print("If you're using a virtual environment, make sure it's activated.")
-            raise ImportError(
-                "Selenium is required but not installed. See error message above for installation instructions.") from e
-
-    def setup_driver(self) -> None:
-        # print(f"Setting up {self.selenium_web_browser} driver...")
-
-        options_available = {
-            "chrome": ChromeOptions,
-            "firefox": FirefoxOptions,
-            "safari": SafariOptions,
-        }
-
-        options = options_available[self.selenium_web_browser]()
-        options.add_argument(f"user-agent={self.user_agent}")
-        if self.headless:
-            options.add_argument("--headless")
-        options.add_argument("--enable-javascript")
-
-        try:
-            if self.selenium_web_browser == "firefox":
-                self.driver = webdriver.Firefox(options=options)
-            elif self.selenium_web_browser == "safari":
-                self.driver = webdriver.Safari(options=options)
-            else:  # chrome
-                if platform == "linux" or platform == "linux2":
-                    options.add_argument("--disable-dev-shm-usage")
-                    options.add_argument("--remote-debugging-port=9222")
-                options.add_argument("--no-sandbox")
-                options.add_experimental_option("prefs", {"download_restrictions": 3})
-                self.driver = webdriver.Chrome(options=options)
-
-            if self.use_browser_cookies:
-                self._load_browser_cookies()
-
-            # print(f"{self.selenium_web_browser.capitalize()} driver set up successfully.")
-        except Exception as e:
-            print(f"Failed to set up {self.selenium_web_browser} driver: {str(e)}")
-            print("Full stack trace:")
-            print(traceback.format_exc())
-            raise
-
-    def _load_saved_cookies(self):
-        """Load saved cookies before visiting the target URL"""
-        cookie_file = Path(self.cookie_filename)
-        if cookie_file.exists():
-            cookies = pickle.load(open(self.cookie_filename, "rb"))
-            for cookie in cookies:
-                self.driver.add_cookie(cookie)
-        else:
-            print("No saved cookies found.")
-
-    def _load_browser_cookies(self):
-        """Load cookies directly from the browser"""
-        try:
-            import browser_cookie3
-        except ImportError:
-            print(
-                "browser_cookie3 is not installed. Please install it using: pip install browser_cookie3"
-            )
-            return
-
-        if self.selenium_web_browser == "chrome":
-            cookies = browser_cookie3.chrome()
-        elif self.selenium_web_browser == "firefox":
-            cookies = browser_cookie3.firefox()
-        else:
-            print(f"Cookie loading not supported for {self.selenium_web_browser}")
-            return
-
-        for cookie in cookies:
-            self.driver.add_cookie({'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain})
-
-    def _cleanup_cookie_file(self):
-        """Remove the cookie file"""
-        cookie_file = Path(self.cookie_filename)
-        if cookie_file.exists():
-            try:
-                os.remove(self.cookie_filename)
-            except Exception as e:
-                print(f"Failed to remove cookie file: {str(e)}")
-        else:
-            print("No cookie file found to remove.")
-
-    def _generate_random_string(self, length):
-        """Generate a random string of specified length"""
-        return "".join(random.choices(string.ascii_letters + string.digits, k=length))
+            self.driver = None
 
     def _get_domain(self):
         """Extract domain from URL"""
@@ -172,27 +187,18 @@ class BrowserScraper:
         domain = urlparse(self.url).netloc
         return domain[4:] if domain.startswith("www.") else domain
 
-    def _visit_google_and_save_cookies(self):
-        """Visit Google and save cookies before navigating to the target URL"""
-        try:
-            self.driver.get("https://www.google.com")
-            time.sleep(2)  # Wait for cookies to be set
-
-            # Save cookies to a file
-            cookies = self.driver.get_cookies()
-            pickle.dump(cookies, open(self.cookie_filename, "wb"))
-
-            # print("Google cookies saved successfully.")
-        except Exception as e:
-            print(f"Failed to visit Google and save cookies: {str(e)}")
-            print("Full stack trace:")
-            print(traceback.format_exc())
+    def _remaining(self, limit: float) -> float:
+        """`limit` seconds, capped by the time left before the deadline."""
+        if self._deadline_at is None:
+            return limit
+        return max(0.0, min(limit, self._deadline_at - time.monotonic()))
 
     def scrape_text_with_selenium(self) -> tuple:
-        self.driver.get(self.url)
-
+        if self._deadline_at is not None:
+            self.driver.set_page_load_timeout(max(1.0, self._remaining(300)))
         try:
-            WebDriverWait(self.driver, 20).until(
+            self.driver.get(self.url)
+            WebDriverWait(self.driver, self._remaining(20)).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
         except TimeoutException as e:
@@ -213,20 +219,16 @@ class BrowserScraper:
             page_source = self.driver.execute_script(
                 "return document.documentElement.outerHTML;"
             )
-            soup = BeautifulSoup(page_source, "lxml")
-
-            soup = clean_soup(soup)
-
-            text = get_text_from_soup(soup)
-            image_urls = get_relevant_images(soup, self.url)
-            title = extract_title(soup)
+            text, image_urls, title = get_html_engine(self.html_engine)(
+                page_source.encode("utf-8"), "utf-8", self.url
+            )
 
         return text, image_urls, title
 
     def _scroll_to_bottom(self):
         """Scroll to the bottom of the page to load all content"""
         last_height = self.driver.execute_script("return document.body.scrollHeight")
-        while True:
+        while self._remaining(2) >= 2:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(2)  # Wait for content to load
             new_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -0,0 +1,202 @@
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPoolFull(RuntimeError):
+    """Raised when too many scrapes are already waiting for a browser."""
+
+
+class PooledBrowser:
+    """A long-lived WebDriver and the number of pages it has served."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created = time.monotonic()
+        self.home_handle = driver.current_window_handle
+
+    def is_healthy(self) -> bool:
+        """Cheap liveness probe: the session answers a script call."""
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def reset_tab(self) -> None:
+        """Close tabs the page opened and blank the working tab for the next page."""
+        for handle in self.driver.window_handles:
+            if handle != self.home_handle:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(self.home_handle)
+        self.driver.get("about:blank")
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.debug(f"Failed to quit browser: {e}")
+
+
+class BrowserPool:
+    """
+    Thread-safe pool of warm WebDriver instances.
+
+    Browsers are started lazily, up to `size`, and handed out one page at a
+    time; after each page the working tab is recycled instead of quitting
+    the browser. A browser is replaced when it fails its health check or
+    after `max_pages_per_browser` pages. At most `max_queue` callers may wait
+    for a browser; further callers get BrowserPoolFull.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], object],
+        size: int = 2,
+        max_pages_per_browser: int = 50,
+        max_queue: int = 16,
+        acquire_timeout: float = 60.0,
+    ):
+        self.driver_factory = driver_factory
+        self.size = size
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_queue = max_queue
+        self.acquire_timeout = acquire_timeout
+        self._idle: list[PooledBrowser] = []
+        self._count = 0  # idle + checked out + starting
+        self._waiting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.started = 0
+        self.recycled = 0
+
+    def _checkout(self, timeout: float) -> PooledBrowser | None:
+        """Take an idle browser, or None when the caller should start one."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            if not self._idle and self._count >= self.size and self._waiting >= self.max_queue:
+                raise BrowserPoolFull(f"{self._waiting} scrapes already waiting for a browser")
+            self._waiting += 1
+            try:
+                while not self._idle and self._count >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        if not self._idle and self._count >= self.size:
+                            raise TimeoutError(f"No browser available after {timeout:.0f}s")
+                    if self._closed:
+                        raise RuntimeError("Browser pool is closed")
+            finally:
+                self._waiting -= 1
+            if self._idle:
+                return self._idle.pop()
+            self._count += 1
+            return None
+
+    def _start(self) -> PooledBrowser:
+        try:
+            browser = PooledBrowser(self.driver_factory())
+        except BaseException:
+            with self._cond:
+                self._count -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.started += 1
+        return browser
+
+    def _discard(self, browser: PooledBrowser) -> None:
+        browser.quit()
+        with self._cond:
+            self._count -= 1
+            self.recycled += 1
+            self._cond.notify()
+
+    def acquire(self, timeout: float | None = None) -> PooledBrowser:
+        """Check out a healthy browser, starting or replacing one as needed."""
+        browser = self._checkout(self.acquire_timeout if timeout is None else timeout)
+        if browser is not None and not browser.is_healthy():
+            logger.info("Replacing unhealthy browser")
+            browser.quit()
+            with self._cond:
+                self.recycled += 1
+            browser = None  # keep the slot and start a fresh browser in it
+        return browser or self._start()
+
+    def release(self, browser: PooledBrowser) -> None:
+        """Return a browser after one page, recycling its tab or the whole browser."""
+        browser.pages += 1
+        if self._closed or browser.pages >= self.max_pages_per_browser:
+            self._discard(browser)
+            return
+        try:
+            browser.reset_tab()
+        except Exception as e:
+            logger.info(f"Dropping browser after tab reset failed: {e}")
+            self._discard(browser)
+            return
+        with self._cond:
+            self._idle.append(browser)
+            self._cond.notify()
+
+    @contextmanager
+    def page(self, timeout: float | None = None):
+        """Yield a WebDriver for one page load."""
+        browser = self.acquire(timeout)
+        try:
+            yield browser.driver
+        finally:
+            self.release(browser)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "browsers": self._count,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "started": self.started,
+                "recycled": self.recycled,
+            }
+
+    def close(self) -> None:
+        """Quit idle browsers; checked-out browsers quit when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+            self._cond.notify_all()
+        for browser in idle:
+            browser.quit()
+
+
+_pools: dict[tuple, BrowserPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(key: tuple, driver_factory: Callable[[], object], **kwargs) -> BrowserPool:
+    """
+    Return the process-wide pool for `key` (browser type and options),
+    creating it on first use. Browsers outlive a single research run, so
+    later runs only pay page-load time.
+    """
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = _pools[key] = BrowserPool(driver_factory, **kwargs)
+        return pool
+
+
+@atexit.register
+def close_browser_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,258 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed);
+CREATE TABLE IF NOT EXISTS content_kinds (
+    url TEXT PRIMARY KEY,
+    kind TEXT NOT NULL
+);
+"""
+
+_TRACKING_PARAMS = ("utm_", "gclid", "fbclid")
+
+# Access times recorded by reads are written in batches of this many
+_TOUCH_BATCH = 256
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical cache key for a URL.
+
+    Lowercases the scheme and host, drops default ports, fragments and
+    tracking parameters, and sorts the query string.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+@dataclass
+class CachedPage:
+    """A scraped page with the HTTP validators needed to revalidate it."""
+
+    url: str
+    raw_content: str
+    title: str
+    image_urls: list = field(default_factory=list)
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched: float = 0.0
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched < ttl
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def as_result(self, url: str) -> dict:
+        """The scraper result dict for this page."""
+        return {
+            "url": url,
+            "raw_content": self.raw_content,
+            "image_urls": self.image_urls,
+            "title": self.title,
+        }
+
+
+class ScrapeCache:
+    """
+    Persistent cache of extracted page content, shared across research runs.
+
+    Pages younger than `ttl` are served without any network access; older
+    pages are revalidated with a conditional GET when the server sent an
+    ETag or Last-Modified header. The database is kept under `max_bytes`
+    by evicting least recently used pages. Reads do not commit: their
+    access times are written with the next store or every `_TOUCH_BATCH`
+    reads. The `a*` methods run the SQLite work in a worker thread for
+    callers on the event loop.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = 86400, max_bytes: int = 512 * 1024 * 1024):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        self._touched: dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @classmethod
+    def from_config(cls, cfg) -> "ScrapeCache | None":
+        """Open the cache configured on the researcher Config, if enabled."""
+        if not cfg.scraper_cache_enabled:
+            return None
+        return cls(
+            cfg.scraper_cache_path,
+            ttl=cfg.scraper_cache_ttl,
+            max_bytes=cfg.scraper_cache_max_mb * 1024 * 1024,
+        )
+
+    def get(self, url: str) -> CachedPage | None:
+        """Return the cached page for `url` (fresh or stale), or None."""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, etag, last_modified, fetched FROM pages WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touches()
+                self._conn.commit()
+        value = json.loads(zlib.decompress(row[0]))
+        return CachedPage(
+            url=key,
+            raw_content=value["raw_content"],
+            title=value["title"],
+            image_urls=value["image_urls"],
+            etag=row[1],
+            last_modified=row[2],
+            fetched=row[3],
+        )
+
+    def set(
+        self,
+        url: str,
+        raw_content: str,
+        title: str,
+        image_urls: list,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a freshly scraped page."""
+        key = normalize_url(url)
+        blob = zlib.compress(json.dumps(
+            {"raw_content": raw_content, "title": title, "image_urls": image_urls},
+            separators=(",", ":"),
+        ).encode("utf-8"))
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM pages WHERE url = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, value, size, etag, last_modified, fetched, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, blob, len(blob), etag, last_modified, now, now),
+            )
+            self._size += len(blob) - (old[0] if old else 0)
+            self._touched.pop(key, None)
+            self._flush_touches()
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark a page as fresh again after a 304 Not Modified response."""
+        now = time.time()
+        key = normalize_url(url)
+        with self._lock:
+            self._conn.execute("UPDATE pages SET fetched = ?, accessed = ? WHERE url = ?", (now, now, key))
+            self._touched.pop(key, None)
+            self._flush_touches()
+            self._conn.commit()
+
+    def get_content_kind(self, url: str) -> str | None:
+        """The content kind previously detected for `url`."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind FROM content_kinds WHERE url = ?", (normalize_url(url),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_content_kind(self, url: str, kind: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO content_kinds (url, kind) VALUES (?, ?)", (normalize_url(url), kind)
+            )
+            self._conn.commit()
+
+    async def aget(self, url: str) -> CachedPage | None:
+        return await asyncio.to_thread(self.get, url)
+
+    async def aset(self, url: str, raw_content: str, title: str, image_urls: list, **validators) -> None:
+        await asyncio.to_thread(self.set, url, raw_content, title, image_urls, **validators)
+
+    async def atouch(self, url: str) -> None:
+        await asyncio.to_thread(self.touch, url)
+
+    async def aget_content_kind(self, url: str) -> str | None:
+        return await asyncio.to_thread(self.get_content_kind, url)
+
+    async def aset_content_kind(self, url: str, kind: str) -> None:
+        await asyncio.to_thread(self.set_content_kind, url, kind)
+
+    def _flush_touches(self) -> None:
+        """Write buffered access times (caller holds the lock and commits)."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE pages SET accessed = ? WHERE url = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes:
+            rows = self._conn.execute("SELECT url, size FROM pages ORDER BY accessed ASC LIMIT 64").fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM pages WHERE url = ?", (key,))
+                self._size -= size
+                if self._size <= self.max_bytes:
+                    break
+
+    def stats(self) -> dict:
+        """Hit, miss and revalidation counters plus storage usage."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "size_bytes": self._size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,128 @@
+"""
+Near-duplicate detection for scraped pages.
+
+Mirrors, syndicated copies and reprints of the same opinion or article
+arrive under different URLs. Pages are fingerprinted with MinHash over
+word shingles and bucketed with LSH banding, so each new page is compared
+only against likely matches. One canonical page is kept per cluster and
+the other URLs are merged into it.
+"""
+
+import logging
+import re
+import zlib
+
+import numpy as np
+import tiktoken
+
+from ..utils.costs import ENCODING_MODEL
+
+logger = logging.getLogger(__name__)
+
+_PRIME = np.uint64((1 << 31) - 1)  # keeps a*x + b within uint64 for 32-bit hashes
+_ROWS_PER_BAND = 8
+_SHINGLE_BLOCK = 4096  # shingles hashed per numpy block, bounds memory on long pages
+
+
+class NearDuplicateIndex:
+    """
+    Run-scoped index of kept pages that drops near-duplicates.
+
+    Pages whose estimated Jaccard similarity (over `shingle_size`-word
+    shingles) with an already kept page is at least `threshold` are merged
+    into it: the kept page gains a `duplicate_urls` list and their images.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)
+        self._bands = num_perm // _ROWS_PER_BAND
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(self._bands)]
+        self._pages: list[dict] = []
+        self._signatures: list[np.ndarray] = []
+        self._encoding = None
+        self.duplicates = 0
+        self.tokens_saved = 0
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of the text's word shingles."""
+        words = re.findall(r"\w+", text.lower())
+        k = self.shingle_size
+        shingles = {" ".join(words[i:i + k]) for i in range(max(1, len(words) - k + 1))}
+        hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+        signature = np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        for start in range(0, len(hashes), _SHINGLE_BLOCK):
+            block = hashes[start:start + _SHINGLE_BLOCK, None]
+            np.minimum(signature, ((block * self._a + self._b) % _PRIME).min(axis=0), out=signature)
+        return signature
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * _ROWS_PER_BAND:(band + 1) * _ROWS_PER_BAND].tobytes()
+            for band in range(self._bands)
+        ]
+
+    def _find(self, signature: np.ndarray, keys: list[bytes]) -> int | None:
+        candidates = {i for band, key in enumerate(keys) for i in self._buckets[band].get(key, ())}
+        best, best_similarity = None, self.threshold
+        for i in candidates:
+            similarity = float(np.mean(self._signatures[i] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = i, similarity
+        return best
+
+    def _count_tokens(self, text: str) -> int:
+        if self._encoding is None:
+            try:
+                self._encoding = tiktoken.get_encoding(ENCODING_MODEL)
+            except Exception as e:  # the encoding is downloaded on first use
+                logger.debug(f"Estimating tokens from characters: {e}")
+                self._encoding = False
+        if not self._encoding:
+            return len(text) // 4
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    @staticmethod
+    def _merge(canonical: dict, duplicate: dict) -> None:
+        urls = canonical.setdefault("duplicate_urls", [])
+        for url in [duplicate.get("url"), *duplicate.get("duplicate_urls", [])]:
+            if url and url != canonical.get("url") and url not in urls:
+                urls.append(url)
+        images = canonical.setdefault("image_urls", [])
+        seen = {image.get("url") for image in images}
+        images.extend(image for image in duplicate.get("image_urls", []) if image.get("url") not in seen)
+
+    def deduplicate(self, pages: list[dict]) -> list[dict]:
+        """
+        Return the pages that are not near-duplicates of each other or of
+        pages kept earlier in the run, in their original order.
+
+        Within a batch the longest copy of a document is kept.
+        """
+        keep = [False] * len(pages)
+        for index in sorted(range(len(pages)), key=lambda i: -len(pages[i].get("raw_content") or "")):
+            page = pages[index]
+            text = page.get("raw_content") or ""
+            signature = self.signature(text)
+            keys = self._band_keys(signature)
+            match = self._find(signature, keys)
+            if match is not None:
+                self._merge(self._pages[match], page)
+                self.duplicates += 1
+                self.tokens_saved += self._count_tokens(text)
+                logger.info(f"Near-duplicate of {self._pages[match].get('url')}: {page.get('url')}")
+                continue
+            keep[index] = True
+            position = len(self._pages)
+            self._pages.append(page)
+            self._signatures.append(signature)
+            for band, key in enumerate(keys):
+                self._buckets[band].setdefault(key, []).append(position)
+        return [page for page, kept in zip(pages, keep) if kept]
+
+    def stats(self) -> dict:
+        return {"pages": len(self._pages), "duplicates": self.duplicates, "tokens_saved": self.tokens_saved}
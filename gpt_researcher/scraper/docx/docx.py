@@ -0,0 +1,61 @@
+import asyncio
+import io
+
+import requests
+from docx import Document
+
+
+class DocxScraper:
+
+    def __init__(self, link, session=None, fetcher=None, parse_executor=None, validators=None):
+        """
+        Initialize the scraper with a link to a Word (.docx) document.
+
+        Args:
+          link (str): The URL of the document.
+          session (requests.Session, optional): Session used by the synchronous `scrape`.
+          fetcher (AsyncFetcher, optional): Async fetcher used by `scrape_async`.
+          parse_executor (Executor, optional): Executor for parsing the document.
+          validators (dict, optional): Conditional request headers for revalidation.
+        """
+        self.link = link
+        self.session = session
+        self.fetcher = fetcher
+        self.parse_executor = parse_executor
+        self.validators = validators
+        self.response = None
+
+    @staticmethod
+    def parse(content: bytes) -> tuple[str, list, str]:
+        """Extract paragraph and table text, and the core title, from .docx bytes."""
+        document = Document(io.BytesIO(content))
+        blocks = [p.text for p in document.paragraphs if p.text.strip()]
+        for table in document.tables:
+            for row in table.rows:
+                cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+                if cells:
+                    blocks.append(" | ".join(cells))
+        return "\n".join(blocks), [], document.core_properties.title or ""
+
+    def scrape(self) -> tuple[str, list, str]:
+        try:
+            response = (self.session or requests).get(self.link, timeout=5)
+            response.raise_for_status()
+            return self.parse(response.content)
+        except Exception as e:
+            print(f"Error loading DOCX : {self.link} {e}")
+            return "", [], ""
+
+    async def scrape_async(self) -> tuple[str, list, str]:
+        loop = asyncio.get_running_loop()
+        if self.fetcher is None:
+            return await loop.run_in_executor(None, self.scrape)
+        try:
+            response = await self.fetcher.fetch(self.link, headers=self.validators)
+            self.response = response
+            if response.status_code == 304 or response.status_code >= 400:
+                return "", [], ""
+            return await loop.run_in_executor(self.parse_executor, self.parse, response.content)
+        except Exception as e:
+            print(f"Error loading DOCX : {self.link} {e}")
+            return "", [], ""
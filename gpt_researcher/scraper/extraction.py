@@ -0,0 +1,217 @@
+"""
+HTML main-content extraction engines.
+
+Each engine takes raw HTML bytes and returns (content, image_urls, title):
+
+- "bs": the original BeautifulSoup pipeline (clean_soup, get_text_from_soup).
+- "lxml": a single lxml traversal that drops boilerplate subtrees as it goes
+  and keeps the densest content container, readability-style.
+"""
+
+import re
+from collections import defaultdict
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from .utils import clean_soup, extract_title, get_relevant_images, get_text_from_soup, score_image
+
+# Subtrees that never hold main content
+_SKIP_TAGS = {
+    "head", "script", "style", "noscript", "template", "svg", "canvas", "iframe",
+    "nav", "footer", "header", "aside", "menu", "form", "button", "select", "option",
+}
+
+# Elements that start a new text block
+_BLOCK_TAGS = {
+    "html", "body", "main", "article", "section", "div", "p", "pre", "blockquote",
+    "ul", "ol", "li", "dl", "dt", "dd", "table", "tr", "td", "th", "caption",
+    "figure", "figcaption", "address", "center",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+}
+
+_BOILERPLATE_ATTR = re.compile(
+    r"(?:^|[\s_-])(?:nav|navbar|menu|sidebar|footer|breadcrumbs?|cookies?|social|share|"
+    r"comments?|advert|ads?|promo|related|subscribe|newsletter|popup|modal|skip-link)(?:$|[\s_-])",
+    re.IGNORECASE,
+)
+
+# lxml rejects str input that still carries an encoding declaration
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+_MIN_BLOCK_CHARS = 25
+
+
+class _Block:
+    __slots__ = ("element", "parts", "length", "link_length")
+
+    def __init__(self, element):
+        self.element = element
+        self.parts = []
+        self.length = 0
+        self.link_length = 0
+
+    def add(self, text: str, in_link: bool) -> None:
+        self.parts.append(text)
+        size = len(text.strip())
+        self.length += size
+        if in_link:
+            self.link_length += size
+
+    @property
+    def text(self) -> str:
+        return " ".join("".join(self.parts).split())
+
+    @property
+    def link_density(self) -> float:
+        return self.link_length / self.length if self.length else 0.0
+
+
+def _is_boilerplate(element) -> bool:
+    if element.get("hidden") is not None or element.get("aria-hidden") == "true":
+        return True
+    if element.get("role") in ("navigation", "banner", "contentinfo", "complementary"):
+        return True
+    marker = f"{element.get('class', '')} {element.get('id', '')}"
+    return bool(marker.strip()) and _BOILERPLATE_ATTR.search(marker) is not None
+
+
+def extract_with_soup(content: bytes, encoding: str | None, url: str) -> tuple[str, list, str]:
+    """The original BeautifulSoup extraction pipeline."""
+    soup = BeautifulSoup(content, "lxml", from_encoding=encoding)
+    soup = clean_soup(soup)
+    text = get_text_from_soup(soup)
+    image_urls = get_relevant_images(soup, url)
+    title = extract_title(soup)
+    # title is a NavigableString that references the whole tree; results
+    # must be plain data so they are cheap to keep and can cross processes
+    return text, image_urls, str(title) if title else ""
+
+
+def extract_with_lxml(content: bytes, encoding: str | None, url: str) -> tuple[str, list, str]:
+    """
+    Extract main content in one pass over the lxml tree.
+
+    Boilerplate subtrees (navigation, headers, footers, hidden and
+    nav/menu/sidebar-classed elements) are skipped during the walk. Text
+    is collected into blocks with link density; blocks then vote for
+    their parent and grandparent containers, and the best-scoring
+    container plus strong siblings is kept.
+    """
+    if not content or not content.strip():
+        return "", [], ""
+    if encoding:
+        # Decode in Python: libxml2 does not know every codec name Python does
+        try:
+            content = _XML_DECLARATION.sub("", content.decode(encoding, errors="replace"), count=1)
+        except LookupError:
+            pass
+    parser = etree.HTMLParser(remove_comments=True, remove_pis=True)
+    root = etree.fromstring(content, parser)
+    if root is None:
+        return "", [], ""
+
+    title = (root.findtext(".//title") or "").strip()
+
+    blocks: list[_Block] = []
+    images: list[tuple[object, dict]] = []
+    block_stack = [_Block(root)]
+    kinds = []  # per open element: "skip", "block" or "inline"
+    link_depth = 0
+    walker = etree.iterwalk(root, events=("start", "end"))
+    for event, element in walker:
+        tag = element.tag.lower() if isinstance(element.tag, str) else ""
+        if event == "start":
+            # Page-level classes (e.g. WordPress "has-sidebar") describe the layout, not the element
+            if tag in _SKIP_TAGS or (tag not in ("html", "body") and _is_boilerplate(element)):
+                walker.skip_subtree()
+                kinds.append("skip")
+                continue
+            if tag in _BLOCK_TAGS:
+                block = _Block(element)
+                blocks.append(block)
+                block_stack.append(block)
+                kinds.append("block")
+            else:
+                kinds.append("inline")
+                if tag == "a":
+                    link_depth += 1
+                elif tag == "br":
+                    block_stack[-1].add("\n", False)
+                elif tag == "img" and element.get("src"):
+                    images.append((element, {
+                        "src": element.get("src"),
+                        "classes": (element.get("class") or "").split(),
+                        "width": element.get("width"),
+                        "height": element.get("height"),
+                    }))
+            if element.text:
+                block_stack[-1].add(element.text, link_depth > 0)
+        else:
+            kind = kinds.pop()
+            if kind == "block":
+                block_stack.pop()
+            elif kind == "inline" and tag == "a":
+                link_depth -= 1
+            if element.tail and block_stack:
+                block_stack[-1].add(element.tail, link_depth > 0)
+
+    # Readability-style voting: content blocks score their containers
+    scores: dict = defaultdict(float)
+    for block in blocks:
+        if block.length < _MIN_BLOCK_CHARS:
+            continue
+        text = block.text
+        score = (1 + text.count(",") + min(len(text) // 100, 3)) * (1 - block.link_density)
+        parent = block.element.getparent()
+        if parent is not None:
+            scores[parent] += score
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                scores[grandparent] += score / 2
+
+    if scores:
+        candidate = max(scores, key=scores.get)
+        best = scores[candidate]
+        keep = {candidate}
+        parent = candidate.getparent()
+        if parent is not None:
+            threshold = max(10.0, best * 0.2)
+            keep.update(sibling for sibling in parent if scores.get(sibling, 0) >= threshold)
+
+        def in_content(element) -> bool:
+            return element in keep or any(ancestor in keep for ancestor in element.iterancestors())
+    else:
+        def in_content(element) -> bool:
+            return True
+
+    lines = [
+        text for block in blocks
+        if block.length and block.link_density < 0.5 and in_content(block.element)
+        for text in [block.text] if text
+    ]
+
+    scored_images = []
+    for element, attrs in images:
+        if not in_content(element):
+            continue
+        image = score_image(url, attrs["src"], attrs["classes"], attrs["width"], attrs["height"])
+        if image is not None:
+            scored_images.append(image)
+    scored_images.sort(key=lambda image: image["score"], reverse=True)
+
+    return "\n".join(lines), scored_images[:10], title
+
+
+HTML_ENGINES = {
+    "bs": extract_with_soup,
+    "lxml": extract_with_lxml,
+}
+
+
+def get_html_engine(name: str | None):
+    """Return the extraction function for `name` (defaults to "bs")."""
+    try:
+        return HTML_ENGINES[name or "bs"]
+    except KeyError:
+        raise ValueError(f"Unknown HTML extraction engine: {name}. Choose from {sorted(HTML_ENGINES)}")
@@ -0,0 +1,221 @@
+import asyncio
+import importlib.util
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+import httpx
+
+# Appended to scraped text when the download was cut short
+TRUNCATION_MARKERS = {
+    "size": "[Content truncated: the download exceeded the size limit]",
+    "deadline": "[Content truncated: the download deadline was reached]",
+}
+
+
+@dataclass
+class FetchResult:
+    """
+    A fetched HTTP response body, capped at the fetcher's size and time limits.
+
+    `truncated_reason` is "size" or "deadline" when the body was cut short;
+    `latency` is the seconds from sending the request to receiving the
+    response headers, which is what the server (not our parsing) costs.
+    """
+
+    url: str
+    status_code: int
+    content: bytes
+    encoding: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    truncated: bool = False
+    truncated_reason: str | None = None
+    latency: float | None = None
+
+
+class AsyncFetcher:
+    """
+    Native asyncio HTTP fetcher shared by the scrapers of one run.
+
+    Keeps a pooled httpx client (HTTP/2 when `h2` is installed), limits
+    concurrent connections per host, and streams bodies so oversized
+    responses are cut off at `max_content_bytes` instead of being read
+    into memory. A server that has not sent response headers within
+    `first_byte_timeout` fails the fetch; a body still arriving when
+    `deadline` seconds have passed since the request started is cut off
+    there, so slow-drip servers cannot hold a request open.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        max_connections: int = 100,
+        max_connections_per_host: int = 6,
+        max_content_bytes: int = 10 * 1024 * 1024,
+        timeout: float = 4.0,
+        http2: bool = True,
+        first_byte_timeout: float | None = None,
+        deadline: float | None = None,
+    ):
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_content_bytes = max_content_bytes
+        self.timeout = timeout
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.first_byte_timeout = first_byte_timeout
+        self.deadline = deadline
+        self._client: httpx.AsyncClient | None = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_config(cls, cfg, user_agent: str) -> "AsyncFetcher":
+        """Build a fetcher from the researcher Config."""
+        return cls(
+            user_agent,
+            max_connections=cfg.scraper_max_connections,
+            max_connections_per_host=cfg.scraper_max_connections_per_host,
+            max_content_bytes=cfg.scraper_max_content_bytes,
+            timeout=cfg.scraper_timeout,
+            http2=cfg.scraper_http2,
+            first_byte_timeout=cfg.scraper_first_byte_timeout,
+            deadline=cfg.scraper_url_deadline,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._host_limits[host]
+
+    async def fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        max_bytes: int | None = None,
+        deadline: float | None = None,
+    ) -> FetchResult:
+        """
+        GET `url`, reading at most `max_content_bytes` of the body before `deadline`.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers, e.g. conditional validators
+            max_bytes: Size cap for this fetch instead of `max_content_bytes`
+            deadline: Deadline for this fetch instead of `deadline`
+
+        Raises:
+            httpx.HTTPError: On connection errors and timeouts, including
+                no response headers within `first_byte_timeout`
+        """
+        loop = asyncio.get_running_loop()
+        max_bytes = max_bytes or self.max_content_bytes
+        deadline = deadline or self.deadline
+        async with self._host_limit(url):
+            started = loop.time()
+            request = self.client.build_request("GET", url, headers=headers)
+            first_byte_timeout = min(
+                (t for t in (self.first_byte_timeout, deadline) if t is not None), default=None
+            )
+            try:
+                response = await asyncio.wait_for(self.client.send(request, stream=True), first_byte_timeout)
+            except asyncio.TimeoutError:
+                raise httpx.ReadTimeout(f"No response within {first_byte_timeout}s", request=request)
+            latency = loop.time() - started
+
+            try:
+                chunks = []
+                size = 0
+                reason = None
+                body = response.aiter_bytes()
+                while True:
+                    remaining_time = None
+                    if deadline is not None:
+                        remaining_time = deadline - (loop.time() - started)
+                        if remaining_time <= 0:
+                            reason = "deadline"
+                            break
+                    try:
+                        chunk = await asyncio.wait_for(body.__anext__(), remaining_time)
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        reason = "deadline"
+                        break
+                    remaining = max_bytes - size
+                    if len(chunk) > remaining:
+                        chunks.append(chunk[:remaining])
+                        reason = "size"
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+            finally:
+                await response.aclose()
+
+            return FetchResult(
+                url=str(response.url),
+                status_code=response.status_code,
+                content=b"".join(chunks),
+                encoding=response.charset_encoding,
+                headers=dict(response.headers),
+                truncated=reason is not None,
+                truncated_reason=reason,
+                latency=latency,
+            )
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+
+class PrefetchedFetcher:
+    """
+    Stands in for an AsyncFetcher in a scraper whose page was already
+    fetched, e.g. to sniff its content type, so it is not downloaded twice.
+
+    The first fetch of `url` returns `result`; other fetches go to the
+    wrapped fetcher, as does a refetch with its own budget when `result`
+    was truncated under the shared one.
+    """
+
+    def __init__(self, fetcher: AsyncFetcher, url: str, result: FetchResult):
+        self.fetcher = fetcher
+        self.url = url
+        self.result = result
+
+    def __getattr__(self, name):
+        return getattr(self.fetcher, name)
+
+    async def fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        max_bytes: int | None = None,
+        deadline: float | None = None,
+    ) -> FetchResult:
+        result, self.result = self.result, None
+        larger_budget = max_bytes is not None or deadline is not None
+        if result is not None and url == self.url and not (result.truncated and larger_budget):
+            return result
+        return await self.fetcher.fetch(url, headers=headers, max_bytes=max_bytes, deadline=deadline)
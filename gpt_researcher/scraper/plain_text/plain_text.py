@@ -0,0 +1,51 @@
+import asyncio
+from urllib.parse import urlparse
+
+import requests
+
+
+class PlainTextScraper:
+
+    def __init__(self, link, session=None, fetcher=None, parse_executor=None, validators=None):
+        """
+        Initialize the scraper with a link to a plain text document.
+
+        Args:
+          link (str): The URL of the document.
+          session (requests.Session, optional): Session used by the synchronous `scrape`.
+          fetcher (AsyncFetcher, optional): Async fetcher used by `scrape_async`.
+          parse_executor (Executor, optional): Unused; accepted for a uniform interface.
+          validators (dict, optional): Conditional request headers for revalidation.
+        """
+        self.link = link
+        self.session = session
+        self.fetcher = fetcher
+        self.parse_executor = parse_executor
+        self.validators = validators
+        self.response = None
+
+    def title(self) -> str:
+        return urlparse(self.link).path.rstrip("/").rsplit("/", 1)[-1]
+
+    def scrape(self) -> tuple[str, list, str]:
+        try:
+            response = (self.session or requests).get(self.link, timeout=5)
+            response.raise_for_status()
+            return response.text.strip(), [], self.title()
+        except Exception as e:
+            print(f"Error loading text : {self.link} {e}")
+            return "", [], ""
+
+    async def scrape_async(self) -> tuple[str, list, str]:
+        if self.fetcher is None:
+            return await asyncio.get_running_loop().run_in_executor(None, self.scrape)
+        try:
+            response = await self.fetcher.fetch(self.link, headers=self.validators)
+            self.response = response
+            if response.status_code == 304 or response.status_code >= 400:
+                return "", [], ""
+            text = response.content.decode(response.encoding or "utf-8", errors="replace")
+            return text.strip(), [], self.title()
+        except Exception as e:
+            print(f"Error loading text : {self.link} {e}")
+            return "", [], ""
@@ -1,22 +1,83 @@
-import os
+import asyncio
 import requests
-import tempfile
 from urllib.parse import urlparse
-from langchain_community.document_loaders import PyMuPDFLoader
+
+try:
+    import pymupdf
+except ImportError:  # PyMuPDF < 1.24.3
+    import fitz as pymupdf
+
+# Upper bound on process-pool tasks per document; each task receives its own
+# copy of the PDF bytes, so more tasks trade memory for parallelism.
+MAX_TASKS_PER_PDF = 4
+MIN_PAGES_PER_TASK = 16
+
+
+def _open(source: bytes | str):
+    if isinstance(source, (bytes, bytearray)):
+        return pymupdf.open(stream=source, filetype="pdf")
+    return pymupdf.open(source)
+
+
+def pdf_info(source: bytes | str) -> tuple[int, str]:
+    """Return (page_count, title) without extracting any text."""
+    with _open(source) as doc:
+        return doc.page_count, (doc.metadata or {}).get("title") or ""
+
+
+def extract_pages(source: bytes | str, start: int, stop: int) -> list[str]:
+    """Extract the text of pages [start, stop). Runs in pool worker processes."""
+    with _open(source) as doc:
+        return [doc[i].get_text() for i in range(start, min(stop, doc.page_count))]
+
+
+def page_ranges(page_count: int) -> list[tuple[int, int]]:
+    """Split pages into at most MAX_TASKS_PER_PDF contiguous ranges."""
+    if page_count <= 0:
+        return []
+    tasks = max(1, min(MAX_TASKS_PER_PDF, page_count // MIN_PAGES_PER_TASK))
+    size = -(-page_count // tasks)
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
 
 
 class PyMuPDFScraper:
 
-    def __init__(self, link, session=None):
+    def __init__(
+        self,
+        link,
+        session=None,
+        fetcher=None,
+        parse_executor=None,
+        validators=None,
+        process_executor=None,
+        max_pages: int = 200,
+        max_bytes: int | None = None,
+        download_deadline: float | None = None,
+    ):
         """
         Initialize the scraper with a link and an optional session.
 
         Args:
           link (str): The URL or local file path of the PDF document.
           session (requests.Session, optional): An optional session for making HTTP requests.
+          fetcher (AsyncFetcher, optional): Async fetcher used by `scrape_async`.
+          parse_executor (Executor, optional): Executor for opening the document.
+          validators (dict, optional): Conditional request headers for revalidation.
+          process_executor (ProcessPoolExecutor, optional): Pool that extracts page text.
+          max_pages (int): Page budget; later pages are not extracted.
+          max_bytes (int, optional): Download size cap, replacing the fetcher's page cap.
+          download_deadline (float, optional): Download deadline, replacing the fetcher's.
         """
         self.link = link
         self.session = session
+        self.fetcher = fetcher
+        self.parse_executor = parse_executor
+        self.validators = validators
+        self.process_executor = process_executor
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.download_deadline = download_deadline
+        self.response = None
 
     def is_url(self) -> bool:
         """
@@ -33,34 +94,23 @@ class PyMuPDFScraper:
 
     def scrape(self) -> tuple[str, list[str], str]:
         """
-        The `scrape` function uses PyMuPDFLoader to load a document from the provided link (either URL or local file)
-        and returns the document as a string.
+        Download the PDF into memory (or open the local file) and extract the
+        text of up to `max_pages` pages in this thread.
 
         Returns:
-          str: A string representation of the loaded document.
+          tuple: (content, image_urls, title)
         """
         try:
             if self.is_url():
-                response = requests.get(self.link, timeout=5, stream=True)
+                response = (self.session or requests).get(self.link, timeout=5)
                 response.raise_for_status()
-
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_filename = temp_file.name  # Get the temporary file name
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)  # Write the downloaded content to the temporary file
-
-                loader = PyMuPDFLoader(temp_filename)
-                doc = loader.load()
-
-                os.remove(temp_filename)
+                source = response.content
             else:
-                loader = PyMuPDFLoader(self.link)
-                doc = loader.load()
+                source = self.link
 
-            # Extract the content, image (if any), and title from the document.
-            image = []
-            # Retrieve the content of the first page to minimize embedding costs.
-            return doc[0].page_content, image, doc[0].metadata["title"]
+            page_count, title = pdf_info(source)
+            pages = extract_pages(source, 0, min(page_count, self.max_pages))
+            return "\n\n".join(pages), [], title
 
         except requests.exceptions.Timeout:
             print(f"Download timed out. Please check the link : {self.link}")
@@ -68,3 +118,57 @@ class PyMuPDFScraper:
         except Exception as e:
             print(f"Error loading PDF : {self.link} {e}")
             return "", [], ""
+
+    async def scrape_async(self) -> tuple[str, list[str], str]:
+        """
+        Fetch the PDF bytes with the shared async fetcher and extract page
+        ranges in parallel on the process pool, never touching disk.
+
+        Downloads get their own `max_bytes` and `download_deadline` budget,
+        since documents are routinely larger and slower than HTML pages.
+        Falls back to the synchronous `scrape` in a thread when no fetcher is set.
+
+        Raises:
+          ValueError: If the document cannot be opened, e.g. because the
+            download was cut short, so the URL is reported as failed.
+        """
+        loop = asyncio.get_running_loop()
+        if self.fetcher is None and self.is_url():
+            return await loop.run_in_executor(None, self.scrape)
+        try:
+            if self.is_url():
+                response = await self.fetcher.fetch(
+                    self.link,
+                    headers=self.validators,
+                    max_bytes=self.max_bytes,
+                    deadline=self.download_deadline,
+                )
+                self.response = response
+                if response.status_code == 304:
+                    return "", [], ""
+                if response.status_code >= 400:
+                    print(f"Error loading PDF : {self.link} HTTP {response.status_code}")
+                    return "", [], ""
+                source = response.content
+            else:
+                source = self.link
+        except Exception as e:
+            print(f"Error loading PDF : {self.link} {e}")
+            return "", [], ""
+
+        try:
+            page_count, title = await loop.run_in_executor(self.parse_executor, pdf_info, source)
+        except Exception as e:
+            if self.response is not None and self.response.truncated:
+                raise ValueError(
+                    f"PDF download was cut short ({self.response.truncated_reason}) after "
+                    f"{len(source)} bytes and cannot be opened: {e}"
+                ) from e
+            raise ValueError(f"Cannot open PDF: {e}") from e
+
+        ranges = page_ranges(min(page_count, self.max_pages))
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self.process_executor, extract_pages, source, start, stop)
+            for start, stop in ranges
+        ))
+        return "\n\n".join(page for chunk in chunks for page in chunk), [], title
@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 from colorama import Fore, init
 
 import requests
@@ -9,10 +10,17 @@ import logging
 
 from gpt_researcher.utils.workers import WorkerPool
 
+from . import sniff
+from .browser.pool import BrowserPool
+from .cache import ScrapeCache
+from .fetcher import TRUNCATION_MARKERS, AsyncFetcher, PrefetchedFetcher
+
 from . import (
     ArxivScraper,
     BeautifulSoupScraper,
     PyMuPDFScraper,
+    DocxScraper,
+    PlainTextScraper,
     WebBaseLoaderScraper,
     BrowserScraper,
     NoDriverScraper,
@@ -26,13 +34,58 @@ class Scraper:
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool):
+    def __init__(
+        self,
+        urls,
+        user_agent,
+        scraper,
+        worker_pool: WorkerPool,
+        fetcher: AsyncFetcher | None = None,
+        cache: ScrapeCache | None = None,
+        pdf_max_pages: int | None = None,
+        pdf_max_bytes: int | None = None,
+        pdf_deadline: float | None = None,
+        html_engine: str | None = None,
+        browser_pool: BrowserPool | None = None,
+        process_parse_min_bytes: int | None = None,
+        url_deadline: float | None = None,
+        deadline: float | None = None,
+    ):
         """
         Initialize the Scraper class.
         Args:
             urls:
+            fetcher: Async HTTP fetcher for scrapers that support it. One is
+                created (and closed after `run`) if not provided.
+            cache: Persistent scrape cache; fresh pages skip the network and
+                parsing, stale pages are revalidated with conditional GETs.
+            pdf_max_pages: Page budget for PDF extraction (scraper default if None).
+            pdf_max_bytes: Download size cap for PDFs (the fetcher's page cap if None).
+            pdf_deadline: Download deadline for PDFs (`url_deadline` if None).
+            html_engine: HTML main-content extraction engine ("bs" or "lxml").
+            browser_pool: Pool of warm Selenium browsers for the "browser" scraper.
+            process_parse_min_bytes: HTML pages at least this large are parsed
+                on the process pool (None keeps all parsing in threads).
+            url_deadline: Seconds a scraper may spend on one URL. The fetcher
+                and scrapers taking a `deadline` (the browser) enforce it
+                themselves; others are abandoned when it passes.
+            deadline: Seconds for the whole `run`; URLs still in progress
+                are cancelled and the completed results are returned.
         """
         self.urls = urls
+        self.cache = cache
+        self.pdf_max_pages = pdf_max_pages
+        self.pdf_max_bytes = pdf_max_bytes
+        self.pdf_deadline = pdf_deadline
+        self.html_engine = html_engine
+        self.browser_pool = browser_pool
+        self.process_parse_min_bytes = process_parse_min_bytes
+        self.url_deadline = url_deadline
+        self.deadline = deadline
+        self.fetcher = fetcher
+        self._owns_fetcher = fetcher is None
+        if self.fetcher is None:
+            self.fetcher = AsyncFetcher(user_agent)
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
         self.scraper = scraper
@@ -47,10 +100,28 @@ class Scraper:
         """
         Extracts the content from the links
         """
-        contents = await asyncio.gather(
-            *(self.extract_data_from_url(url, self.session) for url in self.urls)
-        )
+        tasks = [
+            asyncio.ensure_future(self.extract_data_from_url(url, self.session))
+            for url in self.urls
+        ]
+        try:
+            if tasks:
+                _, pending = await asyncio.wait(tasks, timeout=self.deadline)
+                if pending:
+                    self.logger.warning(
+                        f"Scrape deadline of {self.deadline}s reached; "
+                        f"cancelling {len(pending)} of {len(tasks)} URLs"
+                    )
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self._owns_fetcher:
+                await self.fetcher.aclose()
 
+        contents = [task.result() for task in tasks if not task.cancelled()]
         res = [content for content in contents if content["raw_content"] is not None]
         return res
 
@@ -91,10 +162,40 @@ class Scraper:
         """
         Extracts the data from the link with logging
         """
-        async with self.worker_pool.throttle():
+        cached = await self.cache.aget(link) if self.cache else None
+        if cached and cached.is_fresh(self.cache.ttl):
+            self.cache.hits += 1
+            return cached.as_result(link)
+
+        # Extensionless URLs of unknown type are sniffed from the page GET
+        # itself when the configured scraper fetches with the shared fetcher
+        prefetch = False
+        try:
+            content_kind = await self.known_content_kind(link)
+            if content_kind is None and self.needs_sniffing(link):
+                prefetch = "fetcher" in inspect.signature(self.get_scraper(link)).parameters
+                if not prefetch:
+                    content_kind = await self.detect_content_kind(link)
+            Scraper = None if prefetch else self.get_scraper(link, content_kind)
+        except Exception as e:
+            self.logger.error(f"Error processing {link}: {str(e)}")
+            return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+        options = {} if prefetch else self.scraper_options(Scraper, cached)
+
+        # Requests are scheduled per host; async-fetch scrapers hold no
+        # worker thread while waiting on the network.
+        async with self.worker_pool.throttle(link, uses_thread=not prefetch and "fetcher" not in options) as slot:
             try:
-                Scraper = self.get_scraper(link)
-                scraper = Scraper(link, session)
+                if prefetch:
+                    response = await self.fetcher.fetch(link, headers=cached.validators if cached else None)
+                    content_kind = sniff.response_kind(response)
+                    if content_kind is not None and 200 <= response.status_code < 300:
+                        await self.remember_content_kind(link, content_kind)
+                    Scraper = self.get_scraper(link, content_kind)
+                    options = self.scraper_options(Scraper, cached)
+                    options["fetcher"] = PrefetchedFetcher(self.fetcher, link, response)
+
+                scraper = Scraper(link, session, **options)
 
                 # Get scraper name
                 scraper_name = scraper.__class__.__name__
@@ -102,15 +203,35 @@ class Scraper:
 
                 # Get content
                 if hasattr(scraper, "scrape_async"):
-                    content, image_urls, title = await scraper.scrape_async()
+                    scraping = scraper.scrape_async()
                 else:
-                    (
-                        content,
-                        image_urls,
-                        title,
-                    ) = await asyncio.get_running_loop().run_in_executor(
+                    scraping = asyncio.get_running_loop().run_in_executor(
                         self.worker_pool.executor, scraper.scrape
                     )
+                # Fetcher-based scrapers stop downloading at the fetcher's
+                # deadline and keep what arrived; browser scrapers bound their
+                # own waits so they release pooled browsers; others are abandoned.
+                self_limited = "fetcher" in options or "deadline" in options
+                url_deadline = None if self_limited else self.url_deadline
+                try:
+                    content, image_urls, title = await asyncio.wait_for(scraping, url_deadline)
+                except asyncio.TimeoutError:
+                    self.logger.warning(f"Scraping {link} exceeded the {url_deadline}s deadline")
+                    return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+
+                response = getattr(scraper, "response", None)
+                if response is not None:
+                    slot.record(response.status_code, response.headers, getattr(response, "latency", None))
+                truncated_reason = getattr(response, "truncated_reason", None)
+                if truncated_reason:
+                    self.logger.warning(f"Download of {link} truncated ({truncated_reason})")
+                if self.cache:
+                    if cached and response is not None and response.status_code == 304:
+                        await self.cache.atouch(link)
+                        self.cache.hits += 1
+                        self.cache.revalidated += 1
+                        return cached.as_result(link)
+                    self.cache.misses += 1
 
                 if len(content) < 100:
                     self.logger.warning(f"Content too short or empty for {link}")
@@ -139,6 +260,24 @@ class Scraper:
                         "title": title,
                     }
 
+                if truncated_reason:
+                    content = f"{content}\n\n{TRUNCATION_MARKERS[truncated_reason]}"
+
+                # Only keep successful responses: error and rate-limit pages
+                # would otherwise be served for the whole TTL. A deadline cut
+                # depends on the network, not the page.
+                cacheable = response is not None and 200 <= response.status_code < 300
+                if self.cache and cacheable and truncated_reason != "deadline":
+                    headers = response.headers if response is not None else {}
+                    await self.cache.aset(
+                        link,
+                        content,
+                        title,
+                        image_urls,
+                        etag=headers.get("etag"),
+                        last_modified=headers.get("last-modified"),
+                    )
+
                 return {
                     "url": link,
                     "raw_content": content,
@@ -150,7 +289,78 @@ class Scraper:
                 self.logger.error(f"Error processing {link}: {str(e)}")
                 return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
 
-    def get_scraper(self, link):
+    def scraper_options(self, Scraper, cached=None) -> dict:
+        """Keyword arguments passing the shared fetch/parse resources to scrapers that accept them."""
+        params = inspect.signature(Scraper).parameters
+        options = {}
+        if "fetcher" in params:
+            options.update(
+                fetcher=self.fetcher,
+                parse_executor=self.worker_pool.parse_executor,
+                validators=cached.validators if cached else None,
+            )
+        if "process_executor" in params:
+            options["process_executor"] = self.worker_pool.process_executor
+        if "max_pages" in params and self.pdf_max_pages:
+            options["max_pages"] = self.pdf_max_pages
+        if "max_bytes" in params and self.pdf_max_bytes:
+            options["max_bytes"] = self.pdf_max_bytes
+        if "download_deadline" in params and self.pdf_deadline:
+            options["download_deadline"] = self.pdf_deadline
+        if "html_engine" in params and self.html_engine:
+            options["html_engine"] = self.html_engine
+        if "browser_pool" in params and self.browser_pool:
+            options["browser_pool"] = self.browser_pool
+        if "process_min_bytes" in params:
+            options["process_min_bytes"] = self.process_parse_min_bytes
+        if "deadline" in params and self.url_deadline:
+            options["deadline"] = self.url_deadline
+        return options
+
+    @staticmethod
+    def needs_sniffing(link: str) -> bool:
+        """Whether the content kind of `link` has to be detected from the server's response."""
+        return "arxiv.org" not in link and link.startswith(("http://", "https://"))
+
+    async def known_content_kind(self, link: str) -> str | None:
+        """Content kind implied by the URL's extension or remembered from an earlier scrape."""
+        if not self.needs_sniffing(link):
+            return None
+        kind = sniff.kind_from_url(link) or sniff.known_kind(link)
+        if kind is None and self.cache:
+            kind = await self.cache.aget_content_kind(link)
+        return kind
+
+    async def remember_content_kind(self, link: str, kind: str) -> None:
+        sniff.remember_kind(link, kind)
+        if self.cache:
+            await self.cache.aset_content_kind(link, kind)
+
+    async def detect_content_kind(self, link: str) -> str | None:
+        """
+        Detect what a URL serves (pdf, html, text or docx) before choosing a scraper.
+
+        Used when the configured scraper does not fetch through the shared
+        fetcher, so the page GET cannot be sniffed: the URL's extension or a
+        remembered kind is used when available, otherwise the first bytes
+        are fetched with a ranged GET. The result is remembered per URL, in
+        memory and in the scrape cache.
+        """
+        kind = await self.known_content_kind(link)
+        if kind is not None or not self.needs_sniffing(link):
+            return kind
+
+        try:
+            async with self.worker_pool.throttle(link, uses_thread=False):
+                kind = await sniff.sniff_content_kind(self.fetcher, link)
+        except Exception as e:
+            self.logger.warning(f"Could not detect content type of {link}: {e}")
+            return None
+        if kind is not None:
+            await self.remember_content_kind(link, kind)
+        return kind
+
+    def get_scraper(self, link, content_kind: str | None = None):
         """
         The function `get_scraper` determines the appropriate scraper class based on the provided link
         or a default scraper if none matches.
@@ -165,10 +375,14 @@ class Scraper:
         checks the link to determine the appropriate scraper class to use based on predefined mappings
         in the `SCRAPER_CLASSES` dictionary. If the link ends with ".pdf", it selects the
         `PyMuPDFScraper` class. If the link contains "arxiv.org", it selects the `ArxivScraper
+        When a `content_kind` was detected from the response ("pdf", "docx" or "text"), the
+        matching document extractor is used; HTML goes to the configured scraper.
         """
 
         SCRAPER_CLASSES = {
             "pdf": PyMuPDFScraper,
+            "docx": DocxScraper,
+            "text": PlainTextScraper,
             "arxiv": ArxivScraper,
             "bs": BeautifulSoupScraper,
             "web_base_loader": WebBaseLoaderScraper,
@@ -182,6 +396,8 @@ class Scraper:
 
         if link.endswith(".pdf"):
             scraper_key = "pdf"
+        elif content_kind in (sniff.PDF, sniff.DOCX, sniff.TEXT):
+            scraper_key = content_kind
         elif "arxiv.org" in link:
             scraper_key = "arxiv"
         else:
@@ -0,0 +1,120 @@
+import re
+from collections import OrderedDict
+from collections.abc import Mapping
+from urllib.parse import urlparse
+
+# Content kinds with a dedicated extractor; anything else goes to the
+# configured HTML scraper.
+PDF = "pdf"
+HTML = "html"
+TEXT = "text"
+DOCX = "docx"
+
+SNIFF_BYTES = 2048
+
+_MIME_KINDS = {
+    "application/pdf": PDF,
+    "application/x-pdf": PDF,
+    "text/html": HTML,
+    "application/xhtml+xml": HTML,
+    "text/plain": TEXT,
+    "text/markdown": TEXT,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": DOCX,
+}
+
+_EXTENSION_KINDS = {".pdf": PDF, ".docx": DOCX, ".txt": TEXT, ".md": TEXT}
+
+_FILENAME_RE = re.compile(r"""filename\*?=(?:UTF-8'')?["']?([^"';]+)""", re.IGNORECASE)
+
+# Process-wide memo of detected kinds, so a URL is only sniffed once
+_detected: OrderedDict[str, str] = OrderedDict()
+_DETECTED_MAX = 4096
+
+
+def kind_from_url(url: str) -> str | None:
+    """Content kind implied by the URL path's file extension, if any."""
+    path = urlparse(url).path.lower()
+    for extension, kind in _EXTENSION_KINDS.items():
+        if path.endswith(extension):
+            return kind
+    return None
+
+
+def detect_content_kind(
+    content_type: str | None = None, head: bytes = b"", filename: str = ""
+) -> str | None:
+    """
+    Classify a response from its Content-Type, first bytes and filename.
+
+    Magic bytes win over the declared type, since servers often send PDFs
+    and Word files as `application/octet-stream` or even `text/html`.
+    """
+    if head.startswith(b"%PDF-"):
+        return PDF
+    if head.startswith(b"PK\x03\x04") and (b"word/" in head or filename.lower().endswith(".docx")):
+        return DOCX
+
+    mime = (content_type or "").split(";")[0].strip().lower()
+    if mime in _MIME_KINDS:
+        return _MIME_KINDS[mime]
+    if filename:
+        kind = kind_from_url(filename)
+        if kind:
+            return kind
+
+    if head:
+        start = head.lstrip()[:256].lower()
+        if start.startswith((b"<!doctype html", b"<html")) or b"<head" in start or b"<body" in start:
+            return HTML
+        text = head.decode("utf-8", errors="replace")
+        printable = sum((c.isprintable() and c != "\ufffd") or c.isspace() for c in text)
+        if printable / len(text) > 0.95:
+            return TEXT
+    if mime.startswith("text/"):
+        return TEXT
+    return None
+
+
+def _filename(headers: Mapping[str, str]) -> str:
+    match = _FILENAME_RE.search(headers.get("content-disposition", ""))
+    return match.group(1) if match else ""
+
+
+def response_kind(result) -> str | None:
+    """Content kind of a fetched response (a FetchResult), from its headers and first bytes."""
+    return detect_content_kind(
+        result.headers.get("content-type"), result.content[:SNIFF_BYTES], _filename(result.headers)
+    )
+
+
+async def sniff_content_kind(fetcher, url: str) -> str | None:
+    """
+    Detect a URL's content kind from a ranged GET of its first SNIFF_BYTES.
+
+    The first bytes are always checked: servers label Word files and PDFs
+    as `text/html` or `application/octet-stream`, so the declared type
+    alone (e.g. from a HEAD request) cannot be trusted.
+    """
+    async with fetcher.client.stream("GET", url, headers={"Range": f"bytes=0-{SNIFF_BYTES - 1}"}) as response:
+        head = b""
+        async for chunk in response.aiter_bytes():
+            head += chunk
+            if len(head) >= SNIFF_BYTES:
+                break
+        return detect_content_kind(
+            response.headers.get("content-type"), head[:SNIFF_BYTES], _filename(response.headers)
+        )
+
+
+def remember_kind(url: str, kind: str) -> None:
+    _detected[url] = kind
+    _detected.move_to_end(url)
+    while len(_detected) > _DETECTED_MAX:
+        _detected.popitem(last=False)
+
+
+def known_kind(url: str) -> str | None:
+    kind = _detected.get(url)
+    if kind is not None:
+        _detected.move_to_end(url)
+    return kind
@@ -14,29 +14,9 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         all_images = soup.find_all('img', src=True)
         
         for img in all_images:
-            img_src = urljoin(url, img['src'])
-            if img_src.startswith(('http://', 'https://')):
-                score = 0
-                # Check for relevant classes
-                if any(cls in img.get('class', []) for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
-                    score = 4  # Higher score
-                # Check for size attributes
-                elif img.get('width') and img.get('height'):
-                    width = parse_dimension(img['width'])
-                    height = parse_dimension(img['height'])
-                    if width and height:
-                        if width >= 2000 and height >= 1000:
-                            score = 3  # Medium score (very large images)
-                        elif width >= 1600 or height >= 800:
-                            score = 2  # Lower score
-                        elif width >= 800 or height >= 500:
-                            score = 1  # Lowest score
-                        elif width >= 500 or height >= 300:
-                            score = 0  # Lowest score
-                        else:
-                            continue  # Skip small images
-                
-                image_urls.append({'url': img_src, 'score': score})
+            image = score_image(url, img['src'], img.get('class', []), img.get('width'), img.get('height'))
+            if image is not None:
+                image_urls.append(image)
         
         # Sort images by score (highest first)
         sorted_images = sorted(image_urls, key=lambda x: x['score'], reverse=True)
@@ -47,6 +27,32 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         logging.error(f"Error in get_relevant_images: {e}")
         return []
 
+def score_image(url: str, src: str, classes: list, width: str | None, height: str | None) -> dict | None:
+    """Score one image by its classes or size attributes; None for skipped images"""
+    img_src = urljoin(url, src)
+    if not img_src.startswith(('http://', 'https://')):
+        return None
+    score = 0
+    # Check for relevant classes
+    if any(cls in classes for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
+        score = 4  # Higher score
+    # Check for size attributes
+    elif width and height:
+        width = parse_dimension(width)
+        height = parse_dimension(height)
+        if width and height:
+            if width >= 2000 and height >= 1000:
+                score = 3  # Medium score (very large images)
+            elif width >= 1600 or height >= 800:
+                score = 2  # Lower score
+            elif width >= 800 or height >= 500:
+                score = 1  # Lowest score
+            elif width >= 500 or height >= 300:
+                score = 0  # Lowest score
+            else:
+                return None  # Skip small images
+    return {'url': img_src, 'score': score}
+
 def parse_dimension(value: str) -> int:
     """Parse dimension value, handling px units"""
     if value.lower().endswith('px'):
@@ -1,16 +1,45 @@
+import logging
+
 from gpt_researcher.utils.workers import WorkerPool
 
 from ..actions.utils import stream_output
 from ..actions.web_scraping import scrape_urls
+from ..scraper.cache import ScrapeCache
+from ..scraper.dedup import NearDuplicateIndex
 from ..scraper.utils import get_image_hash
 
+logger = logging.getLogger(__name__)
+
 
 class BrowserManager:
     """Manages context for the researcher agent."""
 
     def __init__(self, researcher):
         self.researcher = researcher
-        self.worker_pool = WorkerPool(researcher.cfg.max_scraper_workers)
+        cfg = researcher.cfg
+        self.worker_pool = WorkerPool(
+            cfg.max_scraper_workers,
+            host_rate=cfg.scraper_host_rate,
+            host_burst=cfg.scraper_host_burst,
+            host_max_concurrency=cfg.scraper_host_max_concurrency,
+        )
+        self._scrape_cache: ScrapeCache | None = None
+        self._scrape_cache_opened = False
+        # Mirrors and reprints are dropped before they are chunked and embedded
+        self.near_duplicates = (
+            NearDuplicateIndex(cfg.scraper_dedup_threshold) if cfg.scraper_dedup_threshold else None
+        )
+
+    @property
+    def scrape_cache(self) -> ScrapeCache | None:
+        """The persistent scrape cache, opened on first use (None if disabled)."""
+        if not self._scrape_cache_opened:
+            self._scrape_cache_opened = True
+            try:
+                self._scrape_cache = ScrapeCache.from_config(self.researcher.cfg)
+            except Exception as e:
+                logger.warning(f"Scrape cache disabled: {e}")
+        return self._scrape_cache
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
@@ -20,7 +49,9 @@ class BrowserManager:
             urls (list[str]): list of URLs to scrape.
 
         Returns:
-            list[dict]: list of scraped content results.
+            list[dict]: list of scraped content results. Near-duplicate pages
+            are merged into one result that lists the other URLs in
+            `duplicate_urls`.
         """
         if self.researcher.verbose:
             await stream_output(
@@ -31,8 +62,13 @@ class BrowserManager:
             )
 
         scraped_content, images = await scrape_urls(
-            urls, self.researcher.cfg, self.worker_pool
+            urls, self.researcher.cfg, self.worker_pool, cache=self.scrape_cache
         )
+        duplicates = 0
+        if self.near_duplicates:
+            before = len(scraped_content)
+            scraped_content = self.near_duplicates.deduplicate(scraped_content)
+            duplicates = before - len(scraped_content)
         self.researcher.add_research_sources(scraped_content)
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
         self.researcher.add_research_images(new_images)
@@ -44,6 +80,24 @@ class BrowserManager:
                 f"📄 Scraped {len(scraped_content)} pages of content",
                 self.researcher.websocket,
             )
+            if self.scrape_cache:
+                stats = self.scrape_cache.stats()
+                await stream_output(
+                    "logs",
+                    "scrape_cache",
+                    f"♻️ Scrape cache: {stats['hits']} hits ({stats['revalidated']} revalidated), "
+                    f"{stats['misses']} misses",
+                    self.researcher.websocket,
+                )
+            if duplicates:
+                stats = self.near_duplicates.stats()
+                await stream_output(
+                    "logs",
+                    "scraping_duplicates",
+                    f"🧬 Merged {duplicates} near-duplicate pages "
+                    f"(~{stats['tokens_saved']} embedding tokens saved this run)",
+                    self.researcher.websocket,
+                )
             await stream_output(
                 "logs",
                 "scraping_images",
@@ -1,8 +1,12 @@
 import asyncio
+import os
 from typing import List, Dict, Optional, Set
 
-from ..context.compression import ContextCompressor, WrittenContentCompressor, VectorstoreCompressor
+from ..context.compression import WrittenContentCompressor, VectorstoreCompressor
+from ..context.index import ChunkIndex
 from ..actions.utils import stream_output
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
 
 
 class ContextManager:
@@ -10,6 +14,14 @@ class ContextManager:
 
     def __init__(self, researcher):
         self.researcher = researcher
+        self._chunk_index: ChunkIndex | None = None
+
+    @property
+    def chunk_index(self) -> ChunkIndex:
+        """Chunks and embeddings of every page seen in this run, shared by all sub-queries."""
+        if self._chunk_index is None:
+            self._chunk_index = ChunkIndex(self.researcher.memory.get_embeddings())
+        return self._chunk_index
 
     async def get_similar_content_by_query(self, query, pages):
         if self.researcher.verbose:
@@ -20,15 +32,17 @@ class ContextManager:
                 self.researcher.websocket,
             )
 
-        context_compressor = ContextCompressor(
-            documents=pages,
-            embeddings=self.researcher.memory.get_embeddings(),
-            prompt_family=self.researcher.prompt_family,
-            **self.researcher.kwargs
-        )
-        return await context_compressor.async_get_context(
-            query=query, max_results=10, cost_callback=self.researcher.add_costs
+        # Pages are split and embedded once per run; each query only embeds itself
+        new_chunks = await self.chunk_index.add_pages(pages)
+        if new_chunks:
+            self.researcher.add_costs(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=new_chunks))
+        relevant_docs = await self.chunk_index.search(
+            query,
+            k=10,
+            threshold=float(os.environ.get("SIMILARITY_THRESHOLD", 0.35)),
+            sources={page.get("url", "") for page in pages},
         )
+        return self.researcher.prompt_family.pretty_print_docs(relevant_docs)
 
     async def get_similar_content_by_query_with_vectorstore(self, query, filter):
         if self.researcher.verbose:
@@ -702,26 +702,37 @@ class ResearchConductor:
 
         return context
 
-    async def _get_new_urls(self, url_set_input):
-        """Gets the new urls from the given url set.
-        Args: url_set_input (set[str]): The url set to get the new urls from
-        Returns: list[str]: The new urls from the given url set
+    def _remaining_source_budget(self) -> int | None:
+        """Number of new URLs that may still be visited, or None if unlimited."""
+        if self.researcher.max_sources is None:
+            return None
+        return max(0, self.researcher.max_sources - len(self.researcher.visited_urls))
+
+    async def _get_new_urls(self, urls):
+        """Gets the new urls from the given urls, keeping their order.
+        Duplicates and visited urls are dropped before truncating to the
+        researcher's remaining max_sources budget, so the top-ranked urls are kept.
+        Args: urls (list[str]): The candidate urls, best first
+        Returns: list[str]: The new urls from the given urls
         """
 
-        new_urls = []
-        for url in url_set_input:
-            if url not in self.researcher.visited_urls:
-                self.researcher.visited_urls.add(url)
-                new_urls.append(url)
-                if self.researcher.verbose:
-                    await stream_output(
-                        "logs",
-                        "added_source_url",
-                        f"✅ Added source url to research: {url}\n",
-                        self.researcher.websocket,
-                        True,
-                        url,
-                    )
+        new_urls = [url for url in dict.fromkeys(urls) if url not in self.researcher.visited_urls]
+        remaining = self._remaining_source_budget()
+        if remaining is not None and len(new_urls) > remaining:
+            self.logger.info(f"Source limit of {self.researcher.max_sources} reached, skipping remaining URLs")
+            new_urls = new_urls[:remaining]
+
+        for url in new_urls:
+            self.researcher.visited_urls.add(url)
+            if self.researcher.verbose:
+                await stream_output(
+                    "logs",
+                    "added_source_url",
+                    f"✅ Added source url to research: {url}\n",
+                    self.researcher.websocket,
+                    True,
+                    url,
+                )
 
         return new_urls
 
@@ -903,7 +914,10 @@ class ResearchConductor:
             return []
             
         # Make sure we don't visit URLs we've already visited
-        new_urls = [url for url in urls if url not in self.researcher.visited_urls]
+        new_urls = [url for url in dict.fromkeys(urls) if url not in self.researcher.visited_urls]
+        remaining = self._remaining_source_budget()
+        if remaining is not None:
+            new_urls = new_urls[:remaining]
         
         # Return empty if no new URLs
         if not new_urls:
@@ -12,12 +12,39 @@ from gpt_researcher.llm_provider.generic.base import NO_SUPPORT_TEMPERATURE_MODE
 from ..prompts import PromptFamily
 from .costs import estimate_llm_cost
 from .validators import Subtopics
+import json
 import os
 
+# Provider instances reused across calls, keyed by provider and kwargs.
+# None means caching is disabled (the default); see enable_llm_provider_cache.
+_llm_provider_cache: dict[str, Any] | None = None
+
+
+def enable_llm_provider_cache(enabled: bool = True) -> None:
+    """Reuse LLM provider clients across calls with identical settings.
+
+    Intended for long-running processes (e.g. servers) that issue many
+    completions with the same models, so each call does not rebuild the
+    underlying LangChain chat model and its HTTP client.
+    """
+    global _llm_provider_cache
+    _llm_provider_cache = {} if enabled else None
+
 
 def get_llm(llm_provider, **kwargs):
     from gpt_researcher.llm_provider import GenericLLMProvider
-    return GenericLLMProvider.from_provider(llm_provider, **kwargs)
+
+    if _llm_provider_cache is None:
+        return GenericLLMProvider.from_provider(llm_provider, **kwargs)
+    try:
+        key = json.dumps([llm_provider, kwargs], sort_keys=True)
+    except TypeError:
+        return GenericLLMProvider.from_provider(llm_provider, **kwargs)
+    provider = _llm_provider_cache.get(key)
+    if provider is None:
+        provider = GenericLLMProvider.from_provider(llm_provider, **kwargs)
+        _llm_provider_cache[key] = provider
+    return provider
 
 
 async def create_chat_completion(
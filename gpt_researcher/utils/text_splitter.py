@@ -0,0 +1,138 @@
+"""
+Recursive text splitter working on offsets into the original text.
+
+Produces the same chunks as LangChain's
+`RecursiveCharacterTextSplitter(chunk_size, chunk_overlap)` with its
+default separators (separators kept at the start of the following piece,
+whitespace stripped), but tracks pieces as (start, end) offsets and only
+slices the text once per returned chunk. Character lengths come straight
+from the offsets; with a `length_function` (e.g. token counts) each piece
+is measured as LangChain does.
+"""
+
+from collections import deque
+from typing import Callable, Iterable
+
+from langchain_core.documents import Document
+
+from .costs import ENCODING_MODEL
+
+DEFAULT_SEPARATORS = ("\n\n", "\n", " ", "")
+
+Span = tuple[int, int]
+
+
+class TextSplitter:
+    """
+    Split text on the first of `separators` it contains, recursing into
+    pieces still longer than `chunk_size`, then merge neighbouring pieces
+    into chunks of at most `chunk_size` with up to `chunk_overlap` carried
+    over between chunks. Separators are matched literally; "" splits into
+    characters.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 100,
+        separators: Iterable[str] = DEFAULT_SEPARATORS,
+        length_function: Callable[[str], int] | None = None,
+    ):
+        if chunk_overlap > chunk_size:
+            raise ValueError(f"Chunk overlap ({chunk_overlap}) is larger than chunk size ({chunk_size})")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separators = tuple(separators)
+        self.length_function = length_function
+
+    @classmethod
+    def from_tiktoken(cls, encoding_name: str = ENCODING_MODEL, **kwargs) -> "TextSplitter":
+        """Splitter whose chunk size and overlap are measured in tokens."""
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(encoding_name)
+        return cls(length_function=lambda text: len(encoding.encode(text, disallowed_special=())), **kwargs)
+
+    def split_spans(self, text: str) -> list[Span]:
+        """(start, end) offsets of the chunks of `text`, in order."""
+        spans: list[Span] = []
+        self._split(text, 0, len(text), 0, spans)
+        return spans
+
+    def split_text(self, text: str) -> list[str]:
+        return [text[start:end] for start, end in self.split_spans(text)]
+
+    def split_documents(self, documents: Iterable[Document]) -> list[Document]:
+        """Split each document, copying its metadata onto every chunk."""
+        return [
+            Document(page_content=chunk, metadata=dict(document.metadata))
+            for document in documents
+            for chunk in self.split_text(document.page_content)
+        ]
+
+    def _pieces(self, text: str, start: int, end: int, separator: str) -> list[Span]:
+        if not separator:
+            return [(i, i + 1) for i in range(start, end)]
+        pieces, previous = [], start
+        position = text.find(separator, start, end)
+        while position != -1:
+            if position > previous:
+                pieces.append((previous, position))
+            previous = position
+            position = text.find(separator, position + len(separator), end)
+        if end > previous:
+            pieces.append((previous, end))
+        return pieces
+
+    def _split(self, text: str, start: int, end: int, level: int, out: list[Span]) -> None:
+        separator, next_level = self.separators[-1], None
+        for i in range(level, len(self.separators)):
+            candidate = self.separators[i]
+            if not candidate:
+                separator = candidate
+                break
+            if text.find(candidate, start, end) != -1:
+                separator = candidate
+                next_level = i + 1 if i + 1 < len(self.separators) else None
+                break
+
+        measure = self.length_function
+        good: list[tuple[int, int, int]] = []
+        for piece_start, piece_end in self._pieces(text, start, end, separator):
+            length = piece_end - piece_start if measure is None else measure(text[piece_start:piece_end])
+            if length < self.chunk_size:
+                good.append((piece_start, piece_end, length))
+                continue
+            if good:
+                self._merge(text, good, out)
+                good = []
+            if next_level is None:
+                out.append((piece_start, piece_end))
+            else:
+                self._split(text, piece_start, piece_end, next_level, out)
+        if good:
+            self._merge(text, good, out)
+
+    def _merge(self, text: str, pieces: list[tuple[int, int, int]], out: list[Span]) -> None:
+        current: deque[tuple[int, int, int]] = deque()
+        total = 0
+        for piece in pieces:
+            length = piece[2]
+            if total + length > self.chunk_size and current:
+                self._emit(text, current[0][0], current[-1][1], out)
+                while total > self.chunk_overlap or (total + length > self.chunk_size and total > 0):
+                    total -= current.popleft()[2]
+            current.append(piece)
+            total += length
+        if current:
+            self._emit(text, current[0][0], current[-1][1], out)
+
+    @staticmethod
+    def _emit(text: str, start: int, end: int, out: list[Span]) -> None:
+        # Strip whitespace by moving the offsets; drop all-whitespace chunks
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if end > start:
+            out.append((start, end))
@@ -1,15 +1,193 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from contextlib import asynccontextmanager
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, nullcontext
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Responses that mean "slow down"
+BACKOFF_STATUSES = {429, 503}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_process_executor: ProcessPoolExecutor | None = None
+
+
+def get_process_executor(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """
+    Return the process-wide extraction pool, starting it on first use.
+
+    Worker processes are expensive to start, so one pool is shared by every
+    WorkerPool (and therefore every researcher) in the process.
+    """
+    global _process_executor
+    if _process_executor is None:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        _process_executor = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 4,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_executor
+
+
+class HostSlot:
+    """
+    A granted request slot; callers record the response outcome on it.
+
+    `latency` should be the network time of the request (send to response
+    headers), not the time the slot was held, so slow parsing on our side
+    is not mistaken for an overloaded host.
+    """
+
+    def __init__(self):
+        self.status_code: int | None = None
+        self.retry_after: float | None = None
+        self.latency: float | None = None
+
+    def record(self, status_code: int | None, headers=None, latency: float | None = None) -> None:
+        self.status_code = status_code
+        self.latency = latency
+        if headers is not None:
+            self.retry_after = parse_retry_after(headers.get("retry-after"))
+
+
+class HostState:
+    """
+    Politeness state for one host: a token bucket plus an AIMD concurrency limit.
+
+    The limit grows by roughly one slot per window of successful responses
+    and is halved on 429/503 responses or spikes in the recorded request
+    latency; Retry-After pauses the host entirely.
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: int, initial_concurrency: int = 2):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.limit = float(min(initial_concurrency, max_concurrency))
+        self.tokens = float(burst)
+        self.active = 0
+        self.paused_until = 0.0
+        self.latency: float | None = None
+        self._updated = time.monotonic()
+        self._cond = asyncio.Condition()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.paused_until:
+                    delay = self.paused_until - now
+                elif self.tokens < 1:
+                    delay = (1 - self.tokens) / self.rate
+                elif self.active < int(self.limit):
+                    self.tokens -= 1
+                    self.active += 1
+                    return
+                else:
+                    delay = None  # wait for a release
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, slot: HostSlot, started: bool = True) -> None:
+        latency = slot.latency
+        async with self._cond:
+            self.active -= 1
+            if slot.status_code in BACKOFF_STATUSES:
+                self.limit = max(1.0, self.limit / 2)
+                self.paused_until = time.monotonic() + (slot.retry_after or 1.0)
+            elif not started:
+                pass  # cancelled before the request started
+            elif latency is not None and self.latency is not None and latency > 3 * self.latency:
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            if latency is not None:
+                # Exponentially weighted latency baseline
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            self._cond.notify_all()
 
 
 class WorkerPool:
-    def __init__(self, max_workers: int):
+    def __init__(
+        self,
+        max_workers: int,
+        parse_workers: int | None = None,
+        host_rate: float = 4.0,
+        host_burst: int = 4,
+        host_max_concurrency: int = 6,
+    ):
         self.max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.semaphore = asyncio.Semaphore(max_workers)
+        # HTML parsing is CPU-bound; keep it off the I/O worker threads
+        self.parse_workers = parse_workers or os.cpu_count() or 4
+        self.parse_executor = ThreadPoolExecutor(
+            max_workers=self.parse_workers,
+            thread_name_prefix="scraper-parse",
+        )
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.host_max_concurrency = host_max_concurrency
+        self.hosts: dict[str, HostState] = {}
+
+    @property
+    def process_executor(self) -> ProcessPoolExecutor:
+        """Process pool for CPU-heavy document extraction (shared process-wide)."""
+        return get_process_executor(self.parse_workers)
+
+    def host_state(self, url: str) -> HostState:
+        host = (urlparse(url).hostname or "").lower()
+        if host not in self.hosts:
+            self.hosts[host] = HostState(self.host_rate, self.host_burst, self.host_max_concurrency)
+        return self.hosts[host]
 
     @asynccontextmanager
-    async def throttle(self):
-        async with self.semaphore:
-            yield
+    async def throttle(self, url: str | None = None, uses_thread: bool = True):
+        """
+        Wait for a request slot.
+
+        With a `url`, the request is first scheduled on its host (token
+        bucket and adaptive concurrency), so a busy or rate-limited host
+        never holds a worker slot another host could use. `uses_thread`
+        additionally takes one of the `max_workers` thread slots.
+        Record the response, with its network latency, on the yielded
+        HostSlot to adapt the host's limit.
+        """
+        slot = HostSlot()
+        if url is None:
+            async with self.semaphore:
+                yield slot
+            return
+
+        host = self.host_state(url)
+        await host.acquire()
+        started = False
+        try:
+            async with self.semaphore if uses_thread else nullcontext():
+                started = True
+                yield slot
+        finally:
+            await host.release(slot, started)
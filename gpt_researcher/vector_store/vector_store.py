@@ -5,7 +5,8 @@ from typing import List, Dict
 
 from langchain.docstore.document import Document
 from langchain.vectorstores import VectorStore
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from ..utils.text_splitter import TextSplitter
 
 class VectorStoreWrapper:
     """
@@ -31,7 +32,7 @@ class VectorStoreWrapper:
         """
         Split documents into smaller chunks
         """
-        text_splitter = RecursiveCharacterTextSplitter(
+        text_splitter = TextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
         )
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-call GPT Researcher setup overhead.
+
+Compares building a fresh GPTResearcher per tool call (Config parsing,
+retrievers, embeddings client) against ResearcherFactory, and building a
+new LLM provider per completion against the warm provider cache.
+No API calls are made; dummy keys are used where none are configured.
+
+Usage:
+    python bench_researcher_factory.py [iterations]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("TAVILY_API_KEY", "tvly-benchmark")
+os.environ.setdefault("EMBEDDING", "openai:text-embedding-3-small")
+
+from gpt_researcher import GPTResearcher
+from gpt_researcher.utils import llm as llm_utils
+
+from clients import ResearcherFactory
+
+
+def per_call_ms(fn, iterations: int) -> float:
+    """Average wall-clock milliseconds per call of `fn`."""
+    fn()  # warm imports
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main(iterations: int = 200) -> None:
+    query = "What is the statute of limitations for breach of contract in California?"
+
+    before = per_call_ms(lambda: GPTResearcher(query=query, verbose=False), iterations)
+    factory = ResearcherFactory()
+    after = per_call_ms(lambda: factory.create(query=query, verbose=False), iterations)
+
+    provider_kwargs = {"model": "gpt-4o-mini", "temperature": 0.4, "max_tokens": 4000}
+    llm_utils.enable_llm_provider_cache(False)
+    llm_before = per_call_ms(lambda: llm_utils.get_llm("openai", **provider_kwargs), iterations)
+    llm_utils.enable_llm_provider_cache(True)
+    llm_after = per_call_ms(lambda: llm_utils.get_llm("openai", **provider_kwargs), iterations)
+
+    print(f"Iterations: {iterations}")
+    print(f"{'':24}{'before (ms)':>12}{'after (ms)':>12}{'speedup':>10}")
+    print(f"{'GPTResearcher setup':24}{before:12.3f}{after:12.3f}{before / after:9.1f}x")
+    print(f"{'LLM provider per call':24}{llm_before:12.3f}{llm_after:12.3f}{llm_before / llm_after:9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
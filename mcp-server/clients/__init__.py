@@ -4,31 +4,61 @@ API Client modules for Legal Intelligence Hub.
 This package contains client implementations for external services:
 - s3_client: AWS S3 upload functionality
 - gemini_client: Gemini CLI wrapper and File Search SDK
-
-Note: Court Listener client is imported from courtlistener-api/ package
-(reusing existing infrastructure instead of duplicating).
+- courtlistener_client: Pooled Court Listener REST client
+- response_cache: SQLite-backed on-disk response cache
+- researcher_factory: Server-scoped GPT Researcher factory
+- research_jobs: Background research job queue
 """
 
-from .s3_client import S3Client, S3UploadResult
+from .s3_client import (
+    S3Client,
+    S3UploadResult,
+    UploadArtifact,
+    S3ArtifactResult,
+    S3BundleResult,
+)
 from .gemini_client import (
     GeminiCLI,
     GeminiFileSearch,
     WebSearchResult,
     FileStoreResult,
     FileUploadResult,
+    BatchUploadResult,
     FileSearchResult,
     Citation,
 )
+from .response_cache import ResponseCache
+from .researcher_factory import ResearcherFactory
+from .research_jobs import JobStatus, ResearchJob, ResearchJobManager
+from .courtlistener_client import (
+    CourtListenerClient,
+    EndpointStats,
+    LatencyTracker,
+    extract_citations,
+)
 
 __all__ = [
     "S3Client",
     "S3UploadResult",
+    "UploadArtifact",
+    "S3ArtifactResult",
+    "S3BundleResult",
     "GeminiCLI",
     "GeminiFileSearch",
     "WebSearchResult",
     "FileStoreResult",
     "FileUploadResult",
+    "BatchUploadResult",
     "FileSearchResult",
     "Citation",
+    "CourtListenerClient",
+    "EndpointStats",
+    "LatencyTracker",
+    "extract_citations",
+    "ResponseCache",
+    "ResearcherFactory",
+    "JobStatus",
+    "ResearchJob",
+    "ResearchJobManager",
 ]
 
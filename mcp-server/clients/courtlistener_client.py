@@ -0,0 +1,467 @@
+"""
+Court Listener API client.
+
+Provides a pooled, keep-alive HTTP client that is shared by every Court
+Listener tool for the lifetime of the server, an optional on-disk response
+cache for opinions, citation lookups and searches, plus per-endpoint latency
+statistics reported through the health check.
+"""
+
+import asyncio
+import re
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+
+from config import CourtListenerConfig, config
+from .response_cache import ResponseCache
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+# Reporter citations such as "384 U.S. 436", "123 F.3d 456" or
+# "45 F. Supp. 2d 789": volume, abbreviated reporter, first page.
+_CITATION_RE = re.compile(
+    r"\b(\d{1,4})\s+([A-Z][A-Za-z]*\.(?:\s?(?:[A-Z][A-Za-z]*\.|\d(?:d|th)))*)\s+(\d{1,6})\b"
+)
+# Statutory and regulatory reporters are not resolvable to cases
+_NON_CASE_REPORTERS = ("U.S.C.", "C.F.R.")
+# Forms the local pattern misses but the server-side extractor may resolve:
+# "2019 WL 123456", "2019 U.S. Dist. LEXIS 12345", public-domain citations
+# such as "2020-Ohio-1234" or "2019 IL 123456", and "Id." short forms.
+_FALLBACK_RE = re.compile(
+    r"\b\d{4}\s+(?:[A-Z][A-Za-z.]*\s+)*?(?:WL|LEXIS)\s+\d+"
+    r"|\b\d{4}-[A-Z][A-Za-z]+-\d+"
+    r"|\b\d{4}\s+[A-Z]{2,4}\s+\d+"
+    r"|\b[Ii]d\.(?:\s+at\s+\d+)?"
+)
+# Characters of context kept on each side of a fallback match
+_FALLBACK_CONTEXT = 100
+
+
+def extract_citations(text: str) -> dict[str, str]:
+    """
+    Extract unique reporter citations from free text.
+
+    Returns:
+        Mapping of normalized citation to its first-seen display form,
+        in document order
+    """
+    found: dict[str, str] = {}
+    for match in _CITATION_RE.finditer(text):
+        volume, reporter, page = match.groups()
+        if reporter.replace(" ", "") in _NON_CASE_REPORTERS:
+            continue
+        display = f"{volume} {' '.join(reporter.split())} {page}"
+        found.setdefault(CourtListenerClient.normalize_citation(display), display)
+    return found
+
+
+def fallback_windows(text: str, context: int = _FALLBACK_CONTEXT) -> list[str]:
+    """
+    Short windows of text around citation forms the local pattern misses.
+
+    Overlapping windows are merged and locally recognized reporter
+    citations are removed from them, so only the surrounding text of the
+    fallback forms is sent to the server-side extractor rather than the
+    whole document.
+    """
+    spans: list[list[int]] = []
+    for match in _FALLBACK_RE.finditer(text):
+        start, end = max(0, match.start() - context), match.end() + context
+        if spans and start <= spans[-1][1]:
+            spans[-1][1] = end
+        else:
+            spans.append([start, end])
+    windows = (_CITATION_RE.sub("\n", text[start:end]).strip() for start, end in spans)
+    return [window for window in windows if window]
+
+
+def chunk_text(text: str, max_chars: int) -> list[str]:
+    """Split text on whitespace into chunks of at most `max_chars`."""
+    chunks = []
+    while len(text) > max_chars:
+        cut = text.rfind(" ", 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        chunks.append(text[:cut])
+        text = text[cut:].lstrip()
+    if text.strip():
+        chunks.append(text)
+    return chunks
+
+
+class EndpointStats(BaseModel):
+    """Latency statistics for a single Court Listener endpoint."""
+    calls: int
+    errors: int
+    avg_ms: float
+    min_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+
+
+class LatencyTracker:
+    """
+    Records per-endpoint call latencies.
+
+    Keeps running totals plus a bounded window of recent samples
+    for percentile estimates.
+    """
+
+    def __init__(self, window: int = 500):
+        self._window = window
+        self._calls: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self._total_ms: dict[str, float] = {}
+        self._min_ms: dict[str, float] = {}
+        self._max_ms: dict[str, float] = {}
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, endpoint: str, elapsed_ms: float, ok: bool = True) -> None:
+        """Record a single call to an endpoint."""
+        self._calls[endpoint] = self._calls.get(endpoint, 0) + 1
+        if not ok:
+            self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+        self._total_ms[endpoint] = self._total_ms.get(endpoint, 0.0) + elapsed_ms
+        self._min_ms[endpoint] = min(self._min_ms.get(endpoint, elapsed_ms), elapsed_ms)
+        self._max_ms[endpoint] = max(self._max_ms.get(endpoint, elapsed_ms), elapsed_ms)
+        self._samples.setdefault(endpoint, deque(maxlen=self._window)).append(elapsed_ms)
+
+    def snapshot(self) -> dict[str, EndpointStats]:
+        """Return current statistics for every endpoint seen so far."""
+        stats = {}
+        for endpoint, calls in self._calls.items():
+            samples = sorted(self._samples[endpoint])
+            stats[endpoint] = EndpointStats(
+                calls=calls,
+                errors=self._errors.get(endpoint, 0),
+                avg_ms=round(self._total_ms[endpoint] / calls, 2),
+                min_ms=round(self._min_ms[endpoint], 2),
+                max_ms=round(self._max_ms[endpoint], 2),
+                p50_ms=round(samples[len(samples) // 2], 2),
+                p95_ms=round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 2),
+            )
+        return stats
+
+
+class CourtListenerClient:
+    """
+    Pooled Court Listener client.
+
+    A single httpx.AsyncClient (HTTP/2 when available, keep-alive, bounded
+    connection pool) is created lazily and reused by all calls until
+    `aclose()` is invoked. A closed client transparently reopens on next use.
+
+    When a ResponseCache is supplied, `get_opinion`, `lookup_citation` and
+    `search` serve repeat lookups from disk without touching the API.
+    """
+
+    def __init__(
+        self,
+        settings: CourtListenerConfig | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        """
+        Initialize Court Listener client.
+
+        Args:
+            settings: Court Listener settings (defaults to config value)
+            cache: Optional response cache for opinions, citations and searches
+        """
+        settings = settings or config.court_listener
+        self.settings = settings
+        self.cache = cache
+        self.base_url = settings.base_url
+        self.token = settings.api_key
+        self.timeout = settings.timeout
+        self.headers = {
+            "Authorization": f"Token {self.token}" if self.token else "",
+        }
+        self.http2 = settings.http2 and _HTTP2_AVAILABLE
+        self.limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        )
+        self.latency = LatencyTracker()
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared pooled HTTP client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+
+    @staticmethod
+    def _endpoint_key(method: str, endpoint: str) -> str:
+        """Collapse numeric path segments so stats group by route."""
+        route = re.sub(r"/\d+(?=/|$)", "/{id}", endpoint)
+        return f"{method} {route}"
+
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        key = self._endpoint_key(method, endpoint)
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = await self.client.request(method, endpoint, **kwargs)
+            response.raise_for_status()
+            ok = True
+            return response.json()
+        finally:
+            self.latency.record(key, (time.perf_counter() - start) * 1000, ok=ok)
+
+    async def get(self, endpoint: str, params: dict | None = None) -> dict:
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        return await self._request("GET", endpoint, params=params)
+
+    async def post(self, endpoint: str, data: dict | None = None) -> dict:
+        return await self._request("POST", endpoint, data=data)
+
+    @staticmethod
+    def normalize_citation(citation: str) -> str:
+        """Normalize a citation string for cache keys (case, whitespace)."""
+        return " ".join(citation.split()).lower()
+
+    async def _cached(self, key: str, ttl: float, fetch) -> Any:
+        """Return a cached value for `key`, fetching and storing it on miss."""
+        if self.cache is not None:
+            cached = await self.cache.aget(key)
+            if cached is not None:
+                return cached
+        value = await fetch()
+        if self.cache is not None:
+            await self.cache.aset(key, value, ttl=ttl)
+        return value
+
+    async def get_opinion(self, opinion_id: int) -> dict:
+        """Fetch an opinion by ID (cached by opinion ID)."""
+        key = ResponseCache.make_key("opinion", int(opinion_id))
+        return await self._cached(
+            key, self.settings.cache_opinion_ttl,
+            lambda: self.get(f"/opinions/{opinion_id}/"),
+        )
+
+    async def lookup_citation(self, citation: str) -> list:
+        """Resolve citations in `citation` text (cached by normalized text)."""
+        key = ResponseCache.make_key("citation", self.normalize_citation(citation))
+
+        async def fetch() -> list:
+            result = await self.post("/citation-lookup/", data={"text": citation})
+            return result if isinstance(result, list) else [result]
+
+        return await self._cached(key, self.settings.cache_citation_ttl, fetch)
+
+    async def resolve_citations_bulk(
+        self,
+        text: str,
+        concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Resolve every citation in a document with as few API calls as possible.
+
+        Citations are extracted and deduplicated locally, served from the cache
+        where possible, and the remainder packed into request-sized batches that
+        are sent concurrently. Each resolved citation is cached individually so
+        later `lookup_citation` calls hit the cache too. Short windows around
+        Westlaw, Lexis, public-domain and "Id." forms are sent as well, so the
+        server-side extractor resolves the citations the local pattern misses.
+
+        Args:
+            text: Document text (any length)
+            concurrency: Max in-flight requests (defaults to config value)
+
+        Returns:
+            Dictionary with 'citations' (citation -> lookup result), 'unresolved',
+            and request/cache counters
+        """
+        if concurrency is None:
+            concurrency = self.settings.bulk_concurrency
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        max_chars = self.settings.citation_lookup_max_chars
+        max_citations = self.settings.citation_lookup_max_citations
+        unique = extract_citations(text)
+
+        resolved: dict[str, Any] = {}
+        pending: list[str] = []
+        cached_items = [None] * len(unique)
+        if self.cache is not None:
+            cached_items = await self.cache.aget_many(
+                [ResponseCache.make_key("citation", normalized) for normalized in unique]
+            )
+        for display, cached in zip(unique.values(), cached_items):
+            if cached:
+                resolved[display] = cached[0]
+            else:
+                pending.append(display)
+
+        batches: list[str] = []
+        batch: list[str] = []
+        size = 0
+        for citation in pending:
+            if batch and (size + len(citation) + 1 > max_chars or len(batch) >= max_citations):
+                batches.append("\n".join(batch))
+                batch, size = [], 0
+            batch.append(citation)
+            size += len(citation) + 1
+        if batch:
+            batches.append("\n".join(batch))
+        windows = [chunk for window in fallback_windows(text) for chunk in chunk_text(window, max_chars)]
+        batch, size = [], 0
+        for window in windows:
+            if batch and size + len(window) + 1 > max_chars:
+                batches.append("\n".join(batch))
+                batch, size = [], 0
+            batch.append(window)
+            size += len(window) + 1
+        if batch:
+            batches.append("\n".join(batch))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(batch_text: str) -> list:
+            async with semaphore:
+                result = await self.post("/citation-lookup/", data={"text": batch_text})
+                return result if isinstance(result, list) else [result]
+
+        results = await asyncio.gather(*(send(b) for b in batches), return_exceptions=True)
+
+        errors = []
+        to_cache = []
+        for batch_text, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                errors.append(str(result))
+                continue
+            for item in result:
+                citation = item.get("citation")
+                if not citation:
+                    continue
+                normalized = self.normalize_citation(citation)
+                display = unique.get(normalized, " ".join(citation.split()))
+                resolved.setdefault(display, item)
+                if item.get("status") == 200:
+                    to_cache.append((ResponseCache.make_key("citation", normalized), [item]))
+        if self.cache is not None and to_cache:
+            await self.cache.aset_many(to_cache, ttl=self.settings.cache_citation_ttl)
+
+        unresolved = [
+            citation for citation, item in resolved.items() if item.get("status") != 200
+        ] + [display for display in unique.values() if display not in resolved]
+
+        return {
+            "citations": resolved,
+            "unresolved": unresolved,
+            "unique_citations": len(set(unique.values()) | set(resolved)),
+            "cache_hits": len(unique) - len(pending),
+            "requests": len(batches),
+            "errors": errors,
+        }
+
+    async def search(self, params: dict) -> dict:
+        """Run a search query (cached by its non-empty parameters)."""
+        params = {k: v for k, v in params.items() if v is not None}
+        key = ResponseCache.make_key("search", params)
+        return await self._cached(
+            key, self.settings.cache_search_ttl,
+            lambda: self.get("/search/", params),
+        )
+
+    async def iter_search(
+        self,
+        params: dict,
+        max_results: int | None = None,
+        prefetch: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream search results across pages, following `next` cursors.
+
+        A background task fetches pages ahead of the consumer (up to
+        `prefetch` pages buffered), so callers can process page 1 while
+        later pages are still in flight. Results are deduplicated by
+        cluster ID. Each page goes through `search` and is cached.
+
+        Args:
+            params: Search parameters for the first page
+            max_results: Stop after yielding this many unique results
+            prefetch: Pages fetched ahead of the consumer (defaults to config)
+
+        Yields:
+            Individual search result dictionaries
+        """
+        prefetch = prefetch or self.settings.search_prefetch_pages
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+
+        async def produce() -> None:
+            page_params = dict(params)
+            try:
+                while True:
+                    page = await self.search(page_params)
+                    await queue.put(page)
+                    next_url = page.get("next")
+                    if not next_url:
+                        break
+                    page_params = dict(httpx.URL(next_url).params)
+            except Exception as e:
+                await queue.put(e)
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        seen: set = set()
+        yielded = 0
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                for result in page.get("results", []):
+                    key = result.get("cluster_id") or result.get("id")
+                    if key is not None:
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    yield result
+                    yielded += 1
+                    if max_results is not None and yielded >= max_results:
+                        return
+        finally:
+            producer.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """Return connection settings and per-endpoint latency stats."""
+        return {
+            "http2": self.http2,
+            "pool_open": self._client is not None and not self._client.is_closed,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "endpoints": {k: v.model_dump() for k, v in self.latency.snapshot().items()},
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections.
+
+        The response cache stays open; it is safe to reuse across sessions.
+        """
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
@@ -7,7 +7,12 @@ Provides:
 """
 
 import asyncio
+import glob
+import hashlib
 import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from typing import Any
 from pathlib import Path
 
@@ -34,6 +39,56 @@ class FileUploadResult(BaseModel):
     file_id: str
     file_name: str
     status: str
+    sha256: str | None = None
+    error: str | None = None
+
+
+class BatchUploadResult(BaseModel):
+    """Result from uploading many files to one store."""
+    store_name: str
+    uploaded: int
+    skipped: int
+    failed: int
+    files: list[FileUploadResult]
+
+    @classmethod
+    def from_files(cls, store_name: str, files: list[FileUploadResult]) -> "BatchUploadResult":
+        """Summarize per-file results."""
+        return cls(
+            store_name=store_name,
+            uploaded=sum(f.status == "completed" for f in files),
+            skipped=sum(f.status == "skipped" for f in files),
+            failed=sum(f.status == "failed" for f in files),
+            files=files,
+        )
+
+
+def hash_file(path: str | Path) -> str:
+    """SHA-256 of a file's contents, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def resolve_upload_paths(path_or_glob: str) -> list[Path]:
+    """
+    Expand a file, directory or glob pattern into a sorted list of files.
+
+    Directories are walked recursively; hidden files are skipped.
+    """
+    path = Path(path_or_glob).expanduser()
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        candidates = path.rglob("*")
+    else:
+        candidates = (Path(p) for p in glob.glob(str(path), recursive=True))
+    return sorted(
+        p for p in candidates
+        if p.is_file() and not p.name.startswith(".")
+    )
 
 
 class Citation(BaseModel):
@@ -96,7 +151,9 @@ class GeminiFileSearch:
     Wrapper for Gemini File Search API (RAG).
     
     Uses the google-genai SDK to create file stores, upload documents,
-    and perform semantic search queries.
+    and perform semantic search queries. Intended to be shared for the
+    server's lifetime: it caches store display name to resource name
+    mappings and memoizes identical queries for a short TTL.
     """
     
     def __init__(self, api_key: str | None = None):
@@ -112,25 +169,53 @@ class GeminiFileSearch:
         else:
             # Will use default credentials if available
             self.client = genai.Client()
-    
-    async def create_store(self, name: str) -> FileStoreResult:
+        self._store_names: dict[str, str] = {}
+        self._query_memo: OrderedDict[tuple[str, str, str], tuple[float, FileSearchResult]] = OrderedDict()
+        self.query_hits = 0
+        self.query_misses = 0
+
+    async def resolve_store(self, store_name: str) -> str:
+        """
+        Resolve a store display name to its resource name.
+
+        Resource names (fileSearchStores/...) pass through unchanged. Unknown
+        display names refresh the cache from a single list call.
+
+        Raises:
+            KeyError: If no store has that display name
+        """
+        if store_name.startswith("fileSearchStores/"):
+            return store_name
+        if store_name not in self._store_names:
+            pager = await self.client.aio.file_search_stores.list()
+            async for store in pager:
+                if store.display_name:
+                    self._store_names[store.display_name] = store.name
+        if store_name not in self._store_names:
+            raise KeyError(f"Unknown file store: {store_name}")
+        return self._store_names[store_name]
+
+    def _invalidate_queries(self, store_name: str) -> None:
+        """Drop memoized answers for a store whose contents changed."""
+        for key in [k for k in self._query_memo if k[0] == store_name]:
+            del self._query_memo[key]
+
+    async def create_store(self, name: str, display_name: str | None = None) -> FileStoreResult:
         """
         Create a new file search store.
         
         Args:
             name: Display name for the store
+            display_name: Overrides `name` as the display name
             
         Returns:
             FileStoreResult with store_name and store_id
         """
-        # Run in executor since SDK may be blocking
-        loop = asyncio.get_event_loop()
-        store = await loop.run_in_executor(
-            None,
-            lambda: self.client.file_search_stores.create(
-                config={"display_name": name}
-            )
+        display_name = display_name or name
+        store = await self.client.aio.file_search_stores.create(
+            config={"display_name": display_name}
         )
+        self._store_names[display_name] = store.name
         
         # Extract ID from store name (format: fileSearchStores/{id})
         store_id = store.name.split("/")[-1] if "/" in store.name else store.name
@@ -140,19 +225,55 @@ class GeminiFileSearch:
             store_id=store_id,
         )
     
+    async def _wait_for_operation(self, operation: Any) -> Any:
+        """
+        Poll a long-running operation until it is done.
+
+        Polls with the async client and exponential backoff, so waiting
+        uploads do not hold executor threads.
+
+        Raises:
+            TimeoutError: If the operation does not finish in time
+            RuntimeError: If the operation reports an error
+        """
+        settings = config.gemini
+        interval = settings.operation_poll_interval
+        deadline = time.monotonic() + settings.upload_timeout
+        while not operation.done:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Operation {operation.name} did not finish in {settings.upload_timeout}s")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, settings.operation_poll_max_interval)
+            operation = await self.client.aio.operations.get(operation)
+        if operation.error:
+            raise RuntimeError(f"Operation {operation.name} failed: {operation.error}")
+        return operation
+
+    async def existing_hashes(self, store_name: str) -> set[str]:
+        """Content hashes of documents already in a store."""
+        hashes = set()
+        pager = await self.client.aio.file_search_stores.documents.list(parent=store_name)
+        async for document in pager:
+            for meta in document.custom_metadata or []:
+                if meta.key == "sha256" and meta.string_value:
+                    hashes.add(meta.string_value)
+        return hashes
+
     async def upload(
         self,
         store_name: str,
         file_path: str,
         display_name: str | None = None,
+        sha256: str | None = None,
     ) -> FileUploadResult:
         """
         Upload a document to a file search store.
         
         Args:
-            store_name: File search store resource name
+            store_name: File search store resource or display name
             file_path: Local path to file to upload
             display_name: Optional display name for the file
+            sha256: Precomputed content hash (computed if not provided)
             
         Returns:
             FileUploadResult with file_id, file_name, status
@@ -161,27 +282,98 @@ class GeminiFileSearch:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        store_name = await self.resolve_store(store_name)
         name = display_name or path.name
-        
-        loop = asyncio.get_event_loop()
-        operation = await loop.run_in_executor(
-            None,
-            lambda: self.client.file_search_stores.upload_to_file_search_store(
-                file=str(path),
-                file_search_store_name=store_name,
-                config={"display_name": name}
-            )
-        )
+        sha256 = sha256 or await asyncio.to_thread(hash_file, path)
 
-        # Wait for operation to complete
-        result = await loop.run_in_executor(None, operation.result)
+        operation = await self.client.aio.file_search_stores.upload_to_file_search_store(
+            file=str(path),
+            file_search_store_name=store_name,
+            config={
+                "display_name": name,
+                # Recorded so later batch uploads can skip unchanged files
+                "custom_metadata": [{"key": "sha256", "string_value": sha256}],
+            },
+        )
+        operation = await self._wait_for_operation(operation)
+        self._invalidate_queries(store_name)
+        response = operation.response
 
         return FileUploadResult(
-            file_id=getattr(result, "name", "unknown"),
+            file_id=getattr(response, "document_name", None) or "unknown",
             file_name=name,
             status="completed",
+            sha256=sha256,
         )
 
+    async def iter_upload_batch(
+        self,
+        store_name: str,
+        path_or_glob: str,
+        max_concurrency: int | None = None,
+        skip_existing: bool = True,
+    ) -> AsyncIterator[FileUploadResult]:
+        """
+        Upload every file matched by a directory or glob pattern.
+
+        Uploads run concurrently up to `max_concurrency`, and results are
+        yielded as each file finishes. Files whose content hash is already
+        in the store, or repeated within the batch, are skipped.
+
+        Args:
+            store_name: File search store resource or display name
+            path_or_glob: File, directory (recursive) or glob pattern
+            max_concurrency: Concurrent uploads (defaults to config value)
+            skip_existing: Skip files already present in the store
+
+        Yields:
+            FileUploadResult per file with status completed, skipped or failed
+        """
+        paths = resolve_upload_paths(path_or_glob)
+        if not paths:
+            raise FileNotFoundError(f"No files match: {path_or_glob}")
+
+        store_name = await self.resolve_store(store_name)
+        seen = await self.existing_hashes(store_name) if skip_existing else set()
+        semaphore = asyncio.Semaphore(max_concurrency or config.gemini.upload_concurrency)
+
+        async def upload_one(path: Path) -> FileUploadResult:
+            sha256 = None
+            try:
+                sha256 = await asyncio.to_thread(hash_file, path)
+                if skip_existing and sha256 in seen:
+                    return FileUploadResult(file_id="", file_name=path.name, status="skipped", sha256=sha256)
+                seen.add(sha256)
+                async with semaphore:
+                    return await self.upload(store_name, str(path), sha256=sha256)
+            except Exception as e:
+                return FileUploadResult(
+                    file_id="", file_name=path.name, status="failed", sha256=sha256, error=str(e),
+                )
+
+        tasks = [asyncio.create_task(upload_one(path)) for path in paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def upload_batch(
+        self,
+        store_name: str,
+        path_or_glob: str,
+        max_concurrency: int | None = None,
+        skip_existing: bool = True,
+    ) -> BatchUploadResult:
+        """Upload a directory or glob of files and summarize the outcome."""
+        files = [
+            result async for result in self.iter_upload_batch(
+                store_name, path_or_glob, max_concurrency, skip_existing,
+            )
+        ]
+        return BatchUploadResult.from_files(store_name, files)
+
     async def query(
         self,
         store_name: str,
@@ -191,14 +383,35 @@ class GeminiFileSearch:
         """
         Query documents in a file search store using semantic RAG.
 
+        Identical queries against the same store and model are answered
+        from a memo for GEMINI_QUERY_CACHE_TTL seconds.
+
         Args:
-            store_name: File search store resource name
+            store_name: File search store resource or display name
             query: Natural language query
             model: Gemini model to use for generation
 
         Returns:
             FileSearchResult with answer and citations
         """
+        store_name = await self.resolve_store(store_name)
+        key = (store_name, query.strip(), model)
+        cached = self._query_memo.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._query_memo.move_to_end(key)
+            self.query_hits += 1
+            return cached[1]
+
+        self.query_misses += 1
+        result = await self._generate(store_name, query, model)
+        if config.gemini.query_cache_ttl > 0:
+            self._query_memo[key] = (time.monotonic() + config.gemini.query_cache_ttl, result)
+            while len(self._query_memo) > config.gemini.query_cache_size:
+                self._query_memo.popitem(last=False)
+        return result
+
+    async def _generate(self, store_name: str, query: str, model: str) -> FileSearchResult:
+        """Run a file search grounded generation request."""
         loop = asyncio.get_event_loop()
 
         # Build the request with file search tool
@@ -239,3 +452,12 @@ class GeminiFileSearch:
             answer=answer,
             citations=citations,
         )
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache usage for the health check."""
+        return {
+            "known_stores": len(self._store_names),
+            "query_memo_size": len(self._query_memo),
+            "query_hits": self.query_hits,
+            "query_misses": self.query_misses,
+        }
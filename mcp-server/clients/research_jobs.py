@@ -0,0 +1,238 @@
+"""
+Background research jobs.
+
+Runs long GPT Researcher tasks on a bounded worker queue so MCP calls can
+return immediately and clients poll for progress and results instead of
+holding a request open for minutes.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a research job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+class JobProgressSink:
+    """
+    WebSocket stand-in handed to GPTResearcher.
+
+    GPTResearcher reports progress through `stream_output`, which calls
+    `send_json` on its websocket; log events are recorded on the job.
+    """
+
+    def __init__(self, job: "ResearchJob"):
+        self.job = job
+
+    async def send_json(self, data: dict[str, Any]) -> None:
+        if data.get("type") == "logs":
+            self.job.add_event(data.get("content", ""), data.get("output", ""))
+
+
+class ResearchJob:
+    """State of a single background research job."""
+
+    def __init__(self, key: str, query: str, params: dict[str, Any], max_events: int = 500):
+        self.id = uuid.uuid4().hex[:12]
+        self.key = key
+        self.query = query
+        self.params = params
+        self.status = JobStatus.QUEUED
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.result: dict[str, Any] | None = None
+        self.error: str | None = None
+        self.events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self.event_count = 0
+        self.task: asyncio.Task | None = None
+
+    def add_event(self, step: str, message: str) -> None:
+        """Record a progress event."""
+        self.event_count += 1
+        self.events.append({"seq": self.event_count, "step": step, "message": message, "time": time.time()})
+
+    def status_dict(self, since: int = 0) -> dict[str, Any]:
+        """Status summary with progress events newer than `since`."""
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.id,
+            "query": self.query,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "elapsed_seconds": round(end - (self.started_at or end), 1),
+            "event_count": self.event_count,
+            "events": [e for e in self.events if e["seq"] > since],
+            "error": self.error,
+        }
+
+
+class ResearchJobManager:
+    """
+    Bounded queue of background research jobs.
+
+    Identical requests (same normalized query and parameters) that are
+    queued, running or recently completed share one job. Finished jobs are
+    kept for `result_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        run: Callable[..., Awaitable[dict[str, Any]]],
+        max_workers: int = 2,
+        max_queue: int = 50,
+        result_ttl: float = 3600,
+    ):
+        """
+        Initialize the job manager.
+
+        Args:
+            run: Coroutine function called as run(query, sink=..., **params)
+            max_workers: Jobs executed concurrently
+            max_queue: Jobs that may wait for a worker
+            result_ttl: Seconds finished jobs are retained
+        """
+        self.run = run
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+        self.jobs: dict[str, ResearchJob] = {}
+        self._by_key: dict[str, str] = {}
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+
+    @staticmethod
+    def make_key(query: str, params: dict[str, Any]) -> str:
+        """Deduplication key: normalized query plus sorted parameters."""
+        normalized = " ".join(query.lower().split())
+        return f"{normalized}|{sorted(params.items())}"
+
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.max_workers:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.status != JobStatus.QUEUED:
+                    continue
+                job.task = asyncio.create_task(self._execute(job))
+                try:
+                    await job.task
+                except asyncio.CancelledError:
+                    # Re-raise only if this worker itself is being stopped,
+                    # not when the job alone was cancelled.
+                    if asyncio.current_task().cancelling():
+                        raise
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, job: ResearchJob) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = await self.run(job.query, sink=JobProgressSink(job), **job.params)
+            job.status = JobStatus.COMPLETED
+        except asyncio.CancelledError:
+            job.status = JobStatus.CANCELLED
+            raise
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self) -> None:
+        """Drop finished jobs older than the result TTL."""
+        now = time.time()
+        for job_id, job in list(self.jobs.items()):
+            if job.status in FINISHED_STATUSES and job.finished_at and now - job.finished_at > self.result_ttl:
+                del self.jobs[job_id]
+                if self._by_key.get(job.key) == job_id:
+                    del self._by_key[job.key]
+
+    async def start(self, query: str, **params: Any) -> tuple[ResearchJob, bool]:
+        """
+        Queue a research job, or return the existing job for the same request.
+
+        Returns:
+            (job, created) where created is False for a deduplicated request
+
+        Raises:
+            RuntimeError: If the queue is full
+        """
+        self._prune()
+        self._ensure_workers()
+        key = self.make_key(query, params)
+        existing = self.jobs.get(self._by_key.get(key, ""))
+        if existing and existing.status not in (JobStatus.FAILED, JobStatus.CANCELLED):
+            return existing, False
+
+        job = ResearchJob(key, query, params)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise RuntimeError(f"Research queue is full ({self.max_queue} jobs waiting); try again later")
+        self.jobs[job.id] = job
+        self._by_key[key] = job.id
+        return job, True
+
+    def get(self, job_id: str) -> ResearchJob:
+        """Return a job by ID.
+
+        Raises:
+            KeyError: If the job does not exist or has expired
+        """
+        self._prune()
+        if job_id not in self.jobs:
+            raise KeyError(f"Unknown or expired research job: {job_id}")
+        return self.jobs[job_id]
+
+    def cancel(self, job_id: str) -> ResearchJob:
+        """Cancel a queued or running job."""
+        job = self.get(job_id)
+        if job.status == JobStatus.QUEUED:
+            job.status = JobStatus.CANCELLED
+            job.finished_at = time.time()
+        elif job.status == JobStatus.RUNNING and job.task is not None:
+            job.task.cancel()
+        return job
+
+    def stats(self) -> dict[str, Any]:
+        """Return job counts by status for the health check."""
+        counts = {status.value: 0 for status in JobStatus}
+        for job in self.jobs.values():
+            counts[job.status.value] += 1
+        return {
+            "max_workers": self.max_workers,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "jobs": counts,
+        }
+
+    async def aclose(self) -> None:
+        """Cancel running jobs and stop the workers."""
+        for job in self.jobs.values():
+            if job.task is not None and not job.task.done():
+                job.task.cancel()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
@@ -0,0 +1,124 @@
+"""
+Server-scoped GPT Researcher factory.
+
+Parses the GPT Researcher configuration and builds the embeddings client
+once, keeps LLM provider clients warm across calls, and creates only the
+per-request GPTResearcher state for each tool invocation. Also provides a
+retriever-only fast search path that skips planning, scraping and embedding.
+"""
+
+import asyncio
+from typing import Any
+
+from gpt_researcher import GPTResearcher
+from gpt_researcher.actions import get_retrievers
+from gpt_researcher.config import Config
+from gpt_researcher.memory import Memory
+from gpt_researcher.utils.llm import enable_llm_provider_cache
+
+
+class ResearcherFactory:
+    """
+    Creates GPTResearcher instances that share immutable, expensive state.
+
+    The Config and Memory (embeddings client) are built lazily on first use
+    and reused by every researcher; each researcher receives a shallow copy
+    of the config so per-request changes stay isolated.
+    """
+
+    def __init__(self, config_path: str | None = None, warm_llm_providers: bool = True):
+        """
+        Initialize the factory.
+
+        Args:
+            config_path: Optional GPT Researcher config file
+            warm_llm_providers: Reuse LLM provider clients across calls
+        """
+        self.config_path = config_path
+        self._config: Config | None = None
+        self._memory: Memory | None = None
+        self.researchers_created = 0
+        if warm_llm_providers:
+            enable_llm_provider_cache()
+
+    @property
+    def config(self) -> Config:
+        """The shared, parsed GPT Researcher configuration."""
+        if self._config is None:
+            self._config = Config(self.config_path)
+        return self._config
+
+    @property
+    def memory(self) -> Memory:
+        """The shared embeddings client."""
+        if self._memory is None:
+            cfg = self.config
+            self._memory = Memory.from_config(cfg)
+        return self._memory
+
+    def create(self, query: str, report_type: str = "research_report", **kwargs: Any) -> GPTResearcher:
+        """
+        Create a researcher for a single request.
+
+        Args:
+            query: Research query
+            report_type: GPT Researcher report type
+            **kwargs: Additional GPTResearcher arguments
+
+        Returns:
+            GPTResearcher sharing this factory's config and memory
+        """
+        self.researchers_created += 1
+        return GPTResearcher(
+            query=query,
+            report_type=report_type,
+            config=self.config,
+            memory=self.memory,
+            **kwargs,
+        )
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        snippets_only: bool = True,
+        snippet_chars: int = 500,
+    ) -> list[dict[str, Any]]:
+        """
+        Run the configured web retriever directly, without LLM planning or scraping.
+
+        Args:
+            query: Search query
+            max_results: Maximum results to return
+            snippets_only: Return only title, href and a truncated body
+            snippet_chars: Body length kept when snippets_only is set
+
+        Returns:
+            List of retriever results ({'title', 'href', 'body', ...})
+        """
+        retrievers = [
+            r for r in get_retrievers({}, self.config)
+            if "mcpretriever" not in r.__name__.lower()
+        ]
+        if not retrievers:
+            return []
+        retriever = retrievers[0](query)
+        results = await asyncio.to_thread(retriever.search, max_results=max_results)
+        results = (results or [])[:max_results]
+        if snippets_only:
+            results = [
+                {
+                    "title": r.get("title", ""),
+                    "href": r.get("href", ""),
+                    "body": (r.get("body") or "")[:snippet_chars],
+                }
+                for r in results
+            ]
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        """Return factory usage for the health check."""
+        return {
+            "warm": self._config is not None,
+            "researchers_created": self.researchers_created,
+        }
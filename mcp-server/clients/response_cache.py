@@ -0,0 +1,221 @@
+"""
+Persistent on-disk response cache.
+
+SQLite-backed, content-addressed cache for JSON API responses with
+per-entry TTLs and size-bounded LRU eviction. Values are stored as
+zlib-compressed JSON blobs. The `a*` methods run the blocking SQLite
+calls in a worker thread so they can be awaited on the event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+# Access times and expiry deletions recorded by reads are written in
+# batches of this many
+_PENDING_BATCH = 256
+
+
+class ResponseCache:
+    """
+    Content-addressed response cache stored in a single SQLite file.
+
+    Keys are SHA-256 digests of a namespace plus canonical JSON of the
+    lookup parts, so equivalent requests always map to the same entry.
+    When the stored size exceeds `max_bytes`, least recently used entries
+    are evicted first. Reads never commit: access times and deletions of
+    expired entries are buffered and written with the next store, the
+    next `stats` call, or every `_PENDING_BATCH` reads.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Open (or create) a cache database.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+            max_bytes: Upper bound on total compressed value size
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self._touched: dict[str, float] = {}
+        self._expired: dict[str, int] = {}
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    @staticmethod
+    def make_key(namespace: str, *parts: Any) -> str:
+        """Build a content-addressed key from a namespace and lookup parts."""
+        payload = json.dumps([namespace, *parts], sort_keys=True, separators=(",", ":"), default=str)
+        return f"{namespace}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for `key`, or None on miss/expiry."""
+        namespace = key.split(":", 1)[0]
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, expires FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[2] is not None and row[2] <= now:
+                self._expired[key] = row[1]
+                row = None
+            else:
+                self._touched[key] = now
+            if len(self._touched) + len(self._expired) >= _PENDING_BATCH:
+                self._flush_pending()
+                self._conn.commit()
+            if row is None:
+                self.misses[namespace] = self.misses.get(namespace, 0) + 1
+                return None
+            self.hits[namespace] = self.hits.get(namespace, 0) + 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def get_many(self, keys: list[str]) -> list[Any | None]:
+        """`get` for each of `keys`, in order."""
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            key: Key from `make_key`
+            value: JSON-serializable response
+            ttl: Seconds until expiry (None or <= 0 never expires)
+        """
+        self.set_many([(key, value)], ttl=ttl)
+
+    def set_many(self, items: list[tuple[str, Any]], ttl: float | None = None) -> None:
+        """Store several (key, value) pairs with one commit."""
+        blobs = [
+            (key, zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8")))
+            for key, value in items
+        ]
+        now = time.time()
+        expires = now + ttl if ttl and ttl > 0 else None
+        with self._lock:
+            for key, blob in blobs:
+                if len(blob) > self.max_bytes:
+                    continue
+                old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, namespace, value, size, expires, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, key.split(":", 1)[0], blob, len(blob), expires, now),
+                )
+                self._touched.pop(key, None)
+                self._expired.pop(key, None)
+                self._size += len(blob) - (old[0] if old else 0)
+            self._flush_pending()
+            self._evict()
+            self._conn.commit()
+
+    async def aget(self, key: str) -> Any | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aget_many(self, keys: list[str]) -> list[Any | None]:
+        return await asyncio.to_thread(self.get_many, keys)
+
+    async def aset(self, key: str, value: Any, ttl: float | None = None) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    async def aset_many(self, items: list[tuple[str, Any]], ttl: float | None = None) -> None:
+        await asyncio.to_thread(self.set_many, items, ttl)
+
+    def _flush_pending(self) -> None:
+        """Write buffered reads' updates (caller holds the lock and commits)."""
+        if self._expired:
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in self._expired])
+            self._size -= sum(self._expired.values())
+            self._expired.clear()
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE entries SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then LRU entries, until under `max_bytes`."""
+        if self._size <= self.max_bytes:
+            return
+        self._conn.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        while self._size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed ASC LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._size -= size
+                if self._size <= self.max_bytes:
+                    break
+
+    def clear(self) -> None:
+        """Remove every entry and reset counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._touched.clear()
+            self._expired.clear()
+            self._size = 0
+            self.hits.clear()
+            self.misses.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and storage usage."""
+        with self._lock:
+            self._flush_pending()
+            self._conn.commit()
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        hits = sum(self.hits.values())
+        misses = sum(self.misses.values())
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "by_namespace": {
+                ns: {"hits": self.hits.get(ns, 0), "misses": self.misses.get(ns, 0)}
+                for ns in sorted(set(self.hits) | set(self.misses))
+            },
+        }
+
+    def close(self) -> None:
+        """Write buffered updates and close the database connection."""
+        with self._lock:
+            self._flush_pending()
+            self._conn.commit()
+            self._conn.close()
@@ -1,20 +1,37 @@
 """
 AWS S3 Client for uploading research reports.
 
-Provides async-compatible S3 upload functionality with auto-key generation.
+Provides async-compatible S3 upload functionality with auto-key generation,
+and concurrent multi-artifact (md/pdf/docx) bundle uploads on a dedicated
+bounded thread pool using multipart transfers for large files.
 """
 
 import asyncio
+import gzip
+import io
+import mimetypes
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 from functools import partial
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
 from config import config
 
+# Part uploads in flight across the whole upload pool
+_MAX_CONCURRENT_PARTS = 16
+
+# Content types compressed with gzip before upload
+_TEXT_CONTENT_TYPES = {"application/json", "application/xml", "image/svg+xml"}
+
 
 class S3UploadResult(BaseModel):
     """Result of an S3 upload operation."""
@@ -23,12 +40,35 @@ class S3UploadResult(BaseModel):
     version_id: str | None = None
 
 
+class UploadArtifact(BaseModel):
+    """A single file in a report bundle."""
+    filename: str
+    content: str | bytes | None = None
+    path: str | None = None
+    content_type: str | None = None
+
+
+class S3ArtifactResult(S3UploadResult):
+    """Result of uploading one bundle artifact."""
+    filename: str
+    content_type: str
+    content_encoding: str | None = None
+    size: int
+
+
+class S3BundleResult(BaseModel):
+    """Result of a bundle upload."""
+    prefix: str
+    artifacts: list[S3ArtifactResult]
+
+
 class S3Client:
     """
     Client for uploading research reports to AWS S3.
     
     Supports both explicit key specification and auto-generation
-    based on timestamp for organized storage.
+    based on timestamp for organized storage. Blocking boto3 calls run on
+    a dedicated, bounded thread pool rather than the loop's default executor.
     """
     
     def __init__(
@@ -60,7 +100,22 @@ class S3Client:
             client_kwargs["aws_access_key_id"] = ak
             client_kwargs["aws_secret_access_key"] = sk
         
+        # Each pool worker runs one transfer, and each transfer its own part
+        # threads; split the part budget so the pool stays bounded overall
+        workers = config.s3.upload_workers
+        part_threads = max(1, _MAX_CONCURRENT_PARTS // workers)
+        client_kwargs["config"] = BotoConfig(max_pool_connections=workers * part_threads)
+
         self._client = boto3.client("s3", **client_kwargs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="s3-upload",
+        )
+        self._transfer_config = TransferConfig(
+            multipart_threshold=config.s3.multipart_threshold_mb * 1024 * 1024,
+            multipart_chunksize=config.s3.multipart_chunk_mb * 1024 * 1024,
+            max_concurrency=part_threads,
+        )
     
     def _generate_key(self, prefix: str = "reports") -> str:
         """
@@ -111,7 +166,7 @@ class S3Client:
         # Run blocking boto3 call in thread pool
         loop = asyncio.get_event_loop()
         response = await loop.run_in_executor(
-            None,
+            self._executor,
             partial(self._client.put_object, **put_kwargs)
         )
         
@@ -121,6 +176,122 @@ class S3Client:
             version_id=response.get("VersionId"),
         )
     
+    def _generate_prefix(self, prefix: str = "reports") -> str:
+        """
+        Generate a timestamp-based S3 prefix for a bundle.
+
+        Format: {prefix}/YYYY/MM/DD/report-{timestamp}/
+        """
+        return self._generate_key(prefix).removesuffix(".md") + "/"
+
+    def _put_artifact(
+        self,
+        artifact: UploadArtifact,
+        bucket: str,
+        key: str,
+        metadata: dict[str, str] | None,
+        gzip_text: bool,
+    ) -> S3ArtifactResult:
+        """Upload one artifact (blocking; runs on the upload pool)."""
+        if artifact.content is None and artifact.path is None:
+            raise ValueError(f"Artifact {artifact.filename} has neither content nor path")
+
+        content_type = (
+            artifact.content_type
+            or mimetypes.guess_type(artifact.filename)[0]
+            or "application/octet-stream"
+        )
+        extra_args: dict[str, Any] = {"ContentType": content_type}
+        compress = False
+        if content_type.startswith("text/") or content_type in _TEXT_CONTENT_TYPES:
+            extra_args["ContentType"] = f"{content_type}; charset=utf-8"
+            if gzip_text:
+                compress = True
+                extra_args["ContentEncoding"] = "gzip"
+        if metadata:
+            extra_args["Metadata"] = metadata
+
+        # upload_file/upload_fileobj switch to multipart above the transfer threshold
+        if artifact.content is not None:
+            data = artifact.content.encode("utf-8") if isinstance(artifact.content, str) else artifact.content
+            if compress:
+                data = gzip.compress(data)
+            size = len(data)
+            self._client.upload_fileobj(
+                io.BytesIO(data), bucket, key,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config,
+            )
+        elif compress:
+            # Compress from disk in blocks; spills to a temp file when large
+            with tempfile.SpooledTemporaryFile(max_size=self._transfer_config.multipart_threshold) as body:
+                with open(artifact.path, "rb") as source, gzip.GzipFile(fileobj=body, mode="wb") as target:
+                    shutil.copyfileobj(source, target)
+                size = body.tell()
+                body.seek(0)
+                self._client.upload_fileobj(
+                    body, bucket, key,
+                    ExtraArgs=extra_args,
+                    Config=self._transfer_config,
+                )
+        else:
+            size = os.path.getsize(artifact.path)
+            self._client.upload_file(
+                str(artifact.path), bucket, key,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config,
+            )
+        return S3ArtifactResult(
+            s3_uri=f"s3://{bucket}/{key}",
+            key=key,
+            filename=artifact.filename,
+            content_type=extra_args["ContentType"],
+            content_encoding=extra_args.get("ContentEncoding"),
+            size=size,
+        )
+
+    async def upload_bundle(
+        self,
+        artifacts: list[UploadArtifact],
+        bucket: str | None = None,
+        prefix: str | None = None,
+        metadata: dict[str, str] | None = None,
+        gzip_text: bool = True,
+    ) -> S3BundleResult:
+        """
+        Upload several report artifacts (e.g. md, pdf, docx) concurrently.
+
+        Args:
+            artifacts: Files to upload, each from in-memory content or a local path
+            bucket: S3 bucket name (uses default if not provided)
+            prefix: Key prefix for the bundle (auto-generates if not provided)
+            metadata: Optional metadata attached to every object
+            gzip_text: Gzip text artifacts and set Content-Encoding: gzip
+
+        Returns:
+            S3BundleResult with one entry per artifact, in input order
+
+        Raises:
+            ClientError: If any upload fails
+        """
+        bucket = bucket or self.default_bucket
+        prefix = prefix if prefix is not None else self._generate_prefix()
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+
+        loop = asyncio.get_event_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._executor,
+                partial(
+                    self._put_artifact, artifact, bucket,
+                    f"{prefix}{artifact.filename}", metadata, gzip_text,
+                ),
+            )
+            for artifact in artifacts
+        ))
+        return S3BundleResult(prefix=prefix, artifacts=list(results))
+
     async def check_bucket_exists(self, bucket: str | None = None) -> bool:
         """Check if the specified bucket exists and is accessible."""
         bucket = bucket or self.default_bucket
@@ -128,7 +299,7 @@ class S3Client:
         loop = asyncio.get_event_loop()
         try:
             await loop.run_in_executor(
-                None,
+                self._executor,
                 partial(self._client.head_bucket, Bucket=bucket)
             )
             return True
@@ -27,6 +27,9 @@ class S3Config(BaseModel):
     secret_access_key: str | None = Field(default=None)
     region: str = Field(default="us-east-1")
     default_bucket: str = Field(default="legal-research-reports")
+    upload_workers: int = Field(default=8)
+    multipart_threshold_mb: int = Field(default=8)
+    multipart_chunk_mb: int = Field(default=8)
 
 
 class CourtListenerConfig(BaseModel):
@@ -34,12 +37,40 @@ class CourtListenerConfig(BaseModel):
     api_key: str | None = Field(default=None)
     base_url: str = Field(default="https://www.courtlistener.com/api/rest/v4")
     timeout: float = Field(default=30.0)
+    http2: bool = Field(default=True)
+    max_connections: int = Field(default=20)
+    max_keepalive_connections: int = Field(default=10)
+    keepalive_expiry: float = Field(default=30.0)
+    cache_enabled: bool = Field(default=True)
+    cache_path: str = Field(default="~/.cache/legal-mcp-hub/courtlistener.sqlite3")
+    cache_max_mb: int = Field(default=256)
+    cache_opinion_ttl: float = Field(default=30 * 24 * 3600)
+    cache_citation_ttl: float = Field(default=7 * 24 * 3600)
+    cache_search_ttl: float = Field(default=3600)
+    citation_lookup_max_chars: int = Field(default=64000)
+    citation_lookup_max_citations: int = Field(default=250)
+    bulk_concurrency: int = Field(default=4, ge=1)
+    search_page_size: int = Field(default=20)
+    search_prefetch_pages: int = Field(default=2)
 
 
 class GeminiConfig(BaseModel):
     """Gemini configuration for CLI and File Search."""
     api_key: str | None = Field(default=None)
     cli_path: str = Field(default="gemini")
+    upload_concurrency: int = Field(default=4)
+    operation_poll_interval: float = Field(default=1.0)
+    operation_poll_max_interval: float = Field(default=15.0)
+    upload_timeout: float = Field(default=600)
+    query_cache_ttl: float = Field(default=300)
+    query_cache_size: int = Field(default=256)
+
+
+class ResearchJobsConfig(BaseModel):
+    """Background research job configuration."""
+    max_workers: int = Field(default=2)
+    max_queue: int = Field(default=50)
+    result_ttl: float = Field(default=3600)
 
 
 class Config(BaseModel):
@@ -48,6 +79,7 @@ class Config(BaseModel):
     s3: S3Config
     court_listener: CourtListenerConfig
     gemini: GeminiConfig
+    research_jobs: ResearchJobsConfig
 
 
 def load_config() -> Config:
@@ -63,15 +95,42 @@ def load_config() -> Config:
             secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
             region=os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
             default_bucket=os.getenv("S3_DEFAULT_BUCKET", "legal-research-reports"),
+            upload_workers=int(os.getenv("S3_UPLOAD_WORKERS", "8")),
+            multipart_threshold_mb=int(os.getenv("S3_MULTIPART_THRESHOLD_MB", "8")),
+            multipart_chunk_mb=int(os.getenv("S3_MULTIPART_CHUNK_MB", "8")),
         ),
         court_listener=CourtListenerConfig(
             api_key=os.getenv("COURTLISTENER_API_KEY"),
             base_url=os.getenv("COURTLISTENER_BASE_URL", "https://www.courtlistener.com/api/rest/v4"),
             timeout=float(os.getenv("COURTLISTENER_TIMEOUT", "30.0")),
+            http2=os.getenv("COURTLISTENER_HTTP2", "true").lower() == "true",
+            max_connections=int(os.getenv("COURTLISTENER_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=int(os.getenv("COURTLISTENER_MAX_KEEPALIVE", "10")),
+            keepalive_expiry=float(os.getenv("COURTLISTENER_KEEPALIVE_EXPIRY", "30.0")),
+            cache_enabled=os.getenv("COURTLISTENER_CACHE_ENABLED", "true").lower() == "true",
+            cache_path=os.getenv("COURTLISTENER_CACHE_PATH", "~/.cache/legal-mcp-hub/courtlistener.sqlite3"),
+            cache_max_mb=int(os.getenv("COURTLISTENER_CACHE_MAX_MB", "256")),
+            cache_opinion_ttl=float(os.getenv("COURTLISTENER_CACHE_OPINION_TTL", str(30 * 24 * 3600))),
+            cache_citation_ttl=float(os.getenv("COURTLISTENER_CACHE_CITATION_TTL", str(7 * 24 * 3600))),
+            cache_search_ttl=float(os.getenv("COURTLISTENER_CACHE_SEARCH_TTL", "3600")),
+            bulk_concurrency=int(os.getenv("COURTLISTENER_BULK_CONCURRENCY", "4")),
+            search_page_size=int(os.getenv("COURTLISTENER_SEARCH_PAGE_SIZE", "20")),
+            search_prefetch_pages=int(os.getenv("COURTLISTENER_SEARCH_PREFETCH_PAGES", "2")),
         ),
         gemini=GeminiConfig(
             api_key=os.getenv("GOOGLE_API_KEY"),
             cli_path=os.getenv("GEMINI_CLI_PATH", "gemini"),
+            upload_concurrency=int(os.getenv("GEMINI_UPLOAD_CONCURRENCY", "4")),
+            operation_poll_interval=float(os.getenv("GEMINI_POLL_INTERVAL", "1.0")),
+            operation_poll_max_interval=float(os.getenv("GEMINI_POLL_MAX_INTERVAL", "15.0")),
+            upload_timeout=float(os.getenv("GEMINI_UPLOAD_TIMEOUT", "600")),
+            query_cache_ttl=float(os.getenv("GEMINI_QUERY_CACHE_TTL", "300")),
+            query_cache_size=int(os.getenv("GEMINI_QUERY_CACHE_SIZE", "256")),
+        ),
+        research_jobs=ResearchJobsConfig(
+            max_workers=int(os.getenv("RESEARCH_JOB_WORKERS", "2")),
+            max_queue=int(os.getenv("RESEARCH_JOB_QUEUE_SIZE", "50")),
+            result_ttl=float(os.getenv("RESEARCH_JOB_RESULT_TTL", "3600")),
         ),
     )
 
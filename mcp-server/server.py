@@ -2,8 +2,9 @@
 Legal Intelligence MCP Hub - Server Entry Point
 
 A unified MCP server providing legal research tools:
-- GPT Researcher: Deep research, quick search, report generation, S3 upload
-- Court Listener: Case search, opinion retrieval, citation lookup
+- GPT Researcher: Deep research (blocking or background jobs), quick search,
+  report generation, S3 upload
+- Court Listener: Case search, opinion retrieval, citation lookup (single and bulk)
 - Gemini: Web search, file store management, document RAG
 
 Usage:
@@ -25,12 +26,13 @@ import argparse
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Add package to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 from config import config
 
@@ -49,16 +51,46 @@ else:
     )
 logger = logging.getLogger("legal-mcp-hub")
 
+# Number of MCP sessions currently using server-scoped resources.
+# HTTP transports run the lifespan once per session, so shared clients
+# are only closed when the last session ends.
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP):
+    """Close shared, server-scoped clients when the last session ends."""
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield {}
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await close_court_client()
+            await close_research_jobs()
+
+
 # Create main MCP server
-mcp = FastMCP("Legal Intelligence Hub")
+mcp = FastMCP("Legal Intelligence Hub", lifespan=server_lifespan)
 
 
 # ============================================================================
 # ============================================================================
 # GPT Researcher Tools
 # ============================================================================
-from gpt_researcher import GPTResearcher
-from clients import S3Client
+from clients import ResearcherFactory, ResearchJobManager, S3Client
+
+
+_researcher_factory: ResearcherFactory | None = None
+
+
+def get_researcher_factory() -> ResearcherFactory:
+    """Return the server-scoped GPT Researcher factory."""
+    global _researcher_factory
+    if _researcher_factory is None:
+        _researcher_factory = ResearcherFactory()
+    return _researcher_factory
 
 
 @mcp.tool()
@@ -73,12 +105,16 @@ async def deep_research(
     Args:
         query: The research question or topic
         report_type: Type of report (research_report, detailed_report, quick_report)
-        max_sources: Maximum number of sources to use (default 10)
+        max_sources: Maximum number of sources scraped and embedded (default 10)
 
     Returns:
         Dictionary with 'research_data' and 'sources'
     """
-    researcher = GPTResearcher(query=query, report_type=report_type)
+    researcher = get_researcher_factory().create(
+        query=query,
+        report_type=report_type,
+        max_sources=max_sources,
+    )
     research_data = await researcher.conduct_research()
     return {
         "research_data": research_data,
@@ -87,20 +123,148 @@ async def deep_research(
 
 
 @mcp.tool()
-async def quick_search(query: str, max_results: int = 5) -> dict:
+async def quick_search(query: str, max_results: int = 5, snippets_only: bool = True) -> dict:
     """
     Perform a quick web search on a topic.
 
+    Calls the configured search retriever directly (no LLM planning,
+    scraping or embedding), so results return in about a second.
+
     Args:
         query: Search query
         max_results: Maximum results to return (default 5)
+        snippets_only: Return only title, URL and a short snippet (default True)
 
     Returns:
         Dictionary with 'results' list
     """
-    researcher = GPTResearcher(query=query, report_type="quick_report")
-    results = await researcher.conduct_research()
-    return {"results": results[:max_results] if isinstance(results, list) else results}
+    results = await get_researcher_factory().search(
+        query=query,
+        max_results=max_results,
+        snippets_only=snippets_only,
+    )
+    return {"results": results}
+
+
+async def _run_research_job(
+    query: str,
+    sink,
+    report_type: str = "research_report",
+    max_sources: int = 10,
+) -> dict:
+    """Run one background research job, streaming progress into `sink`."""
+    researcher = get_researcher_factory().create(
+        query=query,
+        report_type=report_type,
+        max_sources=max_sources,
+        websocket=sink,
+    )
+    research_data = await researcher.conduct_research()
+    return {
+        "research_data": research_data,
+        "sources": researcher.get_source_urls() if hasattr(researcher, "get_source_urls") else [],
+    }
+
+
+# Background jobs outlive the MCP session that started them, so clients
+# can reconnect and poll for results; they are cancelled with the other
+# shared resources when the last session ends.
+_research_jobs: ResearchJobManager | None = None
+
+
+def get_research_jobs() -> ResearchJobManager:
+    """Return the server-scoped research job manager."""
+    global _research_jobs
+    if _research_jobs is None:
+        _research_jobs = ResearchJobManager(
+            _run_research_job,
+            max_workers=config.research_jobs.max_workers,
+            max_queue=config.research_jobs.max_queue,
+            result_ttl=config.research_jobs.result_ttl,
+        )
+    return _research_jobs
+
+
+async def close_research_jobs() -> None:
+    """Cancel running research jobs and stop the job workers, if started."""
+    global _research_jobs
+    if _research_jobs is not None:
+        await _research_jobs.aclose()
+        _research_jobs = None
+
+
+@mcp.tool()
+async def start_research(
+    query: str,
+    report_type: str = "research_report",
+    max_sources: int = 10,
+) -> dict:
+    """
+    Start deep research in the background and return a job ID immediately.
+
+    Identical queries that are already queued, running or recently finished
+    return the existing job instead of starting a duplicate.
+
+    Args:
+        query: The research question or topic
+        report_type: Type of report (research_report, detailed_report, quick_report)
+        max_sources: Maximum number of sources scraped and embedded (default 10)
+
+    Returns:
+        Dictionary with 'job_id', 'status' and 'deduplicated'
+    """
+    job, created = await get_research_jobs().start(
+        query, report_type=report_type, max_sources=max_sources
+    )
+    return {"job_id": job.id, "status": job.status.value, "deduplicated": not created}
+
+
+@mcp.tool()
+async def get_research_status(job_id: str, since_event: int = 0) -> dict:
+    """
+    Get the status and progress events of a background research job.
+
+    Args:
+        job_id: ID returned by start_research
+        since_event: Only return events with a sequence number above this
+
+    Returns:
+        Dictionary with 'status', 'elapsed_seconds', 'event_count' and 'events'
+    """
+    return get_research_jobs().get(job_id).status_dict(since=since_event)
+
+
+@mcp.tool()
+async def get_research_result(job_id: str) -> dict:
+    """
+    Get the result of a finished background research job.
+
+    Args:
+        job_id: ID returned by start_research
+
+    Returns:
+        Dictionary with 'status' plus 'research_data' and 'sources' when completed
+    """
+    job = get_research_jobs().get(job_id)
+    result = {"job_id": job.id, "status": job.status.value, "error": job.error}
+    if job.result is not None:
+        result.update(job.result)
+    return result
+
+
+@mcp.tool()
+async def cancel_research(job_id: str) -> dict:
+    """
+    Cancel a queued or running background research job.
+
+    Args:
+        job_id: ID returned by start_research
+
+    Returns:
+        Dictionary with 'job_id' and 'status'
+    """
+    job = get_research_jobs().cancel(job_id)
+    return {"job_id": job.id, "status": job.status.value}
 
 
 @mcp.tool()
@@ -120,12 +284,23 @@ async def write_report(
     Returns:
         Dictionary with 'report' (markdown text)
     """
-    researcher = GPTResearcher(query=query, report_type=report_type)
+    researcher = get_researcher_factory().create(query=query, report_type=report_type)
     researcher.context = research_data
     report = await researcher.write_report()
     return {"report": report}
 
 
+_s3_client: S3Client | None = None
+
+
+def get_s3_client() -> S3Client:
+    """Return the server-scoped S3 client and its upload thread pool."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = S3Client()
+    return _s3_client
+
+
 @mcp.tool()
 async def save_report_to_s3(
     report: str,
@@ -145,7 +320,7 @@ async def save_report_to_s3(
     Returns:
         Dictionary with 's3_url' and 'key'
     """
-    s3 = S3Client()
+    s3 = get_s3_client()
     result = await s3.upload_report(
         report=report,
         bucket=bucket,
@@ -158,54 +333,36 @@ async def save_report_to_s3(
 # ============================================================================
 # Court Listener Tools
 # ============================================================================
-import httpx
+from clients import CourtListenerClient, ResponseCache
 
 
-class CourtListenerClient:
-    """Lightweight Court Listener client."""
+_court_client: CourtListenerClient | None = None
 
-    def __init__(self):
-        self.base_url = config.court_listener.base_url
-        self.token = config.court_listener.api_key
-        self.timeout = config.court_listener.timeout
-        self.headers = {
-            "Authorization": f"Token {self.token}" if self.token else "",
-        }
 
-    async def get(self, endpoint: str, params: dict | None = None) -> dict:
-        if params:
-            params = {k: v for k, v in params.items() if v is not None}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
-                params=params,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def post(self, endpoint: str, data: dict | None = None) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
-                data=data,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return response.json()
-
-
-_court_client = None
-
-def get_court_client():
+def get_court_client() -> CourtListenerClient:
+    """Return the server-scoped pooled Court Listener client."""
     global _court_client
     if _court_client is None:
-        _court_client = CourtListenerClient()
+        cache = None
+        if config.court_listener.cache_enabled:
+            try:
+                cache = ResponseCache(
+                    config.court_listener.cache_path,
+                    max_bytes=config.court_listener.cache_max_mb * 1024 * 1024,
+                )
+            except Exception as e:
+                # e.g. read-only home in a container; run uncached
+                logger.warning(f"Court Listener response cache disabled: {e}")
+        _court_client = CourtListenerClient(cache=cache)
     return _court_client
 
 
+async def close_court_client() -> None:
+    """Close the pooled Court Listener client, if one was created."""
+    if _court_client is not None:
+        await _court_client.aclose()
+
+
 @mcp.tool()
 async def search_cases(
     query: str,
@@ -213,6 +370,8 @@ async def search_cases(
     date_from: str | None = None,
     date_to: str | None = None,
     max_results: int = 10,
+    all_pages: bool = False,
+    ctx: Context | None = None,
 ) -> dict:
     """
     Search legal cases by keyword, party name, or citation.
@@ -223,9 +382,12 @@ async def search_cases(
         date_from: Start date filter (YYYY-MM-DD)
         date_to: End date filter (YYYY-MM-DD)
         max_results: Maximum results to return (default 10)
+        all_pages: Follow result pages until max_results unique cases are
+            collected, prefetching pages and reporting progress per result
 
     Returns:
-        Dictionary with 'results' (list) and 'count' (int)
+        Dictionary with 'results' (list) and 'count' (int; total matches, or
+        results collected when all_pages is set)
     """
     client = get_court_client()
     params = {
@@ -240,10 +402,22 @@ async def search_cases(
     if date_to:
         params["filed_before"] = date_to
 
-    result = await client.get("/search/", params)
+    if not all_pages:
+        result = await client.search(params)
+        return {
+            "results": result.get("results", []),
+            "count": result.get("count", 0),
+        }
+
+    params["page_size"] = min(max_results, config.court_listener.search_page_size)
+    results = []
+    async for case in client.iter_search(params, max_results=max_results):
+        results.append(case)
+        if ctx is not None:
+            await ctx.report_progress(len(results), max_results)
     return {
-        "results": result.get("results", []),
-        "count": result.get("count", 0),
+        "results": results,
+        "count": len(results),
     }
 
 
@@ -259,7 +433,7 @@ async def get_opinion(opinion_id: int) -> dict:
         Dictionary with opinion details including full text
     """
     client = get_court_client()
-    return await client.get(f"/opinions/{opinion_id}/")
+    return await client.get_opinion(opinion_id)
 
 
 @mcp.tool()
@@ -274,14 +448,45 @@ async def lookup_citation(citation: str) -> dict:
         Dictionary with matched citations and case details
     """
     client = get_court_client()
-    result = await client.post("/citation-lookup/", data={"text": citation})
-    return {"citations": result if isinstance(result, list) else [result]}
+    return {"citations": await client.lookup_citation(citation)}
+
+
+@mcp.tool()
+async def resolve_citations_bulk(document: str, max_concurrency: int | None = None) -> dict:
+    """
+    Extract and resolve every legal citation in a document in one call.
+
+    Citations are deduplicated, served from cache where possible, and the
+    rest are resolved in batched, concurrent Court Listener requests.
+
+    Args:
+        document: Full document text (e.g., a brief or opinion)
+        max_concurrency: Maximum concurrent API requests (defaults to
+            COURTLISTENER_BULK_CONCURRENCY)
+
+    Returns:
+        Dictionary with 'citations' (citation -> matched case), 'unresolved',
+        and request/cache counters
+    """
+    client = get_court_client()
+    return await client.resolve_citations_bulk(document, concurrency=max_concurrency)
 
 
 # ============================================================================
 # Gemini Tools
 # ============================================================================
-from clients import GeminiCLI, GeminiFileSearch
+from clients import BatchUploadResult, GeminiCLI, GeminiFileSearch
+
+
+_file_search: GeminiFileSearch | None = None
+
+
+def get_file_search() -> GeminiFileSearch:
+    """Return the server-scoped Gemini File Search client."""
+    global _file_search
+    if _file_search is None:
+        _file_search = GeminiFileSearch()
+    return _file_search
 
 
 # REMOVED: web_search tool - Gemini CLI grounding is unreliable
@@ -299,7 +504,7 @@ async def create_file_store(name: str, display_name: str | None = None) -> dict:
     Returns:
         Dictionary with 'store_name' and 'store_id'
     """
-    fs = GeminiFileSearch()
+    fs = get_file_search()
     result = await fs.create_store(name=name, display_name=display_name)
     return result
 
@@ -313,17 +518,47 @@ async def upload_to_file_store(
     Upload a file to a Gemini file store.
 
     Args:
-        store_name: Name of the file store
+        store_name: File store resource name or display name
         file_path: Local path to the file
 
     Returns:
         Dictionary with 'file_id' and 'status'
     """
-    fs = GeminiFileSearch()
+    fs = get_file_search()
     result = await fs.upload(store_name=store_name, file_path=file_path)
     return result
 
 
+@mcp.tool()
+async def upload_batch_to_file_store(
+    store_name: str,
+    path: str,
+    max_concurrency: int | None = None,
+    skip_existing: bool = True,
+    ctx: Context | None = None,
+) -> dict:
+    """
+    Upload a directory or glob of files to a Gemini file store concurrently.
+
+    Args:
+        store_name: File store resource name or display name
+        path: Directory (searched recursively) or glob pattern, e.g. 'case/**/*.pdf'
+        max_concurrency: Concurrent uploads (default from GEMINI_UPLOAD_CONCURRENCY)
+        skip_existing: Skip files whose content is already in the store
+
+    Returns:
+        Dictionary with 'uploaded', 'skipped', 'failed' counts and per-file 'files'
+    """
+    fs = get_file_search()
+    files = []
+    async for result in fs.iter_upload_batch(store_name, path, max_concurrency, skip_existing):
+        files.append(result)
+        if ctx is not None:
+            await ctx.info(f"{result.file_name}: {result.status}")
+            await ctx.report_progress(len(files))
+    return BatchUploadResult.from_files(store_name, files).model_dump()
+
+
 @mcp.tool()
 async def file_search_query(
     store_name: str,
@@ -333,13 +568,13 @@ async def file_search_query(
     Query documents in a Gemini file store using RAG.
 
     Args:
-        store_name: Name of the file store
+        store_name: File store resource name or display name
         query: Search query
 
     Returns:
         Dictionary with 'results' and 'answer'
     """
-    fs = GeminiFileSearch()
+    fs = get_file_search()
     result = await fs.query(
         store_name=store_name,
         query=query,
@@ -356,18 +591,29 @@ async def health_check() -> dict:
     Check server health and list available tools.
     
     Returns:
-        Dictionary with 'status', 'server_name', and 'tools' count
+        Dictionary with 'status', 'server_name', 'tools' count, and
+        Court Listener connection, latency and cache hit/miss stats
     """
     return {
         "status": "healthy",
         "server_name": "Legal Intelligence Hub",
         "version": "1.0.0",
         "tools": {
-            "gpt_researcher": ["deep_research", "quick_search", "write_report", "save_report_to_s3"],
-            "court_listener": ["search_cases", "get_opinion", "lookup_citation"],
-            "gemini": ["web_search", "create_file_store", "upload_to_file_store", "file_search_query"],
+            "gpt_researcher": [
+                "deep_research", "quick_search", "write_report", "save_report_to_s3",
+                "start_research", "get_research_status", "get_research_result", "cancel_research",
+            ],
+            "court_listener": ["search_cases", "get_opinion", "lookup_citation", "resolve_citations_bulk"],
+            "gemini": [
+                "web_search", "create_file_store", "upload_to_file_store",
+                "upload_batch_to_file_store", "file_search_query",
+            ],
         },
-        "total_tools": 11,
+        "total_tools": 17,
+        "court_listener": get_court_client().stats(),
+        "gpt_researcher": get_researcher_factory().stats(),
+        "research_jobs": get_research_jobs().stats(),
+        "gemini_file_search": get_file_search().stats() if _file_search else None,
     }
 
 
@@ -0,0 +1,276 @@
+"""
+Unit tests for the pooled Court Listener client.
+
+Uses httpx.MockTransport so no network access or API key is required.
+Run with: pytest tests/test_courtlistener_client.py -v
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from clients import CourtListenerClient, ResponseCache, extract_citations
+from clients.courtlistener_client import fallback_windows
+from config import CourtListenerConfig
+
+
+def make_client(handler) -> CourtListenerClient:
+    """Build a client whose pooled transport is backed by `handler`."""
+    client = CourtListenerClient(CourtListenerConfig(api_key="test-token", base_url="https://cl.test/api"))
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestPooledClient:
+    """Connection reuse and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_single_client(self):
+        """All calls share one underlying httpx client."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        client = make_client(handler)
+        pooled = client.client
+        await client.get("/search/", {"q": "miranda", "court": None})
+        await client.post("/citation-lookup/", data={"text": "384 U.S. 436"})
+
+        assert client.client is pooled
+        assert len(seen) == 2
+        assert "court" not in seen[0].url.params
+        assert seen[0].headers["Authorization"] == "Token test-token"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_then_reopen(self):
+        """A closed client reopens lazily on next use."""
+        client = CourtListenerClient(CourtListenerConfig())
+        first = client.client
+        await client.aclose()
+
+        assert first.is_closed
+        assert client.stats()["pool_open"] is False
+        assert client.client is not first
+        await client.aclose()
+
+    def test_pool_limits_from_config(self):
+        """Pool limits come from CourtListenerConfig."""
+        client = CourtListenerClient(CourtListenerConfig(max_connections=7, max_keepalive_connections=3))
+
+        assert client.limits.max_connections == 7
+        assert client.limits.max_keepalive_connections == 3
+
+
+class TestLatencyStats:
+    """Per-endpoint latency tracking."""
+
+    @pytest.mark.asyncio
+    async def test_stats_grouped_by_route(self):
+        """Numeric path segments are collapsed into one route."""
+        client = make_client(lambda request: httpx.Response(200, json={}))
+        await client.get("/opinions/1/")
+        await client.get("/opinions/2/")
+
+        endpoints = client.stats()["endpoints"]
+        assert endpoints["GET /opinions/{id}/"]["calls"] == 2
+        assert endpoints["GET /opinions/{id}/"]["errors"] == 0
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted(self):
+        """HTTP errors are raised and recorded."""
+        client = make_client(lambda request: httpx.Response(404, json={}))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("/opinions/9/")
+
+        assert client.stats()["endpoints"]["GET /opinions/{id}/"]["errors"] == 1
+        await client.aclose()
+
+
+class TestResponseCaching:
+    """Cached opinion, citation and search lookups."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_skip_api(self, tmp_path):
+        """Repeat lookups are served from the cache."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if request.url.path.endswith("/citation-lookup/"):
+                return httpx.Response(200, json=[{"citation": "384 U.S. 436"}])
+            return httpx.Response(200, json={"id": 1, "results": []})
+
+        client = make_client(handler)
+        client.cache = ResponseCache(tmp_path / "cache.sqlite3")
+
+        await client.get_opinion(1)
+        await client.get_opinion(1)
+        await client.lookup_citation("384 U.S. 436")
+        await client.lookup_citation("384  u.s.  436 ")
+        await client.search({"q": "miranda", "court": None})
+        await client.search({"q": "miranda"})
+
+        assert len(calls) == 3
+        assert client.stats()["cache"]["hits"] == 3
+        await client.aclose()
+
+
+class TestBulkCitations:
+    """Batched citation resolution."""
+
+    def test_extract_citations_dedupes(self):
+        """Repeated citations collapse and statutes are skipped."""
+        text = "Miranda, 384 U.S. 436 (1966); see 384 U.S.  436, 444; 123 F.3d 456; 42 U.S.C. 1983."
+
+        assert list(extract_citations(text).values()) == ["384 U.S. 436", "123 F.3d 456"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_batches_and_caches(self, tmp_path):
+        """Unique citations go out in batches and are cached individually."""
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            text = dict(httpx.QueryParams(request.content.decode()))["text"]
+            bodies.append(text)
+            return httpx.Response(200, json=[
+                {"citation": line, "status": 200, "clusters": [{"case_name": line}]}
+                for line in text.split("\n")
+            ])
+
+        client = make_client(handler)
+        client.settings = client.settings.model_copy(update={"citation_lookup_max_citations": 2})
+        client.cache = ResponseCache(tmp_path / "cache.sqlite3")
+        document = "384 U.S. 436; 372 U.S. 335; 384 U.S. 436; 123 F.3d 456"
+
+        result = await client.resolve_citations_bulk(document)
+
+        assert result["requests"] == 2
+        assert sorted(result["citations"]) == ["123 F.3d 456", "372 U.S. 335", "384 U.S. 436"]
+        assert result["unresolved"] == []
+        assert await client.lookup_citation("372 U.S. 335") == [
+            {"citation": "372 U.S. 335", "status": 200, "clusters": [{"case_name": "372 U.S. 335"}]}
+        ]
+        assert len(bodies) == 2
+
+        again = await client.resolve_citations_bulk(document)
+        assert again["requests"] == 0
+        assert again["cache_hits"] == 3
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unmatched_text_goes_to_server_extractor(self):
+        """Citations the local pattern misses are still sent and resolved."""
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            text = dict(httpx.QueryParams(request.content.decode()))["text"]
+            bodies.append(text)
+            found = [line for line in ("384 U.S. 436", "2019 WL 123456") if line in text]
+            return httpx.Response(200, json=[{"citation": c, "status": 200} for c in found])
+
+        client = make_client(handler)
+        filler = "The facts are set out at length below. " * 50
+        document = f"{filler}Miranda, 384 U.S. 436, and Smith v. Jones, 2019 WL 123456, apply. {filler}"
+
+        result = await client.resolve_citations_bulk(document)
+
+        assert sorted(result["citations"]) == ["2019 WL 123456", "384 U.S. 436"]
+        assert result["requests"] == 2
+        # Only a short window around the Westlaw cite is sent, not the document
+        assert "2019 WL 123456" in bodies[1]
+        assert "384 U.S. 436" not in bodies[1]
+        assert len(bodies[1]) < 300
+        await client.aclose()
+
+    def test_fallback_windows(self):
+        text = "Prose. " * 40 + "See 2019 U.S. Dist. LEXIS 12345; id. at 7. " + "Prose. " * 40
+        windows = fallback_windows(text, context=20)
+
+        assert len(windows) == 1
+        assert "LEXIS 12345" in windows[0] and "id. at 7" in windows[0]
+        assert fallback_windows("Miranda, 384 U.S. 436, controls.") == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_concurrency_defaults_to_config(self):
+        """Without an explicit limit the configured concurrency applies."""
+        active, peak = 0, 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            text = dict(httpx.QueryParams(request.content.decode()))["text"]
+            return httpx.Response(200, json=[{"citation": text, "status": 200}])
+
+        client = make_client(handler)
+        client.settings = client.settings.model_copy(
+            update={"citation_lookup_max_citations": 1, "bulk_concurrency": 1}
+        )
+        document = "384 U.S. 436; 372 U.S. 335; 123 F.3d 456"
+
+        result = await client.resolve_citations_bulk(document)
+
+        assert result["requests"] == 3
+        assert peak == 1
+        with pytest.raises(ValueError, match="at least 1"):
+            await client.resolve_citations_bulk(document, concurrency=0)
+        await client.aclose()
+
+
+class TestPaginatedSearch:
+    """Cursor-following search streaming."""
+
+    @staticmethod
+    def paged_handler(pages):
+        """Serve `pages` in order, linking them with `next` cursors."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            index = int(request.url.params.get("cursor", 0))
+            requested.append(index)
+            body = {"count": 99, "results": pages[index], "next": None}
+            if index + 1 < len(pages):
+                body["next"] = f"https://cl.test/api/search/?q=x&cursor={index + 1}"
+            return httpx.Response(200, json=body)
+
+        return handler, requested
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor_and_dedupes(self):
+        """All pages are streamed with duplicate clusters removed."""
+        handler, requested = self.paged_handler([
+            [{"cluster_id": 1}, {"cluster_id": 2}],
+            [{"cluster_id": 2}, {"cluster_id": 3}],
+            [{"cluster_id": 4}],
+        ])
+        client = make_client(handler)
+
+        results = [r async for r in client.iter_search({"q": "x"})]
+
+        assert [r["cluster_id"] for r in results] == [1, 2, 3, 4]
+        assert requested == [0, 1, 2]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_results(self):
+        """Iteration stops once the result cap is reached."""
+        handler, requested = self.paged_handler([[{"cluster_id": i}] for i in range(50)])
+        client = make_client(handler)
+
+        results = [r async for r in client.iter_search({"q": "x"}, max_results=3, prefetch=1)]
+
+        assert [r["cluster_id"] for r in results] == [0, 1, 2]
+        assert len(requested) < 10
+        await client.aclose()
@@ -0,0 +1,199 @@
+"""
+Unit tests for Gemini file store uploads, store names and query memo.
+
+Uses an in-memory stand-in for the genai async client; no API key needed.
+Run with: pytest tests/test_gemini_client.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from clients import FileSearchResult, GeminiFileSearch
+from clients.gemini_client import hash_file, resolve_upload_paths
+from config import config
+
+
+class FakeStores:
+    """Async file_search_stores stand-in recording uploads."""
+
+    def __init__(self, existing_hashes=(), fail_names=()):
+        self.documents = SimpleNamespace(list=self.list_documents)
+        self.existing = [
+            SimpleNamespace(custom_metadata=[SimpleNamespace(key="sha256", string_value=h)])
+            for h in existing_hashes
+        ]
+        self.fail_names = set(fail_names)
+        self.uploaded = []
+        self.active = 0
+        self.peak = 0
+        self.stores = [SimpleNamespace(name="fileSearchStores/case-123", display_name="smith-v-jones")]
+        self.list_calls = 0
+
+    async def list(self):
+        self.list_calls += 1
+
+        async def pager():
+            for store in self.stores:
+                yield store
+        return pager()
+
+    async def create(self, config):
+        store = SimpleNamespace(name=f"fileSearchStores/{len(self.stores)}", display_name=config["display_name"])
+        self.stores.append(store)
+        return store
+
+    async def list_documents(self, parent):
+        async def pager():
+            for document in self.existing:
+                yield document
+        return pager()
+
+    async def upload_to_file_search_store(self, file, file_search_store_name, config):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.uploaded.append(config["display_name"])
+        return SimpleNamespace(name=f"operations/{config['display_name']}", done=False, error=None, polls=0)
+
+
+class FakeOperations:
+    """Completes each operation after two polls."""
+
+    def __init__(self, stores: FakeStores):
+        self.stores = stores
+
+    async def get(self, operation):
+        polls = operation.polls + 1
+        name = operation.name.split("/")[-1]
+        done = polls >= 2
+        if done:
+            self.stores.active -= 1
+        error = {"message": "bad file"} if done and name in self.stores.fail_names else None
+        return SimpleNamespace(
+            name=operation.name, done=done, error=error, polls=polls,
+            response=SimpleNamespace(document_name=f"docs/{name}"),
+        )
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(config.gemini, "operation_poll_interval", 0.001)
+    monkeypatch.setattr(config.gemini, "operation_poll_max_interval", 0.002)
+
+
+def make_file_search(stores: FakeStores) -> GeminiFileSearch:
+    fs = GeminiFileSearch(api_key="test-key")
+    fs.client = SimpleNamespace(aio=SimpleNamespace(file_search_stores=stores, operations=FakeOperations(stores)))
+    return fs
+
+
+def write_case_files(root):
+    (root / "exhibits").mkdir()
+    (root / "complaint.pdf").write_bytes(b"complaint")
+    (root / "motion.pdf").write_bytes(b"motion")
+    (root / "exhibits" / "exhibit-a.pdf").write_bytes(b"exhibit a")
+    (root / "exhibits" / "copy-of-motion.pdf").write_bytes(b"motion")
+    (root / ".DS_Store").write_bytes(b"")
+
+
+class TestResolvePaths:
+    """Directory and glob expansion."""
+
+    def test_directory_is_recursive_and_skips_hidden(self, tmp_path):
+        write_case_files(tmp_path)
+
+        names = [p.name for p in resolve_upload_paths(str(tmp_path))]
+
+        assert names == ["complaint.pdf", "copy-of-motion.pdf", "exhibit-a.pdf", "motion.pdf"]
+
+    def test_glob(self, tmp_path):
+        write_case_files(tmp_path)
+
+        assert [p.name for p in resolve_upload_paths(str(tmp_path / "*.pdf"))] == ["complaint.pdf", "motion.pdf"]
+
+
+class TestBatchUpload:
+    """Concurrent uploads with hash-based skipping."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_concurrently_and_skips_duplicates(self, tmp_path, fast_polling):
+        """Known and repeated content is skipped; uploads overlap up to the limit."""
+        write_case_files(tmp_path)
+        stores = FakeStores(existing_hashes=[hash_file(tmp_path / "complaint.pdf")])
+        fs = make_file_search(stores)
+
+        result = await fs.upload_batch("fileSearchStores/case", str(tmp_path), max_concurrency=2)
+
+        assert (result.uploaded, result.skipped, result.failed) == (2, 2, 0)
+        assert "complaint.pdf" not in stores.uploaded
+        assert stores.peak == 2
+        done = [f for f in result.files if f.status == "completed"]
+        assert all(f.file_id.startswith("docs/") and f.sha256 for f in done)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_per_file(self, tmp_path, fast_polling):
+        """A failed operation does not abort the batch."""
+        write_case_files(tmp_path)
+        fs = make_file_search(FakeStores(fail_names=["motion.pdf"]))
+
+        files = [f async for f in fs.iter_upload_batch("fileSearchStores/case", str(tmp_path / "*.pdf"))]
+
+        statuses = {f.file_name: f.status for f in files}
+        assert statuses == {"complaint.pdf": "completed", "motion.pdf": "failed"}
+        assert "bad file" in next(f.error for f in files if f.status == "failed")
+
+    @pytest.mark.asyncio
+    async def test_no_matches_raises(self, tmp_path):
+        fs = make_file_search(FakeStores())
+
+        with pytest.raises(FileNotFoundError):
+            await fs.upload_batch("fileSearchStores/case", str(tmp_path / "*.docx"))
+
+
+class TestStoreNamesAndQueryMemo:
+    """Display-name resolution and memoized queries."""
+
+    @pytest.mark.asyncio
+    async def test_display_names_resolve_with_one_list_call(self):
+        stores = FakeStores()
+        fs = make_file_search(stores)
+
+        assert await fs.resolve_store("smith-v-jones") == "fileSearchStores/case-123"
+        assert await fs.resolve_store("smith-v-jones") == "fileSearchStores/case-123"
+        assert await fs.resolve_store("fileSearchStores/other") == "fileSearchStores/other"
+        created = await fs.create_store("doe-v-roe")
+        assert await fs.resolve_store("doe-v-roe") == created.store_name
+        assert stores.list_calls == 1
+
+        with pytest.raises(KeyError):
+            await fs.resolve_store("missing")
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_are_memoized(self, tmp_path, monkeypatch, fast_polling):
+        """Repeat queries hit the memo until the TTL lapses or the store changes."""
+        fs = make_file_search(FakeStores())
+        calls = []
+
+        async def generate(store_name, query, model):
+            calls.append(query)
+            return FileSearchResult(answer=f"answer {len(calls)}", citations=[])
+
+        fs._generate = generate
+        first = await fs.query("smith-v-jones", "What damages are claimed?")
+        again = await fs.query("fileSearchStores/case-123", "What damages are claimed? ")
+        assert again.answer == first.answer
+        assert len(calls) == 1
+
+        (tmp_path / "answer.pdf").write_bytes(b"answer")
+        await fs.upload("smith-v-jones", str(tmp_path / "answer.pdf"))
+        await fs.query("smith-v-jones", "What damages are claimed?")
+        assert len(calls) == 2
+
+        monkeypatch.setattr(config.gemini, "query_cache_ttl", 0)
+        fs._query_memo.clear()
+        await fs.query("smith-v-jones", "What damages are claimed?")
+        await fs.query("smith-v-jones", "What damages are claimed?")
+        assert len(calls) == 4
+        assert fs.stats()["query_hits"] == 1
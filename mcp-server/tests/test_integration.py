@@ -64,6 +64,28 @@ class TestCourtListenerTools:
         assert citation_tool is not None
         assert "citation" in str(citation_tool.inputSchema)
 
+    @pytest.mark.asyncio
+    async def test_resolve_citations_bulk_schema(self):
+        """resolve_citations_bulk tool has correct schema."""
+        bulk_tool = await get_tool_by_name("resolve_citations_bulk")
+
+        assert bulk_tool is not None
+        assert "document" in str(bulk_tool.inputSchema)
+
+    def test_unwritable_cache_path_runs_uncached(self, tmp_path, monkeypatch):
+        """A cache that cannot be created is skipped instead of failing every tool."""
+        import server
+
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
+        monkeypatch.setattr(server, "_court_client", None)
+        monkeypatch.setattr(server.config.court_listener, "cache_enabled", True)
+        monkeypatch.setattr(server.config.court_listener, "cache_path", str(blocker / "cache.sqlite3"))
+
+        client = server.get_court_client()
+
+        assert client.cache is None
+
 
 class TestGPTResearcherTools:
     """Test GPT Researcher tool integrations."""
@@ -85,6 +107,40 @@ class TestGPTResearcherTools:
         assert "bucket" in str(s3_tool.inputSchema)
         assert "report" in str(s3_tool.inputSchema)
 
+    @pytest.mark.asyncio
+    async def test_research_job_tools_schema(self):
+        """Background research job tools have correct schemas."""
+        start_tool = await get_tool_by_name("start_research")
+        status_tool = await get_tool_by_name("get_research_status")
+
+        assert start_tool is not None
+        assert "query" in str(start_tool.inputSchema)
+        assert status_tool is not None
+        assert "job_id" in str(status_tool.inputSchema)
+
+
+    @pytest.mark.asyncio
+    async def test_last_session_closes_research_jobs(self, monkeypatch):
+        """Running background jobs are cancelled when the last session ends."""
+        import asyncio
+
+        import server
+        from clients import JobStatus, ResearchJobManager
+
+        async def run_forever(query, sink, **params):
+            await asyncio.sleep(3600)
+
+        monkeypatch.setattr(server, "_court_client", None)
+        monkeypatch.setattr(server, "_research_jobs", ResearchJobManager(run_forever))
+
+        async with server.server_lifespan(server.mcp):
+            job, _ = await server.get_research_jobs().start("adverse possession")
+            await asyncio.sleep(0.01)
+            assert job.status == JobStatus.RUNNING
+
+        assert job.status == JobStatus.CANCELLED
+        assert server._research_jobs is None
+
 
 class TestGeminiTools:
     """Test Gemini tool integrations."""
@@ -116,22 +172,24 @@ class TestGeminiTools:
 
 
 class TestToolCount:
-    """Verify all 12 tools are registered."""
+    """Verify all 18 tools are registered."""
 
     @pytest.mark.asyncio
     async def test_total_tool_count(self):
-        """Server has all 12 expected tools (11 domain + 1 health_check)."""
+        """Server has all 18 expected tools (17 domain + 1 health_check)."""
         tools = await get_tools()
         tool_names = [t.name for t in tools]
 
         # Expected tools
         expected_tools = [
-            # GPT Researcher (4)
+            # GPT Researcher (8)
             "deep_research", "quick_search", "write_report", "save_report_to_s3",
-            # Court Listener (3)
-            "search_cases", "get_opinion", "lookup_citation",
-            # Gemini (4)
-            "web_search", "create_file_store", "upload_to_file_store", "file_search_query",
+            "start_research", "get_research_status", "get_research_result", "cancel_research",
+            # Court Listener (4)
+            "search_cases", "get_opinion", "lookup_citation", "resolve_citations_bulk",
+            # Gemini (5)
+            "web_search", "create_file_store", "upload_to_file_store", "upload_batch_to_file_store",
+            "file_search_query",
             # Health (1)
             "health_check",
         ]
@@ -139,5 +197,5 @@ class TestToolCount:
         for tool in expected_tools:
             assert tool in tool_names, f"Missing tool: {tool}"
 
-        assert len(tools) == 12, f"Expected 12 tools, got {len(tools)}: {tool_names}"
+        assert len(tools) == 18, f"Expected 18 tools, got {len(tools)}: {tool_names}"
 
@@ -0,0 +1,112 @@
+"""
+Unit tests for the background research job manager.
+
+Uses a fake research coroutine; no API calls are made.
+Run with: pytest tests/test_research_jobs.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from clients import JobStatus, ResearchJobManager
+
+
+async def fake_research(query, sink, delay: float = 0.01, fail: bool = False):
+    """Emit progress like GPTResearcher's stream_output, then finish."""
+    await sink.send_json({"type": "logs", "content": "starting_research", "output": f"Researching {query}"})
+    await sink.send_json({"type": "report", "content": "", "output": "ignored"})
+    await asyncio.sleep(delay)
+    if fail:
+        raise ValueError("retriever failed")
+    await sink.send_json({"type": "logs", "content": "research_step_finalized", "output": "Done"})
+    return {"research_data": f"context for {query}", "sources": []}
+
+
+async def wait_finished(manager, job_id):
+    while manager.get(job_id).status in (JobStatus.QUEUED, JobStatus.RUNNING):
+        await asyncio.sleep(0.005)
+    return manager.get(job_id)
+
+
+class TestResearchJobs:
+    """Queueing, progress, dedupe and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_job_completes_with_progress(self):
+        """A job runs in the background and records log events."""
+        manager = ResearchJobManager(fake_research)
+        job, created = await manager.start("Adverse possession in Texas")
+
+        assert created
+        job = await wait_finished(manager, job.id)
+        status = job.status_dict()
+        assert job.status == JobStatus.COMPLETED
+        assert job.result["research_data"] == "context for Adverse possession in Texas"
+        assert [e["step"] for e in status["events"]] == ["starting_research", "research_step_finalized"]
+        assert job.status_dict(since=1)["events"][0]["seq"] == 2
+        await manager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_dedupes_normalized_query(self):
+        """Equivalent queries share one job."""
+        manager = ResearchJobManager(fake_research)
+        first, _ = await manager.start("Adverse  Possession", max_sources=5)
+        second, created = await manager.start("adverse possession ", max_sources=5)
+        third, _ = await manager.start("adverse possession", max_sources=10)
+
+        assert not created
+        assert second.id == first.id
+        assert third.id != first.id
+        await manager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_and_not_reused(self):
+        """Failed jobs surface the error and a retry starts a new job."""
+        manager = ResearchJobManager(fake_research)
+        job, _ = await manager.start("q", fail=True)
+        job = await wait_finished(manager, job.id)
+
+        assert job.status == JobStatus.FAILED
+        assert job.error == "retriever failed"
+        retry, created = await manager.start("q", fail=True)
+        assert created and retry.id != job.id
+        await manager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_and_queued(self):
+        """Running and queued jobs can both be cancelled."""
+        manager = ResearchJobManager(fake_research, max_workers=1)
+        running, _ = await manager.start("slow", delay=10)
+        queued, _ = await manager.start("next", delay=10)
+        while running.status != JobStatus.RUNNING:
+            await asyncio.sleep(0.005)
+
+        manager.cancel(queued.id)
+        manager.cancel(running.id)
+        running = await wait_finished(manager, running.id)
+
+        assert running.status == JobStatus.CANCELLED
+        assert queued.status == JobStatus.CANCELLED
+        await manager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_queue_bound_and_ttl(self):
+        """A full queue rejects new jobs and expired results are dropped."""
+        manager = ResearchJobManager(fake_research, max_workers=1, max_queue=1, result_ttl=0)
+        await manager.start("a", delay=10)
+        await asyncio.sleep(0.01)
+        await manager.start("b", delay=10)
+
+        with pytest.raises(RuntimeError):
+            await manager.start("c")
+        await manager.aclose()
+
+        done = ResearchJobManager(fake_research, result_ttl=0)
+        job, _ = await done.start("d")
+        while job.status != JobStatus.COMPLETED:
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.01)
+        with pytest.raises(KeyError):
+            done.get(job.id)
+        await done.aclose()
@@ -0,0 +1,97 @@
+"""
+Unit tests for the server-scoped GPT Researcher factory.
+
+No API calls are made; dummy keys satisfy client construction.
+Run with: pytest tests/test_researcher_factory.py -v
+"""
+
+import pytest
+
+from clients import ResearcherFactory
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("EMBEDDING", "openai:text-embedding-3-small")
+    return ResearcherFactory(warm_llm_providers=False)
+
+
+class TestResearcherFactory:
+    """Shared state across researchers."""
+
+    def test_shares_memory_and_config(self, factory):
+        """Researchers reuse the factory's embeddings client and config values."""
+        first = factory.create(query="first")
+        second = factory.create(query="second", report_type="quick_report")
+
+        assert first.memory is second.memory is factory.memory
+        assert first.cfg.embedding_model == factory.config.embedding_model
+        assert factory.stats() == {"warm": True, "researchers_created": 2}
+
+    def test_config_copies_are_isolated(self, factory):
+        """Per-request config changes do not leak into the shared config."""
+        researcher = factory.create(query="q", verbose=False)
+        researcher.cfg.retrievers = "mcp"
+
+        assert factory.config.retrievers != "mcp"
+        assert researcher.cfg.llm_kwargs is not factory.config.llm_kwargs
+
+
+class FakeRetriever:
+    """Retriever stand-in that records calls."""
+
+    calls = []
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=5):
+        FakeRetriever.calls.append((self.query, max_results))
+        return [
+            {"title": f"Result {i}", "href": f"https://example.com/{i}", "body": "x" * 1000, "raw": "..."}
+            for i in range(max_results + 2)
+        ]
+
+
+class TestQuickSearch:
+    """Retriever-only fast path."""
+
+    @pytest.mark.asyncio
+    async def test_search_uses_retriever_directly(self, factory, monkeypatch):
+        """Results come straight from the retriever, capped and trimmed."""
+        monkeypatch.setattr("clients.researcher_factory.get_retrievers", lambda headers, cfg: [FakeRetriever])
+        FakeRetriever.calls = []
+
+        results = await factory.search("adverse possession", max_results=3)
+
+        assert FakeRetriever.calls == [("adverse possession", 3)]
+        assert len(results) == 3
+        assert set(results[0]) == {"title", "href", "body"}
+        assert len(results[0]["body"]) == 500
+        assert factory.stats()["researchers_created"] == 0
+
+    @pytest.mark.asyncio
+    async def test_search_full_results(self, factory, monkeypatch):
+        """snippets_only=False returns retriever results unchanged."""
+        monkeypatch.setattr("clients.researcher_factory.get_retrievers", lambda headers, cfg: [FakeRetriever])
+
+        results = await factory.search("easement", max_results=2, snippets_only=False)
+
+        assert results[0]["raw"] == "..."
+
+
+class TestMaxSources:
+    """max_sources bounds URLs visited by a researcher."""
+
+    @pytest.mark.asyncio
+    async def test_new_urls_capped(self, factory):
+        """Only max_sources URLs are accepted across calls."""
+        researcher = factory.create(query="q", max_sources=3, verbose=False)
+        conductor = researcher.research_conductor
+
+        first = await conductor._get_new_urls(["https://a", "https://b"])
+        second = await conductor._get_new_urls(["https://b", "https://c", "https://d"])
+
+        assert first == ["https://a", "https://b"]
+        assert second == ["https://c"]
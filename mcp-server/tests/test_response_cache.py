@@ -0,0 +1,103 @@
+"""
+Unit tests for the on-disk response cache.
+
+Run with: pytest tests/test_response_cache.py -v
+"""
+
+import hashlib
+import time
+
+import pytest
+
+from clients import ResponseCache
+
+
+class TestResponseCache:
+    """Keying, TTLs, eviction and counters."""
+
+    def test_round_trip_and_counters(self, tmp_path):
+        """Stored values come back intact and hits/misses are counted."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        key = ResponseCache.make_key("opinion", 42)
+
+        assert cache.get(key) is None
+        cache.set(key, {"id": 42, "plain_text": "Opinion text"})
+        assert cache.get(key) == {"id": 42, "plain_text": "Opinion text"}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["by_namespace"]["opinion"] == {"hits": 1, "misses": 1}
+
+    def test_keys_are_content_addressed(self):
+        """Equivalent lookups share a key regardless of dict ordering."""
+        a = ResponseCache.make_key("search", {"q": "miranda", "type": "o"})
+        b = ResponseCache.make_key("search", {"type": "o", "q": "miranda"})
+
+        assert a == b
+        assert a != ResponseCache.make_key("search", {"q": "gideon", "type": "o"})
+
+    def test_ttl_expiry(self, tmp_path):
+        """Expired entries are treated as misses."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        key = ResponseCache.make_key("citation", "384 u.s. 436")
+        cache.set(key, [1], ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self, tmp_path):
+        """Least recently used entries are evicted beyond max_bytes."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3", max_bytes=900)
+        keys = [ResponseCache.make_key("opinion", i) for i in range(3)]
+        # ~380 bytes compressed, so only two entries fit
+        payload = {"text": "".join(hashlib.sha256(str(i).encode()).hexdigest() for i in range(10))}
+
+        cache.set(keys[0], payload)
+        cache.set(keys[1], payload)
+        cache.get(keys[0])
+        cache.set(keys[2], payload)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == payload
+        assert cache.stats()["size_bytes"] <= 900
+
+    def test_persists_across_instances(self, tmp_path):
+        """Entries survive reopening the database."""
+        path = tmp_path / "cache.sqlite3"
+        key = ResponseCache.make_key("opinion", 7)
+        first = ResponseCache(path)
+        first.set(key, {"id": 7})
+        first.close()
+
+        assert ResponseCache(path).get(key) == {"id": 7}
+
+    def test_hits_do_not_write(self, tmp_path):
+        """Access times are buffered and written with the next store."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        key = ResponseCache.make_key("opinion", 1)
+        cache.set(key, {"id": 1})
+        stored = cache._conn.execute("SELECT accessed FROM entries WHERE key = ?", (key,)).fetchone()[0]
+        changes = cache._conn.total_changes
+        time.sleep(0.01)
+
+        for _ in range(10):
+            cache.get(key)
+
+        assert cache._conn.total_changes == changes
+        cache.set(ResponseCache.make_key("opinion", 2), {"id": 2})
+        accessed = cache._conn.execute("SELECT accessed FROM entries WHERE key = ?", (key,)).fetchone()[0]
+        assert accessed > stored
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_off_loop(self, tmp_path):
+        """The awaitable methods round-trip like their blocking counterparts."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        keys = [ResponseCache.make_key("citation", i) for i in range(3)]
+
+        await cache.aset_many([(key, [i]) for i, key in enumerate(keys[:2])], ttl=60)
+        await cache.aset(keys[2], [2])
+
+        assert await cache.aget_many(keys) == [[0], [1], [2]]
+        assert await cache.aget(ResponseCache.make_key("citation", 9)) is None
@@ -0,0 +1,116 @@
+"""
+Unit tests for S3 bundle uploads.
+
+Uses moto's in-memory S3, so no AWS account or network access is required.
+Run with: pytest tests/test_s3_client.py -v
+"""
+
+import gzip
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from clients import S3Client, UploadArtifact
+
+BUCKET = "test-reports"
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """An S3Client backed by moto with an existing bucket."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        client = S3Client(bucket=BUCKET, region="us-east-1")
+        yield client
+        client._executor.shutdown()
+
+
+class TestUploadBundle:
+    """Concurrent multi-artifact uploads."""
+
+    @pytest.mark.asyncio
+    async def test_text_is_gzipped_and_binary_is_not(self, s3):
+        """Markdown is gzip-encoded; PDF bytes are stored as-is."""
+        pdf = b"%PDF-1.7 fake"
+        result = await s3.upload_bundle(
+            [
+                UploadArtifact(filename="report.md", content="# Findings\n" * 50),
+                UploadArtifact(filename="report.pdf", content=pdf),
+            ],
+            prefix="bundles/case-1",
+            metadata={"query": "miranda"},
+        )
+
+        assert result.prefix == "bundles/case-1/"
+        assert [a.key for a in result.artifacts] == ["bundles/case-1/report.md", "bundles/case-1/report.pdf"]
+
+        md = s3._client.get_object(Bucket=BUCKET, Key="bundles/case-1/report.md")
+        assert md["ContentEncoding"] == "gzip"
+        assert md["ContentType"] == "text/markdown; charset=utf-8"
+        assert md["Metadata"] == {"query": "miranda"}
+        assert gzip.decompress(md["Body"].read()).decode() == "# Findings\n" * 50
+
+        stored_pdf = s3._client.get_object(Bucket=BUCKET, Key="bundles/case-1/report.pdf")
+        assert "ContentEncoding" not in stored_pdf
+        assert stored_pdf["ContentType"] == "application/pdf"
+        assert stored_pdf["Body"].read() == pdf
+
+    @pytest.mark.asyncio
+    async def test_large_file_uses_multipart(self, s3, tmp_path):
+        """Files above the threshold are uploaded in parts from disk."""
+        s3._transfer_config.multipart_threshold = 5 * 1024 * 1024
+        s3._transfer_config.multipart_chunksize = 5 * 1024 * 1024
+        path = tmp_path / "report.docx"
+        path.write_bytes(b"x" * (11 * 1024 * 1024))
+
+        result = await s3.upload_bundle([UploadArtifact(filename="report.docx", path=str(path))], prefix="big")
+
+        head = s3._client.head_object(Bucket=BUCKET, Key=result.artifacts[0].key)
+        assert head["ContentLength"] == 11 * 1024 * 1024
+        # Multipart ETags carry a "-<part count>" suffix
+        assert head["ETag"].strip('"').endswith("-3")
+
+    @pytest.mark.asyncio
+    async def test_path_artifacts_stream_from_disk(self, s3, tmp_path, monkeypatch):
+        """Path artifacts are handed to upload_file; text is gzipped from disk."""
+        uploaded_files = []
+        upload_file = s3._client.upload_file
+
+        def recording_upload_file(path, *args, **kwargs):
+            uploaded_files.append(path)
+            return upload_file(path, *args, **kwargs)
+
+        monkeypatch.setattr(s3._client, "upload_file", recording_upload_file)
+        docx, md = tmp_path / "report.docx", tmp_path / "report.md"
+        docx.write_bytes(b"PK docx bytes")
+        md.write_text("# Findings\n" * 50)
+
+        result = await s3.upload_bundle(
+            [UploadArtifact(filename="report.docx", path=str(docx)), UploadArtifact(filename="report.md", path=str(md))],
+            prefix="files",
+        )
+
+        assert uploaded_files == [str(docx)]
+        assert result.artifacts[0].size == len(b"PK docx bytes")
+        stored_md = s3._client.get_object(Bucket=BUCKET, Key="files/report.md")
+        assert stored_md["ContentEncoding"] == "gzip"
+        assert gzip.decompress(stored_md["Body"].read()).decode() == "# Findings\n" * 50
+        assert result.artifacts[1].size == stored_md["ContentLength"]
+
+    def test_part_threads_are_bounded_by_pool_size(self, s3):
+        """Pool workers times per-transfer part threads stays within the part budget."""
+        workers = s3._executor._max_workers
+
+        assert s3._transfer_config.max_concurrency * workers <= max(16, workers)
+        assert s3._client.meta.config.max_pool_connections == s3._transfer_config.max_concurrency * workers
+
+    @pytest.mark.asyncio
+    async def test_auto_prefix(self, s3):
+        """Bundles get a timestamped prefix when none is given."""
+        result = await s3.upload_bundle([UploadArtifact(filename="report.json", content="{}")], gzip_text=False)
+
+        assert result.prefix.startswith("reports/")
+        assert result.artifacts[0].content_encoding is None
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTML main-content extraction engines.
+
+Measures throughput (pages/s, MB/s) and extraction quality (token
+precision, recall and F1 against the gold main text) for every engine in
+gpt_researcher.scraper.extraction.HTML_ENGINES on a fixed corpus.
+
+The corpus is a directory of saved pages (`page.html` with the expected
+main text in `page.txt`); by default tests/docs/html-extraction, a small
+fixed set of court opinion, statute, news, law-firm blog, agency FAQ,
+docket and bare pages. `--generated N` instead uses N deterministic
+synthetic layouts, useful for throughput on a larger corpus.
+
+Usage:
+    python tests/benchmark-html-extraction.py [--corpus DIR | --generated N] [--repeat N]
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gpt_researcher.scraper.extraction import HTML_ENGINES
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "docs" / "html-extraction"
+
+WORDS = (
+    "court plaintiff defendant motion appeal statute contract breach damages "
+    "jurisdiction evidence testimony ruling judgment counsel hearing summary "
+    "negligence liability remedy injunction precedent clause tenant landlord "
+    "agency regulation compliance filing deadline discovery settlement"
+).split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text.capitalize() + ", " + " ".join(rng.choice(WORDS) for _ in range(4)) + "."
+
+
+def paragraph(rng: random.Random) -> str:
+    return " ".join(sentence(rng, rng.randint(8, 18)) for _ in range(rng.randint(3, 6)))
+
+
+def boilerplate(rng: random.Random) -> tuple[str, str]:
+    """Return (before, after) chrome surrounding the main content."""
+    menu = "".join(f'<li><a href="/s/{i}">{rng.choice(WORDS).title()} {i}</a></li>' for i in range(rng.randint(20, 60)))
+    related = "".join(
+        f'<li><a href="/a/{i}">{sentence(rng, 6)}</a></li>' for i in range(rng.randint(5, 12))
+    )
+    comments = "".join(
+        f'<div class="comment"><p>{sentence(rng, 10)}</p></div>' for _ in range(rng.randint(3, 10))
+    )
+    before = (
+        '<div id="cookie-banner">We use cookies to improve your experience. <a href="/privacy">Privacy</a></div>'
+        f'<header class="site-header"><a href="/">Home</a><nav><ul>{menu}</ul></nav></header>'
+        f'<div class="breadcrumbs"><a href="/">Home</a> / <a href="/law">Law</a></div>'
+    )
+    after = (
+        f'<aside class="sidebar"><h3>Related</h3><ul>{related}</ul></aside>'
+        f'<section id="comments"><h3>Comments</h3>{comments}</section>'
+        f'<div class="share-links"><a href="#">Share</a> <a href="#">Tweet</a></div>'
+        f'<footer><p>Copyright. All rights reserved.</p><ul>{menu}</ul></footer>'
+    )
+    return before, after
+
+
+def generated_page(seed: int) -> tuple[bytes, str]:
+    """A deterministic page and its gold main text."""
+    rng = random.Random(seed)
+    heading = sentence(rng, 6)
+    paragraphs = [paragraph(rng) for _ in range(rng.randint(4, 25))]
+    layout = seed % 3
+    body = "".join(f"<p>{p}</p>" for p in paragraphs)
+    if layout == 0:  # news article
+        main = f'<article><h1>{heading}</h1><div class="entry-content">{body}</div></article>'
+    elif layout == 1:  # opinion inside nested layout divs
+        main = f'<div id="wrapper"><div class="row"><div class="col opinion"><h2>{heading}</h2>{body}</div></div></div>'
+    else:  # statute page with a numbered list
+        items = "".join(f"<li>{p}</li>" for p in paragraphs)
+        main = f'<main><h1>{heading}</h1><ol class="subsections">{items}</ol></main>'
+    before, after = boilerplate(rng)
+    html = (
+        f"<html><head><title>{heading}</title><style>body{{margin:0}}</style>"
+        f"<script>var tracking = {seed};</script></head>"
+        f'<body>{before}{main}{after}<script>init();</script></body></html>'
+    )
+    return html.encode(), "\n".join([heading] + paragraphs)
+
+
+def load_corpus(directory: Path) -> list[tuple[str, bytes, str]]:
+    """(name, html, gold text) for every .html page in `directory`."""
+    corpus = []
+    for path in sorted(directory.glob("*.html")):
+        gold = path.with_suffix(".txt")
+        corpus.append((path.stem, path.read_bytes(), gold.read_text() if gold.exists() else ""))
+    return corpus
+
+
+def tokens(text: str) -> Counter:
+    return Counter(re.findall(r"\w+", text.lower()))
+
+
+def quality(extracted: str, gold: str) -> tuple[float, float, float]:
+    got, want = tokens(extracted), tokens(gold)
+    overlap = sum((got & want).values())
+    precision = overlap / max(sum(got.values()), 1)
+    recall = overlap / max(sum(want.values()), 1)
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="directory of .html pages with .txt gold text")
+    source.add_argument("--generated", type=int, metavar="N", help="use N generated pages instead of a corpus")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.generated:
+        corpus = [(f"generated-{seed}", *generated_page(seed)) for seed in range(args.generated)]
+        label = f"{args.generated} generated pages"
+    else:
+        corpus = load_corpus(args.corpus)
+        label = str(args.corpus)
+    total_mb = sum(len(html) for _, html, _ in corpus) / 1e6
+    with_gold = [(name, html, gold) for name, html, gold in corpus if gold]
+    print(f"Corpus: {label}: {len(corpus)} pages, {total_mb:.2f} MB, {len(with_gold)} with gold text")
+    print(f"{'engine':8}{'pages/s':>10}{'MB/s':>8}{'precision':>11}{'recall':>8}{'F1':>7}")
+
+    per_page = {}
+    for name, extract in HTML_ENGINES.items():
+        extract(corpus[0][1], None, "https://example.com/")  # warm up
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for _page, html, _gold in corpus:
+                extract(html, None, "https://example.com/")
+        elapsed = (time.perf_counter() - start) / args.repeat
+
+        scores = [quality(extract(html, None, "https://example.com/")[0], gold) for _, html, gold in with_gold]
+        per_page[name] = [f1 for _, _, f1 in scores]
+        precision, recall, f1 = (sum(s[i] for s in scores) / max(len(scores), 1) for i in range(3))
+        print(
+            f"{name:8}{len(corpus) / elapsed:10.1f}{total_mb / elapsed:8.2f}"
+            f"{precision:11.3f}{recall:8.3f}{f1:7.3f}"
+        )
+
+    if not args.generated:
+        print(f"\nF1 per page\n{'page':14}" + "".join(f"{name:>8}" for name in per_page))
+        for i, (page, _, _) in enumerate(with_gold):
+            print(f"{page:14}" + "".join(f"{scores[i]:8.3f}" for scores in per_page.values()))
+
+if __name__ == "__main__":
+    main()
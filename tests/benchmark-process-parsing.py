@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark process-pool HTML parsing against the thread pool.
+
+Parses a batch of generated pages concurrently, as the scraper does, on a
+thread pool (GIL-bound) and on a spawn process pool with 1..N workers, and
+prints pages/s and the speedup over threads for every extraction engine.
+A second table compares inline and process-pool latency of a single page
+by size, which is what SCRAPER_PROCESS_PARSE_MIN_BYTES should be set from.
+
+Usage:
+    python tests/benchmark-process-parsing.py [--pages N] [--page-kb KB] [--workers 1,2,4,8]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gpt_researcher.scraper.extraction import HTML_ENGINES
+
+WORDS = "court motion statute contract damages ruling evidence counsel appeal tenant".split()
+
+
+def make_page(size_kb: int, seed: int) -> bytes:
+    """A page of roughly `size_kb` KB: navigation, article paragraphs and a footer."""
+    rng = random.Random(seed)
+    nav = "".join(f'<li><a href="/s/{i}">{rng.choice(WORDS)}</a></li>' for i in range(40))
+    paragraphs = []
+    size = 0
+    while size < size_kb * 1024:
+        text = " ".join(rng.choice(WORDS) for _ in range(80))
+        paragraphs.append(f'<p class="body">{text}, <a href="/r/{size}">{rng.choice(WORDS)}</a>.</p>')
+        size += len(paragraphs[-1])
+    return (
+        f"<html><head><title>Page {seed}</title></head><body><nav><ul>{nav}</ul></nav>"
+        f"<article><h1>Opinion {seed}</h1>{''.join(paragraphs)}</article>"
+        f"<footer>Copyright</footer></body></html>"
+    ).encode()
+
+
+async def parse_all(executor, extract, pages: list[bytes]) -> float:
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        loop.run_in_executor(executor, extract, page, "utf-8", "https://example.com/") for page in pages
+    ))
+    return time.perf_counter() - start
+
+
+def spawn_pool(workers: int) -> ProcessPoolExecutor:
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    # Start the workers and import the engines before timing
+    list(pool.map(HTML_ENGINES["lxml"], [b"<p>warm</p>"] * workers, [None] * workers, ["https://x/"] * workers))
+    return pool
+
+
+def throughput(pages: list[bytes], worker_counts: list[int]) -> None:
+    print(f"{len(pages)} pages x {len(pages[0]) // 1024} KB, {os.cpu_count()} CPUs")
+    print(f"{'engine':8}{'executor':>16}{'pages/s':>10}{'speedup':>9}")
+    for name, extract in HTML_ENGINES.items():
+        with ThreadPoolExecutor(max(worker_counts)) as threads:
+            baseline = len(pages) / asyncio.run(parse_all(threads, extract, pages))
+        print(f"{name:8}{f'threads x{max(worker_counts)}':>16}{baseline:10.1f}{1.0:8.2f}x")
+        for workers in worker_counts:
+            with spawn_pool(workers) as pool:
+                rate = len(pages) / asyncio.run(parse_all(pool, extract, pages))
+            print(f"{name:8}{f'processes x{workers}':>16}{rate:10.1f}{rate / baseline:8.2f}x")
+
+
+def crossover(sizes_kb: list[int], repeat: int = 20) -> None:
+    print()
+    print("Single-page latency (ms), lxml engine")
+    print(f"{'size KB':>8}{'inline':>10}{'process':>10}")
+    extract = HTML_ENGINES["lxml"]
+    with spawn_pool(1) as pool:
+        for size_kb in sizes_kb:
+            page = make_page(size_kb, size_kb)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                extract(page, "utf-8", "https://example.com/")
+            inline = (time.perf_counter() - start) * 1000 / repeat
+            start = time.perf_counter()
+            for _ in range(repeat):
+                pool.submit(extract, page, "utf-8", "https://example.com/").result()
+            remote = (time.perf_counter() - start) * 1000 / repeat
+            print(f"{size_kb:8}{inline:10.2f}{remote:10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=32)
+    parser.add_argument("--page-kb", type=int, default=400)
+    parser.add_argument("--workers", default=None, help="comma-separated process counts")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    worker_counts = (
+        [int(n) for n in args.workers.split(",")] if args.workers
+        else sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    )
+    pages = [make_page(args.page_kb, seed) for seed in range(args.pages)]
+    throughput(pages, worker_counts)
+    crossover([16, 64, 256, 1024])
+
+
+if __name__ == "__main__":
+    main()
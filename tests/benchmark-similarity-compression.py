@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark context compression: LangChain pipeline vs the NumPy engine.
+
+Times the previous ContextualCompressionRetriever + DocumentCompressorPipeline
+(splitter + EmbeddingsFilter) against gpt_researcher.context.similarity's
+SimilarityFilter on the same documents. Embeddings come from a precomputed
+table, so the timings measure compression overhead rather than the
+embedding provider, and both paths must select the same chunks.
+
+Usage:
+    python tests/benchmark-similarity-compression.py [--chunks 100 1000 10000] [--dim 1536] [--repeat N]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain.retrievers import ContextualCompressionRetriever
+from langchain.retrievers.document_compressors import DocumentCompressorPipeline, EmbeddingsFilter
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.context.retriever import SearchAPIRetriever
+from gpt_researcher.context.similarity import SimilarityFilter
+
+THRESHOLD = 0.35
+QUERY = "enforceability of arbitration clauses"
+
+
+class TableEmbeddings(Embeddings):
+    """Looks vectors up in a precomputed table keyed by text."""
+
+    def __init__(self, table: dict[str, list[float]]):
+        self.table = table
+
+    def embed_documents(self, texts):
+        return [self.table[text] for text in texts]
+
+    def embed_query(self, text):
+        return self.table[text]
+
+
+def build_corpus(chunks: int, dim: int, seed: int = 7) -> tuple[list[dict], TableEmbeddings]:
+    """One chunk-sized page per chunk, with vectors correlated to the query for a fraction of them."""
+    rng = np.random.default_rng(seed)
+    query_vector = rng.standard_normal(dim)
+    pages, table = [], {QUERY: query_vector.tolist()}
+    for i in range(chunks):
+        text = f"Paragraph {i}: " + ("the court considered the clause and the statute. " * 17).strip()
+        relevance = rng.uniform(0, 1.2)
+        table[text] = (relevance * query_vector + rng.standard_normal(dim)).tolist()
+        pages.append({"url": f"https://courts.example/{i}", "title": f"Case {i}", "raw_content": text})
+    return pages, TableEmbeddings(table)
+
+
+def langchain_pipeline(pages, embeddings):
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+    relevance_filter = EmbeddingsFilter(embeddings=embeddings, similarity_threshold=THRESHOLD)
+    pipeline = DocumentCompressorPipeline(transformers=[splitter, relevance_filter])
+    retriever = ContextualCompressionRetriever(
+        base_compressor=pipeline, base_retriever=SearchAPIRetriever(pages=pages)
+    )
+    return retriever.invoke(QUERY)
+
+
+def numpy_engine(pages, embeddings, k):
+    documents = SearchAPIRetriever(pages=pages).invoke(QUERY)
+    return asyncio.run(SimilarityFilter(embeddings, THRESHOLD).afilter(documents, QUERY, k=k))
+
+
+def timed(fn, repeat: int) -> tuple[float, list]:
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--dim", type=int, default=1536, help="embedding dimensions")
+    parser.add_argument("--k", type=int, default=10, help="chunks returned per query")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'chunks':>8} {'stage':>9} {'langchain ms':>14} {'numpy ms':>10} {'speedup':>8}  same top-k")
+    for chunks in args.chunks:
+        pages, embeddings = build_corpus(chunks, args.dim)
+        documents = SearchAPIRetriever(pages=pages).invoke(QUERY)
+        split = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100).split_documents(documents)
+        # The old EmbeddingsFilter kept its default k=20, best first; the prompt used the first k of those
+        relevance_filter = EmbeddingsFilter(embeddings=embeddings, similarity_threshold=THRESHOLD)
+        similarity_filter = SimilarityFilter(embeddings, THRESHOLD)
+        stages = {
+            "pipeline": (
+                lambda: langchain_pipeline(pages, embeddings),
+                lambda: numpy_engine(pages, embeddings, args.k),
+            ),
+            "filter": (
+                lambda: relevance_filter.compress_documents(split, QUERY),
+                lambda: asyncio.run(similarity_filter.arank(split, QUERY, args.k)),
+            ),
+        }
+        for stage, (old, new) in stages.items():
+            old_time, old_docs = timed(old, args.repeat)
+            new_time, new_docs = timed(new, args.repeat)
+            same = [doc.page_content for doc in old_docs[:args.k]] == [doc.page_content for doc in new_docs]
+            print(
+                f"{chunks:>8} {stage:>9} {old_time * 1000:>14.1f} {new_time * 1000:>10.1f} "
+                f"{old_time / new_time:>7.1f}x  {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
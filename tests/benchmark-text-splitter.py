@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark the offset-based text splitter against LangChain's.
+
+Splits a corpus of scraped-page-like text with
+gpt_researcher.utils.text_splitter.TextSplitter and with
+RecursiveCharacterTextSplitter using the same settings, reports MB/s for
+each and checks that both produce identical chunks.
+
+The corpus mixes paragraphs, single-line lists, long unbroken tokens
+(URLs, base64 blobs) and whitespace runs, as extracted web pages do.
+
+Usage:
+    python tests/benchmark-text-splitter.py [--mb 20] [--chunk-size 1000] [--chunk-overlap 100] [--repeat N]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from gpt_researcher.utils.text_splitter import TextSplitter
+
+WORDS = (
+    "court plaintiff defendant motion appeal statute contract breach damages "
+    "jurisdiction evidence testimony ruling judgment counsel hearing summary "
+    "negligence liability remedy injunction precedent clause tenant landlord"
+).split()
+
+
+def page(rng: random.Random) -> str:
+    blocks = []
+    for _ in range(rng.randint(5, 40)):
+        kind = rng.random()
+        if kind < 0.6:
+            blocks.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 400))) + ".")
+        elif kind < 0.85:
+            blocks.append("\n".join(" ".join(rng.choices(WORDS, k=rng.randint(2, 8))) for _ in range(rng.randint(3, 30))))
+        elif kind < 0.95:
+            blocks.append("https://courts.example/" + "".join(rng.choices("abcdef0123456789", k=rng.randint(50, 3000))))
+        else:
+            blocks.append(" \n \t " * rng.randint(1, 20))
+    return "\n\n".join(blocks)
+
+
+def build_corpus(megabytes: float, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    pages, size = [], 0
+    while size < megabytes * 1_000_000:
+        pages.append(page(rng))
+        size += len(pages[-1])
+    return pages
+
+
+def timed(split, pages: list[str], repeat: int) -> tuple[float, list]:
+    times, chunks = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = [split(text) for text in pages]
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), chunks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=float, default=20, help="corpus size in MB")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = build_corpus(args.mb)
+    size = sum(len(text) for text in pages) / 1_000_000
+    splitters = {
+        "langchain": RecursiveCharacterTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap),
+        "offsets": TextSplitter(args.chunk_size, args.chunk_overlap),
+    }
+    print(f"{len(pages)} pages, {size:.1f} MB, chunk_size={args.chunk_size}, chunk_overlap={args.chunk_overlap}")
+    results = {}
+    for name, splitter in splitters.items():
+        seconds, chunks = timed(splitter.split_text, pages, args.repeat)
+        results[name] = (seconds, chunks)
+        print(f"{name:>10}: {seconds:7.2f}s  {size / seconds:6.1f} MB/s  {sum(map(len, chunks))} chunks")
+    print(f"speedup: {results['langchain'][0] / results['offsets'][0]:.1f}x")
+    print(f"identical chunks: {results['langchain'][1] == results['offsets'][1]}")
+
+
+if __name__ == "__main__":
+    main()
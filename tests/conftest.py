@@ -0,0 +1,39 @@
+"""Shared fixtures for the gpt_researcher tests."""
+
+import asyncio
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+TOPICS = ["contract", "tenant", "patent", "custody"]
+
+
+class TopicEmbeddings(Embeddings):
+    """Embeds text as counts of each topic word; records every call."""
+
+    def __init__(self):
+        self.documents = []
+        self.batches = []
+        self.queries = []
+
+    def _vector(self, text):
+        return [float(text.lower().count(topic)) for topic in TOPICS]
+
+    def embed_documents(self, texts):
+        self.documents.extend(texts)
+        self.batches.append(len(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return self._vector(text)
+
+    async def aembed_documents(self, texts):
+        await asyncio.sleep(0.01)
+        return self.embed_documents(texts)
+
+
+@pytest.fixture
+def topic_embeddings():
+    """A deterministic embeddings client with no API key or network access."""
+    return TopicEmbeddings()
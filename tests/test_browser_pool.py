@@ -0,0 +1,191 @@
+"""
+Tests for the warm Selenium browser pool.
+
+Uses fake WebDriver objects, so neither Selenium nor a browser is required.
+Run with: pytest tests/test_browser_pool.py -v
+"""
+
+import threading
+import time
+
+import pytest
+
+from gpt_researcher.scraper.browser.pool import BrowserPool, BrowserPoolFull
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    def __init__(self):
+        self.current_window_handle = "main"
+        self.window_handles = ["main"]
+        self.switch_to = FakeSwitchTo(self)
+        self.visited = []
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise ConnectionError("session deleted")
+        return 1
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def drivers():
+    return []
+
+
+@pytest.fixture
+def factory(drivers):
+    def start():
+        driver = FakeDriver()
+        drivers.append(driver)
+        return driver
+    return start
+
+
+class TestBrowserPool:
+    def test_reuses_warm_browser_and_recycles_tabs(self, factory, drivers):
+        pool = BrowserPool(factory, size=2)
+
+        for url in ("https://a.example/", "https://b.example/"):
+            with pool.page() as driver:
+                driver.get(url)
+                driver.window_handles.append("popup")
+
+        assert len(drivers) == 1
+        assert drivers[0].visited == ["https://a.example/", "about:blank", "https://b.example/", "about:blank"]
+        assert drivers[0].window_handles == ["main"]
+        assert pool.stats()["idle"] == 1
+
+    def test_restarts_after_max_pages(self, factory, drivers):
+        pool = BrowserPool(factory, size=1, max_pages_per_browser=2)
+
+        for _ in range(3):
+            with pool.page():
+                pass
+
+        assert len(drivers) == 2
+        assert drivers[0].quit_called
+        assert pool.stats()["recycled"] == 1
+
+    def test_replaces_unhealthy_browser(self, factory, drivers):
+        pool = BrowserPool(factory, size=1)
+        with pool.page():
+            pass
+        drivers[0].alive = False
+
+        with pool.page() as driver:
+            assert driver is drivers[1]
+
+        assert drivers[0].quit_called
+        assert pool.stats()["browsers"] == 1
+
+    def test_concurrency_bounded_by_size(self, factory, drivers):
+        pool = BrowserPool(factory, size=2)
+        active, peak = 0, 0
+        lock = threading.Lock()
+
+        def scrape():
+            nonlocal active, peak
+            with pool.page():
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=scrape) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
+        assert len(drivers) == 2
+
+    def test_counters_are_exact_under_concurrency(self, factory, drivers):
+        pool = BrowserPool(factory, size=4, max_pages_per_browser=1)
+
+        def scrape():
+            for _ in range(50):
+                with pool.page():
+                    pass
+
+        threads = [threading.Thread(target=scrape) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.stats()
+        assert stats["started"] == len(drivers) == 400
+        assert stats["recycled"] == 400
+        assert stats["browsers"] == 0
+
+    def test_rejects_when_queue_is_full(self, factory):
+        pool = BrowserPool(factory, size=1, max_queue=1)
+        held = pool.acquire()
+        waiter = threading.Thread(target=lambda: pool.release(pool.acquire(timeout=5)))
+        waiter.start()
+        while pool.stats()["waiting"] == 0:
+            time.sleep(0.001)
+
+        with pytest.raises(BrowserPoolFull):
+            pool.acquire(timeout=0.1)
+
+        pool.release(held)
+        waiter.join()
+
+    def test_acquire_times_out(self, factory):
+        pool = BrowserPool(factory, size=1)
+        held = pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.05)
+
+        pool.release(held)
+
+    def test_failed_start_frees_the_slot(self, drivers):
+        calls = 0
+
+        def flaky():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("chromedriver missing")
+            return FakeDriver()
+
+        pool = BrowserPool(flaky, size=1)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+        with pool.page():
+            assert pool.stats()["browsers"] == 1
+
+    def test_close_quits_idle_browsers(self, factory, drivers):
+        pool = BrowserPool(factory, size=1)
+        with pool.page():
+            pass
+
+        pool.close()
+
+        assert drivers[0].quit_called
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.acquire()
@@ -0,0 +1,114 @@
+"""
+Tests for the run-scoped chunk index used for context compression.
+
+Uses the `topic_embeddings` fixture from conftest.py, so no API keys are required.
+Run with: pytest tests/test_chunk_index.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from gpt_researcher.context.index import ChunkIndex
+
+
+def page(url, *paragraphs):
+    return {"url": url, "title": url, "raw_content": "\n\n".join(paragraphs)}
+
+
+PAGES = [
+    page(
+        "https://a.example/contracts",
+        "A contract requires offer, acceptance and consideration. " * 12,
+        "Breach of contract remedies include damages. " * 15,
+    ),
+    page("https://b.example/leases", "A tenant may withhold rent for uninhabitable premises. " * 15),
+    page("https://c.example/patents", "A patent claim must be novel and non-obvious. " * 15),
+]
+
+
+class TestChunkIndex:
+    @pytest.mark.asyncio
+    async def test_each_chunk_is_embedded_once(self, topic_embeddings):
+        index = ChunkIndex(topic_embeddings)
+
+        first = await index.add_pages(PAGES)
+        again = await index.add_pages(PAGES[:2])
+
+        assert len(first) == len(index) == len(topic_embeddings.documents)
+        assert again == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sub_queries_share_embeddings(self, topic_embeddings):
+        index = ChunkIndex(topic_embeddings)
+
+        await asyncio.gather(*(index.add_pages(PAGES) for _ in range(4)))
+
+        assert len(topic_embeddings.documents) == len(index)
+
+    @pytest.mark.asyncio
+    async def test_waiters_retry_when_the_embedding_call_fails(self, topic_embeddings):
+        embed = topic_embeddings.aembed_documents
+        calls = []
+
+        async def fails_once(texts):
+            calls.append(len(texts))
+            if len(calls) == 1:
+                await asyncio.sleep(0.01)
+                raise RuntimeError("rate limited")
+            return await embed(texts)
+
+        topic_embeddings.aembed_documents = fails_once
+        index = ChunkIndex(topic_embeddings)
+
+        owner, waiter = await asyncio.gather(index.add_pages(PAGES), index.add_pages(PAGES), return_exceptions=True)
+
+        assert isinstance(owner, RuntimeError)
+        assert len(waiter) == len(index) > 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_retry_when_the_owner_is_cancelled(self, topic_embeddings):
+        embed = topic_embeddings.aembed_documents
+        started = asyncio.Event()
+
+        async def blocks_first_call(texts):
+            if not started.is_set():
+                started.set()
+                await asyncio.sleep(10)
+            return await embed(texts)
+
+        topic_embeddings.aembed_documents = blocks_first_call
+        index = ChunkIndex(topic_embeddings)
+        owner = asyncio.create_task(index.add_pages(PAGES))
+        await started.wait()
+        waiter = asyncio.create_task(index.add_pages(PAGES))
+        await asyncio.sleep(0.05)
+
+        owner.cancel()
+
+        assert len(await waiter) == len(index) > 0
+        assert owner.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_and_filters(self, topic_embeddings):
+        index = ChunkIndex(topic_embeddings)
+        await index.add_pages(PAGES)
+
+        results = await index.search("tenant rights", k=5, threshold=0.5)
+
+        assert results
+        assert {doc.metadata["source"] for doc in results} == {"https://b.example/leases"}
+
+    @pytest.mark.asyncio
+    async def test_search_is_limited_to_sources_and_k(self, topic_embeddings):
+        index = ChunkIndex(topic_embeddings)
+        await index.add_pages(PAGES)
+
+        assert await index.search("patent", sources={"https://a.example/contracts"}) == []
+        results = await index.search("contract", k=2, sources={"https://a.example/contracts"})
+        assert len(results) == 2
+        assert all(doc.metadata["title"] == "https://a.example/contracts" for doc in results)
+
+    @pytest.mark.asyncio
+    async def test_empty_index(self, topic_embeddings):
+        assert await ChunkIndex(topic_embeddings).search("anything") == []
@@ -0,0 +1,124 @@
+"""
+Tests for content-type detection and scraper dispatch.
+
+Uses httpx.MockTransport, so no network access is required.
+Run with: pytest tests/test_content_sniffing.py -v
+"""
+
+import io
+
+import httpx
+import pytest
+from docx import Document
+
+from gpt_researcher.scraper import Scraper, sniff
+from gpt_researcher.scraper.fetcher import AsyncFetcher
+from gpt_researcher.scraper.pymupdf.pymupdf import pymupdf
+from gpt_researcher.utils.workers import WorkerPool
+
+
+def make_pdf() -> bytes:
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), "The motion to dismiss is denied. " * 3)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def make_docx() -> bytes:
+    document = Document()
+    document.add_paragraph("Plaintiff alleges breach of the lease agreement dated March 1. " * 3)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+class TestDetectContentKind:
+    """Classification from headers and magic bytes."""
+
+    def test_magic_bytes_override_declared_type(self):
+        assert sniff.detect_content_kind("application/octet-stream", b"%PDF-1.7\n...") == sniff.PDF
+        assert sniff.detect_content_kind("text/html", b"%PDF-1.4") == sniff.PDF
+
+    def test_declared_types_and_fallbacks(self):
+        assert sniff.detect_content_kind("text/html; charset=utf-8") == sniff.HTML
+        assert sniff.detect_content_kind(None, b"  <!DOCTYPE html><html>") == sniff.HTML
+        assert sniff.detect_content_kind("application/octet-stream", b"PK\x03\x04", "brief.docx") == sniff.DOCX
+        assert sniff.detect_content_kind(None, b"SEC. 1. Short title.\n") == sniff.TEXT
+        assert sniff.detect_content_kind(None, bytes(range(256))) is None
+
+    def test_kind_from_url(self):
+        assert sniff.kind_from_url("https://x.gov/files/order.PDF?dl=1") == sniff.PDF
+        assert sniff.kind_from_url("https://x.gov/download?id=42") is None
+
+
+class TestDispatch:
+    """URLs without telling extensions are routed by their content."""
+
+    @pytest.mark.asyncio
+    async def test_routes_by_sniffed_type_and_remembers(self):
+        # The Word file is mislabelled as HTML; its first bytes decide
+        bodies = {
+            "/download?id=1": (make_pdf(), "application/octet-stream"),
+            "/download?id=2": (make_docx(), "text/html"),
+            "/statute?id=3": (("Sec. 337. Four years. " * 10).encode(), "text/plain"),
+        }
+        requests = []
+
+        def handler(request):
+            requests.append((request.method, "range" in request.headers))
+            body, content_type = bodies[request.url.raw_path.decode()]
+            return httpx.Response(200, content=body, headers={"Content-Type": content_type})
+
+        fetcher = AsyncFetcher("test-agent")
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        urls = [f"https://court.example.gov{path}" for path in bodies]
+        scraper = Scraper(urls, "test-agent", "bs", worker_pool=WorkerPool(2), fetcher=fetcher)
+
+        results = {r["url"]: r["raw_content"] for r in await scraper.run()}
+
+        assert "motion to dismiss is denied" in results[urls[0]]
+        assert "breach of the lease" in results[urls[1]]
+        assert results[urls[2]].startswith("Sec. 337.")
+        assert [sniff.known_kind(url) for url in urls] == [sniff.PDF, sniff.DOCX, sniff.TEXT]
+        # Sniffed from the page GET itself: one full GET per URL, nothing else
+        assert requests == [("GET", False)] * 3
+
+        await Scraper(urls, "test-agent", "bs", worker_pool=WorkerPool(2), fetcher=fetcher).run()
+        assert requests == [("GET", False)] * 6
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_ranged_sniff_checks_first_bytes(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request.method)
+            return httpx.Response(200, content=make_pdf()[:sniff.SNIFF_BYTES], headers={"Content-Type": "text/html"})
+
+        fetcher = AsyncFetcher("test-agent")
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await sniff.sniff_content_kind(fetcher, "https://court.example.gov/doc?id=7") == sniff.PDF
+        assert requests == ["GET"]
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_truncated_prefetch_is_refetched_with_own_budget(self):
+        pdf = make_pdf()
+        fetches = []
+
+        def handler(request):
+            fetches.append(request.url)
+            return httpx.Response(200, content=pdf, headers={"Content-Type": "application/pdf"})
+
+        fetcher = AsyncFetcher("test-agent", max_content_bytes=len(pdf) // 2)
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        url = "https://court.example.gov/download?id=9"
+        scraper = Scraper([url], "test-agent", "bs", worker_pool=WorkerPool(2), fetcher=fetcher, pdf_max_bytes=len(pdf))
+
+        results = await scraper.run()
+
+        assert "motion to dismiss is denied" in results[0]["raw_content"]
+        assert len(fetches) == 2
+        await fetcher.aclose()
@@ -0,0 +1,78 @@
+"""
+Tests for near-duplicate page detection.
+
+Run with: pytest tests/test_dedup.py -v
+"""
+
+import random
+
+from gpt_researcher.scraper.dedup import NearDuplicateIndex
+
+WORDS = (
+    "court motion statute contract damages ruling evidence counsel appeal tenant "
+    "plaintiff defendant judge order lease remedy clause notice hearing record"
+).split()
+
+
+def document(seed: int, words: int = 1500) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def mirror(text: str, every: int = 100) -> str:
+    """A reprint: the same text with light edits and syndication boilerplate."""
+    words = text.split()
+    for i in range(0, len(words), every):
+        words[i] = "reprinted"
+    return "Originally published elsewhere. " + " ".join(words)
+
+
+def page(url: str, text: str, images=()) -> dict:
+    return {"url": url, "raw_content": text, "title": url, "image_urls": [{"url": i, "score": 1} for i in images]}
+
+
+class TestNearDuplicateIndex:
+    def test_merges_mirrors_into_longest_copy(self):
+        opinion = document(1)
+        pages = [
+            page("https://a.example/op", opinion, images=["https://a.example/seal.png"]),
+            page("https://b.example/op", mirror(opinion), images=["https://b.example/seal.png"]),
+            page("https://c.example/other", document(2)),
+        ]
+        index = NearDuplicateIndex()
+
+        kept = index.deduplicate(pages)
+
+        assert [p["url"] for p in kept] == ["https://b.example/op", "https://c.example/other"]
+        assert kept[0]["duplicate_urls"] == ["https://a.example/op"]
+        assert {i["url"] for i in kept[0]["image_urls"]} == {"https://a.example/seal.png", "https://b.example/seal.png"}
+        assert index.stats()["duplicates"] == 1
+        assert index.stats()["tokens_saved"] > 0
+
+    def test_remembers_pages_across_batches(self):
+        opinion = document(3)
+        index = NearDuplicateIndex()
+        first = index.deduplicate([page("https://a.example/op", opinion)])
+
+        assert index.deduplicate([page("https://b.example/op", mirror(opinion, every=200))]) == []
+        assert first[0]["duplicate_urls"] == ["https://b.example/op"]
+
+    def test_keeps_distinct_pages_on_the_same_topic(self):
+        base = document(4)
+        # Same opening, different remaining 60% of the text
+        related = " ".join(base.split()[:600]) + " " + document(5, 900)
+        index = NearDuplicateIndex()
+
+        kept = index.deduplicate([page("https://a.example/1", base), page("https://a.example/2", related)])
+
+        assert len(kept) == 2
+
+    def test_signature_similarity_tracks_overlap(self):
+        index = NearDuplicateIndex()
+        text = document(6)
+
+        same = (index.signature(text) == index.signature(mirror(text))).mean()
+        different = (index.signature(text) == index.signature(document(7))).mean()
+
+        assert same > 0.8
+        assert different < 0.1
@@ -0,0 +1,122 @@
+"""
+Tests for the persistent embedding cache.
+
+Uses a fake embeddings client, so no API keys are required.
+Run with: pytest tests/test_embedding_cache.py -v
+"""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.memory import Memory
+from gpt_researcher.memory.cache import CachedEmbeddings, EmbeddingCache, embedding_namespace
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.documents = []
+        self.queries = []
+
+    def embed_documents(self, texts):
+        self.documents.extend(texts)
+        return [[float(len(text)), 0.5] for text in texts]
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return [float(len(text)), -0.5]
+
+
+class SizedEmbeddings(CountingEmbeddings):
+    def __init__(self, dimensions):
+        super().__init__()
+        self.dimensions = dimensions
+
+    def embed_documents(self, texts):
+        self.documents.extend(texts)
+        return [[float(len(text))] * self.dimensions for text in texts]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite3", flush_size=2)
+    yield cache
+    cache.close()
+
+
+class TestCachedEmbeddings:
+    def test_only_missing_texts_are_embedded(self, cache):
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner, cache, "fake:model")
+
+        first = embeddings.embed_documents(["alpha", "beta", "alpha"])
+        second = embeddings.embed_documents(["beta", "gamma"])
+
+        assert first == [[5.0, 0.5], [4.0, 0.5], [5.0, 0.5]]
+        assert second == [[4.0, 0.5], [5.0, 0.5]]
+        assert inner.documents == ["alpha", "beta", "gamma"]
+
+    def test_vectors_persist_across_instances(self, tmp_path):
+        path = tmp_path / "embeddings.sqlite3"
+        cache = EmbeddingCache(path)
+        CachedEmbeddings(CountingEmbeddings(), cache, "fake:model").embed_documents(["alpha"])
+        cache.close()
+
+        reopened = EmbeddingCache(path)
+        inner = CountingEmbeddings()
+        assert CachedEmbeddings(inner, reopened, "fake:model").embed_documents(["alpha"]) == [[5.0, 0.5]]
+        assert inner.documents == []
+        reopened.close()
+
+    def test_namespaces_separate_models_and_queries(self, cache):
+        inner = CountingEmbeddings()
+        CachedEmbeddings(inner, cache, "fake:model").embed_documents(["alpha"])
+
+        assert CachedEmbeddings(inner, cache, "fake:other").embed_documents(["alpha"]) == [[5.0, 0.5]]
+        assert CachedEmbeddings(inner, cache, "fake:model").embed_query("alpha") == [5.0, -0.5]
+        assert inner.documents == ["alpha", "alpha"]
+        assert inner.queries == ["alpha"]
+
+    def test_output_settings_separate_namespaces(self, cache):
+        small, large = SizedEmbeddings(256), SizedEmbeddings(1024)
+        for inner in (small, large):
+            namespace = embedding_namespace("openai", "text-embedding-3-small", inner)
+            assert len(CachedEmbeddings(inner, cache, namespace).embed_documents(["alpha"])[0]) == inner.dimensions
+
+        assert small.documents == large.documents == ["alpha"]
+        assert embedding_namespace("fake", "model", CountingEmbeddings()) == "fake:model"
+
+    def test_memory_namespace_includes_dimensions(self, cache, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+
+        def namespace(**kwargs):
+            return Memory("openai", "text-embedding-3-small", cache=cache, **kwargs).get_embeddings().namespace
+
+        assert namespace() == "openai:text-embedding-3-small"
+        assert namespace(dimensions=256) != namespace(dimensions=1024)
+        assert namespace(dimensions=256) == namespace(dimensions=256)
+
+    @pytest.mark.asyncio
+    async def test_async_path_uses_cache(self, cache):
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner, cache, "fake:model")
+
+        await embeddings.aembed_documents(["alpha", "beta"])
+        assert await embeddings.aembed_documents(["alpha", "beta"]) == [[5.0, 0.5], [4.0, 0.5]]
+        await embeddings.aembed_query("q")
+        await embeddings.aembed_query("q")
+
+        assert inner.documents == ["alpha", "beta"]
+        assert inner.queries == ["q"]
+
+    def test_large_batches_and_write_behind(self, cache):
+        inner = CountingEmbeddings()
+        embeddings = CachedEmbeddings(inner, cache, "fake:model")
+        texts = [f"chunk {i}" for i in range(1200)]
+
+        embeddings.embed_documents(texts)
+        cache.flush()
+        embeddings.embed_documents(texts)
+
+        assert len(inner.documents) == 1200
+        assert cache.stats() == {"vectors": 1200, "hits": 1200, "misses": 1200}
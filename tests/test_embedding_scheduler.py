@@ -0,0 +1,152 @@
+"""
+Tests for the shared embedding request scheduler.
+
+Uses a fake embeddings client, so no API keys are required.
+Run with: pytest tests/test_embedding_scheduler.py -v
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.memory.scheduler import EmbeddingScheduler, RateBudget, ScheduledEmbeddings, count_tokens
+
+
+class SlowEmbeddings(Embeddings):
+    """Records every request and how many were in flight at once."""
+
+    def __init__(self, delay=0.02, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.batches = []
+        self.active = 0
+        self.peak = 0
+
+    def _vector(self, text):
+        return [float(len(text)), 1.0]
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+    async def aembed_documents(self, texts):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("rate limited")
+            return self.embed_documents(texts)
+        finally:
+            self.active -= 1
+
+
+def text(i, words=50):
+    return f"doc {i} " + "statute " * words
+
+
+class TestBatching:
+    def test_packs_by_token_count(self):
+        scheduler = EmbeddingScheduler(max_batch_tokens=3 * count_tokens(text(0)), max_batch_size=100)
+
+        batches = scheduler.batches([text(i) for i in range(7)])
+
+        assert [len(batch) for batch, _ in batches] == [3, 3, 1]
+        assert [t for batch, _ in batches for t in batch] == [text(i) for i in range(7)]
+        assert all(tokens <= scheduler.max_batch_tokens for _, tokens in batches)
+
+    def test_caps_texts_per_batch_and_sends_oversized_text_alone(self):
+        scheduler = EmbeddingScheduler(max_batch_tokens=count_tokens(text(0)), max_batch_size=2)
+
+        assert [len(b) for b, _ in scheduler.batches(["a", "b", "c", text(0, words=500), "d"])] == [2, 1, 1, 1]
+
+
+class TestScheduledEmbeddings:
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_across_callers(self):
+        client = SlowEmbeddings()
+        scheduler = EmbeddingScheduler(max_batch_tokens=1, max_concurrency=2)
+        embeddings = ScheduledEmbeddings(client, scheduler, "fake:model")
+
+        results = await asyncio.gather(*(embeddings.aembed_documents([f"a{i}", f"b{i}"]) for i in range(4)))
+
+        assert client.peak == 2
+        assert len(client.batches) == 8
+        assert results[3] == [[2.0, 1.0], [2.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_coalesces_identical_texts_in_flight(self):
+        client = SlowEmbeddings()
+        scheduler = EmbeddingScheduler()
+        embeddings = ScheduledEmbeddings(client, scheduler, "fake:model")
+
+        first, second = await asyncio.gather(
+            embeddings.aembed_documents(["tenant", "landlord", "tenant"]),
+            embeddings.aembed_documents(["landlord", "lease"]),
+        )
+
+        assert sorted(t for batch in client.batches for t in batch) == ["landlord", "lease", "tenant"]
+        assert first == [[6.0, 1.0], [8.0, 1.0], [6.0, 1.0]]
+        assert second == [[8.0, 1.0], [5.0, 1.0]]
+        assert scheduler.stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_retries_when_owner_is_cancelled(self):
+        client = SlowEmbeddings(delay=0.05)
+        embeddings = ScheduledEmbeddings(client, EmbeddingScheduler(), "fake:model")
+
+        owner = asyncio.create_task(embeddings.aembed_documents(["tenant"]))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(embeddings.aembed_documents(["tenant"]))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+
+        assert await waiter == [[6.0, 1.0]]
+        assert owner.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        embeddings = ScheduledEmbeddings(SlowEmbeddings(fail=True), EmbeddingScheduler(), "fake:model")
+
+        results = await asyncio.gather(
+            embeddings.aembed_documents(["tenant"]),
+            embeddings.aembed_documents(["tenant"]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert embeddings.scheduler._loop_state().in_flight == {}
+
+    def test_sync_path_batches(self):
+        client = SlowEmbeddings()
+        embeddings = ScheduledEmbeddings(client, EmbeddingScheduler(max_batch_size=2), "fake:model")
+
+        assert embeddings.embed_documents(["a", "bb", "a", "ccc"]) == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [3.0, 1.0]]
+        assert client.batches == [["a", "bb"], ["ccc"]]
+
+
+class TestRateBudget:
+    def test_overdraft_waits_for_refill(self):
+        budget = RateBudget(per_minute=60)
+
+        assert budget.reserve(60) == 0
+        assert budget.reserve(30) == pytest.approx(30, abs=0.1)
+        assert budget.reserve(30) == pytest.approx(60, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_spaces_requests(self):
+        client = SlowEmbeddings(delay=0)
+        scheduler = EmbeddingScheduler(max_batch_size=1, requests_per_minute=600)
+        scheduler.request_budget.tokens = 1  # start with one request of burst left
+        embeddings = ScheduledEmbeddings(client, scheduler, "fake:model")
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await embeddings.aembed_documents(["a", "b", "c"])
+
+        # 600/min is one request per 0.1s once the burst is spent
+        assert loop.time() - start == pytest.approx(0.2, abs=0.08)
@@ -0,0 +1,149 @@
+"""
+Tests for the HTML main-content extraction engines.
+
+Run with: pytest tests/test_html_extraction.py -v
+"""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from gpt_researcher.scraper.beautiful_soup.beautiful_soup import BeautifulSoupScraper
+from gpt_researcher.scraper.extraction import HTML_ENGINES, extract_with_lxml, get_html_engine
+from gpt_researcher.scraper.fetcher import AsyncFetcher
+
+ARTICLE = (
+    "The court held that the arbitration clause was unconscionable, "
+    "because the employer drafted it, presented it on a take-it-or-leave-it basis, "
+    "and limited remedies available under the statute."
+)
+
+PAGE = f"""
+<html>
+<head><title>Opinion of the Court</title><script>var x = 1;</script></head>
+<body>
+  <header><nav><a href="/">Home</a> <a href="/cases">Cases</a></nav></header>
+  <div class="sidebar"><a href="/a">Related case one</a> <a href="/b">Related case two</a></div>
+  <div id="content">
+    <div class="opinion">
+      <p>{ARTICLE}</p>
+      <p>{ARTICLE} The judgment is reversed, and the matter is remanded.</p>
+      <img src="/img/seal.png" class="main">
+      <img src="/img/pixel.gif" width="1" height="1">
+    </div>
+  </div>
+  <div class="links"><a href="/1">Privacy policy and terms of use</a> <a href="/2">Contact the clerk of the court</a></div>
+  <footer>Copyright Court Publishers</footer>
+</body>
+</html>
+""".encode()
+
+
+class TestLxmlEngine:
+    def test_keeps_main_content_and_drops_boilerplate(self):
+        text, images, title = extract_with_lxml(PAGE, None, "https://courts.example/op/1")
+
+        assert title == "Opinion of the Court"
+        assert "arbitration clause was unconscionable" in text
+        assert "remanded" in text
+        for noise in ("Home", "Related case", "Privacy policy", "Copyright", "var x"):
+            assert noise not in text
+
+    def test_scores_images_inside_content(self):
+        _, images, _ = extract_with_lxml(PAGE, None, "https://courts.example/op/1")
+
+        assert images == [{"url": "https://courts.example/img/seal.png", "score": 4}]
+
+    def test_short_page_falls_back_to_all_text(self):
+        text, _, _ = extract_with_lxml(b"<html><body><p>Hearing set.</p></body></html>", None, "https://x.example/")
+
+        assert text == "Hearing set."
+
+    def test_empty_document(self):
+        assert extract_with_lxml(b"", None, "https://x.example/") == ("", [], "")
+
+    def test_respects_declared_encoding(self):
+        page = "<html><body><p>Société Générale v. Müller</p></body></html>".encode("latin-1")
+
+        text, _, _ = extract_with_lxml(page, "latin-1", "https://x.example/")
+
+        assert text == "Société Générale v. Müller"
+
+    def test_layout_classes_on_body_are_not_boilerplate(self):
+        page = PAGE.replace(b"<body>", b'<body class="home page has-sidebar">')
+
+        text, _, _ = extract_with_lxml(page, None, "https://courts.example/op/1")
+
+        assert "arbitration clause was unconscionable" in text
+        assert "Related case" not in text
+
+    @pytest.mark.parametrize("encoding", [None, "utf-8"])
+    def test_xhtml_with_xml_declaration(self, encoding):
+        page = b'<?xml version="1.0" encoding="utf-8"?>\n' + PAGE.replace(
+            b"<html>", b'<html xmlns="http://www.w3.org/1999/xhtml">'
+        )
+
+        text, _, title = extract_with_lxml(page, encoding, "https://courts.example/op/1")
+
+        assert title == "Opinion of the Court"
+        assert "remanded" in text
+
+
+class TestEngineSelection:
+    @pytest.mark.parametrize("engine", sorted(HTML_ENGINES))
+    def test_scraper_parse_uses_engine(self, engine):
+        scraper = BeautifulSoupScraper("https://courts.example/op/1", html_engine=engine)
+
+        text, _, title = scraper.parse(PAGE)
+
+        assert title == "Opinion of the Court"
+        assert "arbitration clause was unconscionable" in text
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError, match="Unknown HTML extraction engine"):
+            get_html_engine("regex")
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Stands in for the process pool and records what was submitted."""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.calls = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.calls.append(fn)
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestProcessPoolParsing:
+    @pytest.mark.parametrize("engine", sorted(HTML_ENGINES))
+    def test_results_are_plain_picklable_data(self, engine):
+        result = get_html_engine(engine)(PAGE, None, "https://courts.example/op/1")
+
+        assert type(result[2]) is str
+        assert pickle.loads(pickle.dumps(result)) == result
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("min_bytes, expected_calls", [(None, 0), (len(PAGE) + 1, 0), (len(PAGE), 1)])
+    async def test_size_threshold_routes_to_process_pool(self, min_bytes, expected_calls):
+        fetcher = AsyncFetcher("test-agent")
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=PAGE)))
+        executor = RecordingExecutor()
+        scraper = BeautifulSoupScraper(
+            "https://courts.example/op/1",
+            fetcher=fetcher,
+            html_engine="lxml",
+            process_executor=executor,
+            process_min_bytes=min_bytes,
+        )
+
+        text, _, title = await scraper.scrape_async()
+
+        assert title == "Opinion of the Court"
+        assert "remanded" in text
+        assert executor.calls == [extract_with_lxml] * expected_calls
+        executor.shutdown()
+        await fetcher.aclose()
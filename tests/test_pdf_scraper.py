@@ -0,0 +1,101 @@
+"""
+Tests for in-memory PDF scraping.
+
+Builds PDFs with PyMuPDF and serves them through httpx.MockTransport.
+Run with: pytest tests/test_pdf_scraper.py -v
+"""
+
+import httpx
+import pytest
+
+from gpt_researcher.scraper import PyMuPDFScraper
+from gpt_researcher.scraper.fetcher import AsyncFetcher
+from gpt_researcher.scraper.pymupdf.pymupdf import page_ranges, pymupdf
+from gpt_researcher.utils.workers import WorkerPool
+
+
+def make_pdf(pages: int) -> bytes:
+    doc = pymupdf.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Opinion page {i + 1}")
+    doc.set_metadata({"title": "Smith v. Jones"})
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture(scope="module")
+def worker_pool():
+    return WorkerPool(2, parse_workers=2)
+
+
+def make_scraper(pdf: bytes, worker_pool, page_cap: int = 10 * 1024 * 1024, **kwargs) -> PyMuPDFScraper:
+    fetcher = AsyncFetcher("test-agent", max_content_bytes=page_cap)
+    fetcher._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=pdf))
+    )
+    return PyMuPDFScraper(
+        "https://court.example.gov/download?id=42",
+        fetcher=fetcher,
+        parse_executor=worker_pool.parse_executor,
+        process_executor=worker_pool.process_executor,
+        **kwargs,
+    )
+
+
+class TestPyMuPDFScraper:
+    """All pages are extracted from memory, up to the page budget."""
+
+    def test_page_ranges(self):
+        assert page_ranges(0) == []
+        assert page_ranges(5) == [(0, 5)]
+        assert page_ranges(100) == [(0, 25), (25, 50), (50, 75), (75, 100)]
+
+    @pytest.mark.asyncio
+    async def test_extracts_every_page(self, worker_pool):
+        scraper = make_scraper(make_pdf(40), worker_pool)
+
+        content, images, title = await scraper.scrape_async()
+
+        assert title == "Smith v. Jones"
+        assert images == []
+        assert content.index("Opinion page 1\n") < content.index("Opinion page 40")
+        assert content.count("Opinion page") == 40
+        await scraper.fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_page_budget(self, worker_pool):
+        scraper = make_scraper(make_pdf(40), worker_pool, max_pages=3)
+
+        content, _, _ = await scraper.scrape_async()
+
+        assert content.count("Opinion page") == 3
+        await scraper.fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_pdf_byte_budget_replaces_page_cap(self, worker_pool):
+        pdf = make_pdf(40)
+        scraper = make_scraper(pdf, worker_pool, page_cap=len(pdf) // 4, max_bytes=len(pdf))
+
+        content, _, _ = await scraper.scrape_async()
+
+        assert not scraper.response.truncated
+        assert content.count("Opinion page") == 40
+        await scraper.fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_truncated_pdf_fails(self, worker_pool):
+        scraper = make_scraper(make_pdf(40), worker_pool, page_cap=100)
+
+        with pytest.raises(ValueError, match="cut short"):
+            await scraper.scrape_async()
+        await scraper.fetcher.aclose()
+
+    def test_local_file(self, tmp_path):
+        path = tmp_path / "opinion.pdf"
+        path.write_bytes(make_pdf(3))
+
+        content, _, title = PyMuPDFScraper(str(path)).scrape()
+
+        assert content.count("Opinion page") == 3
+        assert title == "Smith v. Jones"
@@ -0,0 +1,134 @@
+"""
+Tests for the persistent scrape cache.
+
+Uses httpx.MockTransport and a temporary SQLite file; no network access.
+Run with: pytest tests/test_scrape_cache.py -v
+"""
+
+import hashlib
+import time
+
+import httpx
+import pytest
+
+from gpt_researcher.scraper import Scraper
+from gpt_researcher.scraper.cache import ScrapeCache, normalize_url
+from gpt_researcher.scraper.fetcher import AsyncFetcher
+from gpt_researcher.utils.workers import WorkerPool
+
+PAGE = (
+    "<html><head><title>Statute of Limitations</title></head><body>"
+    "<p>" + "An action upon a written contract must be commenced within four years. " * 5 + "</p>"
+    "</body></html>"
+)
+
+
+def mock_fetcher(handler) -> AsyncFetcher:
+    fetcher = AsyncFetcher("test-agent")
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fetcher
+
+
+class TestScrapeCache:
+    """Cross-run page cache with conditional revalidation."""
+
+    def test_normalize_url(self):
+        assert normalize_url("HTTPS://Law.Example.com:443/code?b=2&utm_source=x&a=1#sec") == (
+            "https://law.example.com/code?a=1&b=2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_then_304_revalidation(self, tmp_path):
+        requests_seen = []
+
+        def handler(request):
+            if request.method == "HEAD":
+                return httpx.Response(200, headers={"Content-Type": "text/html"})
+            requests_seen.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, html=PAGE, headers={"ETag": '"v1"'})
+
+        cache = ScrapeCache(tmp_path / "scrape.sqlite3", ttl=3600)
+        urls = ["https://law.example.com/code/1"]
+
+        async def run():
+            fetcher = mock_fetcher(handler)
+            results = await Scraper(
+                urls, "test-agent", "bs", worker_pool=WorkerPool(2), fetcher=fetcher, cache=cache
+            ).run()
+            await fetcher.aclose()
+            return results
+
+        cold = await run()
+        warm = await run()
+        assert len(requests_seen) == 1
+        assert warm == cold
+
+        cache.ttl = 0
+        revalidated = await run()
+        assert len(requests_seen) == 2
+        assert requests_seen[1].headers["if-none-match"] == '"v1"'
+        assert revalidated == cold
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["revalidated"] == 1
+        assert cache.stats()["misses"] == 1
+        cache.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [404, 429, 503])
+    async def test_error_pages_are_not_cached(self, tmp_path, status):
+        def handler(request):
+            if request.method == "HEAD":
+                return httpx.Response(200, headers={"Content-Type": "text/html"})
+            return httpx.Response(status, html=PAGE.replace("Statute of Limitations", "Too Many Requests"))
+
+        cache = ScrapeCache(tmp_path / "scrape.sqlite3", ttl=3600)
+        fetcher = mock_fetcher(handler)
+        await Scraper(
+            ["https://law.example.com/code/1"], "test-agent", "bs",
+            worker_pool=WorkerPool(2), fetcher=fetcher, cache=cache,
+        ).run()
+        await fetcher.aclose()
+
+        assert cache.get("https://law.example.com/code/1") is None
+        cache.close()
+
+    def test_lru_eviction(self, tmp_path):
+        def page(i):
+            return "".join(hashlib.sha256(f"{i}-{n}".encode()).hexdigest() for n in range(10))
+
+        cache = ScrapeCache(tmp_path / "scrape.sqlite3", max_bytes=900)
+        cache.set("https://example.com/0", page(0), "t", [])
+        cache.set("https://example.com/1", page(1), "t", [])
+        time.sleep(0.01)
+        cache.get("https://example.com/0")
+        cache.set("https://example.com/2", page(2), "t", [])
+
+        assert cache.get("https://example.com/0") is not None
+        assert cache.get("https://example.com/1") is None
+        assert cache.stats()["size_bytes"] <= 900
+        cache.close()
+
+    def test_reads_do_not_write(self, tmp_path):
+        cache = ScrapeCache(tmp_path / "scrape.sqlite3")
+        cache.set("https://example.com/0", "Page text", "t", [])
+        changes = cache._conn.total_changes
+
+        for _ in range(10):
+            assert cache.get("https://example.com/0").raw_content == "Page text"
+
+        assert cache._conn.total_changes == changes
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_async_access(self, tmp_path):
+        cache = ScrapeCache(tmp_path / "scrape.sqlite3")
+        await cache.aset("https://example.com/a", "Page text", "Title", [], etag='"v1"')
+        await cache.aset_content_kind("https://example.com/a", "html")
+
+        page = await cache.aget("https://example.com/a")
+
+        assert (page.title, page.etag) == ("Title", '"v1"')
+        assert await cache.aget_content_kind("https://example.com/a") == "html"
+        cache.close()
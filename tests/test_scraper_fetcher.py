@@ -0,0 +1,191 @@
+"""
+Tests for the async scraper fetch engine.
+
+Uses httpx.MockTransport, so no network access is required.
+Run with: pytest tests/test_scraper_fetcher.py -v
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from gpt_researcher.scraper import Scraper
+from gpt_researcher.scraper.fetcher import TRUNCATION_MARKERS, AsyncFetcher
+from gpt_researcher.utils.workers import WorkerPool
+
+PAGE = (
+    "<html><head><title>Statute of Limitations</title></head><body><nav>menu</nav>"
+    "<p>" + "An action upon a written contract must be commenced within four years. " * 5 + "</p>"
+    "</body></html>"
+)
+
+
+def mock_fetcher(handler, **kwargs) -> AsyncFetcher:
+    fetcher = AsyncFetcher("test-agent", **kwargs)
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fetcher
+
+
+class TestAsyncFetcher:
+    """Streaming fetches with connection limits."""
+
+    @pytest.mark.asyncio
+    async def test_body_is_capped(self):
+        fetcher = mock_fetcher(lambda request: httpx.Response(200, content=b"x" * 5000), max_content_bytes=1000)
+
+        result = await fetcher.fetch("https://example.com/big")
+
+        assert result.truncated
+        assert result.truncated_reason == "size"
+        assert len(result.content) == 1000
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_first_byte_timeout(self):
+        async def handler(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, content=b"late")
+
+        fetcher = mock_fetcher(handler, first_byte_timeout=0.05)
+
+        with pytest.raises(httpx.ReadTimeout):
+            await fetcher.fetch("https://example.com/slow")
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_slow_drip_body_is_cut_at_deadline(self):
+        async def drip():
+            for _ in range(100):
+                yield b"x" * 10
+                await asyncio.sleep(0.02)
+
+        fetcher = mock_fetcher(lambda request: httpx.Response(200, content=drip()), deadline=0.1)
+
+        result = await fetcher.fetch("https://example.com/drip")
+
+        assert result.truncated_reason == "deadline"
+        assert 0 < len(result.content) < 1000
+        # Latency covers the wait for headers, not the slow body
+        assert result.latency < 0.05
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self):
+        active = {"example.com": 0, "other.com": 0}
+        peak = dict(active)
+
+        async def handler(request):
+            host = request.url.host
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, content=b"ok")
+
+        fetcher = mock_fetcher(handler, max_connections_per_host=2)
+        await asyncio.gather(
+            *(fetcher.fetch(f"https://example.com/{i}") for i in range(6)),
+            *(fetcher.fetch(f"https://other.com/{i}") for i in range(6)),
+        )
+
+        assert peak == {"example.com": 2, "other.com": 2}
+        await fetcher.aclose()
+
+
+class TestScraperAsyncPath:
+    """BeautifulSoup scraping through the shared fetcher."""
+
+    @pytest.mark.asyncio
+    async def test_scrapes_beyond_worker_count(self):
+        """Concurrency is not capped by MAX_SCRAPER_WORKERS for async fetches."""
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return httpx.Response(200, html=PAGE)
+
+        fetcher = mock_fetcher(handler, max_connections_per_host=50)
+        urls = [f"https://court{i % 10}.example.com/opinion/{i}" for i in range(20)]
+        scraper = Scraper(urls, "test-agent", "bs", worker_pool=WorkerPool(2), fetcher=fetcher)
+
+        results = await scraper.run()
+
+        assert len(results) == 20
+        assert results[0]["title"] == "Statute of Limitations"
+        assert "menu" not in results[0]["raw_content"]
+        assert peak > 2
+        await fetcher.aclose()
+
+
+
+class TestScrapeLimits:
+    """Truncation markers and the scrape-phase deadline."""
+
+    @pytest.mark.asyncio
+    async def test_truncated_page_is_marked(self):
+        fetcher = mock_fetcher(lambda request: httpx.Response(200, html=PAGE), max_content_bytes=len(PAGE) - 20)
+        scraper = Scraper(["https://court.example.com/op"], "test-agent", "bs", worker_pool=WorkerPool(2), fetcher=fetcher)
+
+        [result] = await scraper.run()
+
+        assert result["raw_content"].endswith(TRUNCATION_MARKERS["size"])
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_global_deadline_returns_completed_pages(self):
+        async def handler(request):
+            if "slow" in request.url.path:
+                await asyncio.sleep(5)
+            return httpx.Response(200, html=PAGE)
+
+        fetcher = mock_fetcher(handler)
+        urls = ["https://a.example.com/fast", "https://b.example.com/slow", "https://c.example.com/fast"]
+        scraper = Scraper(urls, "test-agent", "bs", worker_pool=WorkerPool(2), fetcher=fetcher, deadline=0.5)
+
+        started = asyncio.get_running_loop().time()
+        results = await scraper.run()
+
+        assert asyncio.get_running_loop().time() - started < 2
+        assert [r["url"] for r in results] == ["https://a.example.com/fast", "https://c.example.com/fast"]
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("self_limited", [True, False])
+    async def test_url_deadline_for_thread_scrapers(self, monkeypatch, self_limited):
+        received = []
+
+        class SlowScraper:
+            def __init__(self, url, session=None):
+                self.url = url
+
+            def scrape(self):
+                time.sleep(0.3)
+                return "Opinion text. " * 20, [], "Opinion"
+
+        class SelfLimitedScraper(SlowScraper):
+            """Like the browser scraper: bounds its own waits by `deadline`."""
+
+            def __init__(self, url, session=None, deadline=None):
+                super().__init__(url, session)
+                received.append(deadline)
+
+        scraper_class = SelfLimitedScraper if self_limited else SlowScraper
+        scraper = Scraper(["https://court.example.com/op"], "test-agent", "bs", worker_pool=WorkerPool(2), url_deadline=0.1)
+        monkeypatch.setattr(scraper, "detect_content_kind", lambda link: asyncio.sleep(0))
+        monkeypatch.setattr(scraper, "get_scraper", lambda link, kind: scraper_class)
+
+        results = await scraper.run()
+
+        if self_limited:
+            # Trusted to stop on its own, so its pooled resource is released cleanly
+            assert received == [0.1]
+            assert [r["title"] for r in results] == ["Opinion"]
+        else:
+            assert results == []
@@ -0,0 +1,78 @@
+"""
+Tests for the NumPy similarity engine behind the context compressors.
+
+Uses the `topic_embeddings` fixture from conftest.py, so no API keys are required.
+Run with: pytest tests/test_similarity.py -v
+"""
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+from gpt_researcher.context.compression import ContextCompressor, WrittenContentCompressor
+from gpt_researcher.context.similarity import SimilarityFilter, normalize, top_k
+
+
+def pages():
+    return [
+        {"url": "https://a.example/contracts", "title": "Contracts", "raw_content": "A contract needs consideration. " * 60},
+        {"url": "https://b.example/leases", "title": "Leases", "raw_content": "A tenant may withhold rent. " * 20},
+        {"url": "https://c.example/patents", "title": "Patents", "raw_content": "A patent claim must be novel. " * 20},
+    ]
+
+
+class TestTopK:
+    def test_best_first_above_threshold(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.3, 0.7], dtype=np.float32)
+
+        assert top_k(scores, k=3, threshold=0.2).tolist() == [1, 4, 2]
+        assert top_k(scores, threshold=0.6).tolist() == [1, 4]
+        assert top_k(scores).tolist() == [1, 4, 2, 3, 0]
+
+    def test_k_larger_than_candidates(self):
+        assert top_k(np.array([0.4, 0.8]), k=10, threshold=0.0).tolist() == [1, 0]
+
+    def test_normalize_keeps_zero_rows(self):
+        vectors = normalize([[3.0, 4.0], [0.0, 0.0]])
+
+        assert vectors.dtype == np.float32
+        assert np.allclose(vectors, [[0.6, 0.8], [0.0, 0.0]])
+
+
+class TestSimilarityFilter:
+    @pytest.mark.asyncio
+    async def test_embeds_all_chunks_in_one_batch(self, topic_embeddings):
+        embeddings = topic_embeddings
+        documents = [Document(page_content=page["raw_content"], metadata={"source": page["url"]}) for page in pages()]
+
+        results = await SimilarityFilter(embeddings, 0.35).afilter(documents, "tenant rights", k=5)
+
+        assert len(embeddings.batches) == 1 and embeddings.batches[0] > len(documents)
+        assert [doc.metadata["source"] for doc in results] == ["https://b.example/leases"]
+
+    @pytest.mark.asyncio
+    async def test_no_documents(self, topic_embeddings):
+        assert await SimilarityFilter(topic_embeddings, 0.35).afilter([], "tenant") == []
+
+
+class TestCompressors:
+    @pytest.mark.asyncio
+    async def test_context_compressor_formats_top_chunks(self, topic_embeddings):
+        compressor = ContextCompressor(documents=pages(), embeddings=topic_embeddings)
+
+        context = await compressor.async_get_context("contract formation", max_results=2)
+
+        assert context.count("Source: https://a.example/contracts") == 2
+        assert "tenant" not in context
+
+    @pytest.mark.asyncio
+    async def test_written_content_compressor(self, topic_embeddings):
+        sections = [
+            {"section_title": "Leases", "written_content": "Tenant duties and tenant remedies."},
+            {"section_title": "Patents", "written_content": "Patent eligibility."},
+        ]
+        compressor = WrittenContentCompressor(sections, topic_embeddings, similarity_threshold=0.5)
+
+        context = await compressor.async_get_context("tenant", max_results=5)
+
+        assert context == ["Title: Leases\nContent: Tenant duties and tenant remedies.\n"]
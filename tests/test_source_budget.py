@@ -0,0 +1,36 @@
+"""
+Tests for the researcher's max_sources budget.
+
+Uses a stub researcher, so no API keys or network access are required.
+Run with: pytest tests/test_source_budget.py -v
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.skills.researcher import ResearchConductor
+
+
+def conductor(max_sources=None, visited=()):
+    researcher = SimpleNamespace(max_sources=max_sources, visited_urls=set(visited), verbose=False, websocket=None)
+    return ResearchConductor(researcher)
+
+
+class TestGetNewUrls:
+    """Ranked URLs are deduplicated in order before the budget applies."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_top_ranked_urls(self):
+        ranked = [f"https://example.com/{i}" for i in range(10)]
+
+        assert await conductor(max_sources=3)._get_new_urls(ranked) == ranked[:3]
+
+    @pytest.mark.asyncio
+    async def test_duplicates_and_visited_urls_do_not_use_budget(self):
+        research = conductor(max_sources=4, visited={"https://a.example/"})
+        urls = ["https://a.example/", "https://b.example/", "https://b.example/", "https://c.example/"]
+
+        assert await research._get_new_urls(urls) == ["https://b.example/", "https://c.example/"]
+        assert await research._get_new_urls(["https://d.example/", "https://e.example/"]) == ["https://d.example/"]
+        assert await research._get_new_urls(["https://f.example/"]) == []
@@ -0,0 +1,75 @@
+"""
+Equivalence tests for the offset-based text splitter.
+
+Every case is checked against LangChain's RecursiveCharacterTextSplitter
+with the same settings.
+Run with: pytest tests/test_text_splitter.py -v
+"""
+
+import random
+
+import pytest
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+
+from gpt_researcher.utils.text_splitter import TextSplitter
+
+PIECES = ["a", "bb", "court", "\n", "\n\n", " ", "  ", "\t", " ", "x" * 50, "y" * 300, " \n ", "\n\n\n", "é"]
+
+
+def word_count(text):
+    return len(text.split())
+
+
+def random_text(rng, pieces=400):
+    return "".join(rng.choice(PIECES) for _ in range(rng.randint(0, pieces)))
+
+
+def assert_equivalent(text, chunk_size, chunk_overlap, length_function=None):
+    kwargs = {} if length_function is None else {"length_function": length_function}
+    expected = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap, **kwargs).split_text(text)
+    splitter = TextSplitter(chunk_size, chunk_overlap, length_function=length_function)
+
+    assert splitter.split_text(text) == expected
+    assert [text[start:end] for start, end in splitter.split_spans(text)] == expected
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize("chunk_size, chunk_overlap", [(1000, 100), (1000, 200), (100, 0), (50, 50), (10, 3), (1, 0)])
+    def test_random_texts(self, chunk_size, chunk_overlap):
+        rng = random.Random(chunk_size * 1000 + chunk_overlap)
+        for _ in range(100):
+            assert_equivalent(random_text(rng), chunk_size, chunk_overlap)
+
+    @pytest.mark.parametrize("chunk_size, chunk_overlap", [(20, 5), (100, 10), (5, 0)])
+    def test_custom_length_function(self, chunk_size, chunk_overlap):
+        rng = random.Random(chunk_size)
+        for _ in range(100):
+            assert_equivalent(random_text(rng), chunk_size, chunk_overlap, word_count)
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "   \n\n  ",
+        "short",
+        "z" * 2500,
+        ("Paragraph one.\n" + "word " * 400 + "\n\n") * 5,
+        "\n\n".join("line\n" * 300 for _ in range(3)),
+    ])
+    def test_edge_cases(self, text):
+        assert_equivalent(text, 1000, 100)
+
+    def test_documents_keep_metadata(self):
+        documents = [Document(page_content="word " * 500, metadata={"source": "https://a.example/"})]
+
+        chunks = TextSplitter(1000, 100).split_documents(documents)
+        expected = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100).split_documents(documents)
+
+        assert chunks == expected
+        chunks[0].metadata["source"] = "changed"
+        assert documents[0].metadata["source"] == "https://a.example/"
+
+
+class TestValidation:
+    def test_overlap_larger_than_chunk(self):
+        with pytest.raises(ValueError, match="larger than chunk size"):
+            TextSplitter(chunk_size=10, chunk_overlap=20)
@@ -0,0 +1,94 @@
+"""
+Tests for per-host scheduling in WorkerPool.
+
+Run with: pytest tests/test_worker_pool.py -v
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from gpt_researcher.utils.workers import WorkerPool, parse_retry_after
+
+
+async def request(pool, url, tracker, status=200, headers=None, duration=0.01):
+    async with pool.throttle(url, uses_thread=False) as slot:
+        host = url.split("/")[2]
+        tracker["active"][host] = tracker["active"].get(host, 0) + 1
+        tracker["peak"][host] = max(tracker["peak"].get(host, 0), tracker["active"][host])
+        await asyncio.sleep(duration)
+        tracker["active"][host] -= 1
+        slot.record(status, headers or {})
+
+
+def new_tracker():
+    return {"active": {}, "peak": {}}
+
+
+class TestHostScheduling:
+    """Token buckets and AIMD concurrency per host."""
+
+    @pytest.mark.asyncio
+    async def test_busy_host_does_not_block_others(self):
+        pool = WorkerPool(4, host_rate=1000, host_burst=1000, host_max_concurrency=6)
+        tracker = new_tracker()
+
+        slow = asyncio.gather(
+            *(request(pool, f"https://slow.example.com/{i}", tracker, duration=0.05) for i in range(12))
+        )
+        await asyncio.sleep(0)
+        start = time.monotonic()
+        await asyncio.gather(*(request(pool, f"https://fast.example.com/{i}", tracker) for i in range(4)))
+        assert time.monotonic() - start < 0.05
+        await slow
+
+        # AIMD starts at two concurrent requests per host and grows on success
+        assert 2 < tracker["peak"]["slow.example.com"] <= 6
+        assert pool.hosts["slow.example.com"].limit > 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_response_backs_off(self):
+        pool = WorkerPool(4, host_rate=1000, host_burst=1000)
+        tracker = new_tracker()
+        await asyncio.gather(*(request(pool, f"https://a.example.com/{i}", tracker) for i in range(8)))
+        grown = pool.hosts["a.example.com"].limit
+
+        await request(pool, "https://a.example.com/x", tracker, status=429, headers={"retry-after": "0.2"})
+        assert pool.hosts["a.example.com"].limit == pytest.approx(grown / 2)
+
+        start = time.monotonic()
+        await request(pool, "https://a.example.com/y", tracker)
+        assert time.monotonic() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_rate(self):
+        pool = WorkerPool(4, host_rate=50, host_burst=1)
+        tracker = new_tracker()
+
+        start = time.monotonic()
+        await asyncio.gather(*(request(pool, f"https://b.example.com/{i}", tracker, duration=0) for i in range(6)))
+
+        assert time.monotonic() - start >= 5 / 50 * 0.9
+
+    @pytest.mark.asyncio
+    async def test_limit_follows_request_latency_not_hold_time(self):
+        pool = WorkerPool(4, host_rate=1000, host_burst=1000)
+
+        async def fetch(latency, hold=0.0):
+            async with pool.throttle("https://c.example.com/", uses_thread=False) as slot:
+                await asyncio.sleep(hold)  # e.g. parsing the page
+                slot.record(200, {}, latency)
+            return pool.hosts["c.example.com"].limit
+
+        for _ in range(4):
+            grown = await fetch(0.01)
+        assert await fetch(0.01, hold=0.1) > grown
+
+        limit = pool.hosts["c.example.com"].limit
+        assert await fetch(0.2) == pytest.approx(limit / 2)
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None